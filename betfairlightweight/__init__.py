@@ -1,7 +1,9 @@
 import logging
 
-from .apiclient import APIClient
+from .apiclient import APIClient, AsyncAPIClient
 from .exceptions import BetfairError
+from .governor import RateGovernor
+from .responsecache import ResponseCache
 from .streaming import StreamListener
 from . import filters
 from .__version__ import __title__, __version__, __author__
@@ -4,6 +4,9 @@ import requests
 
 from .baseclient import BaseClient
 from . import endpoints
+from .compat import httpx
+from .governor import RateGovernor
+from .responsecache import ResponseCache
 
 
 class APIClient(BaseClient):
@@ -17,6 +20,11 @@ class APIClient(BaseClient):
         cert_files: Union[Tuple[str, str], str, None] = None,
         lightweight: bool = False,
         session: requests.Session = None,
+        lazy: bool = False,
+        pooled: bool = False,
+        pool_maxsize: int = 10,
+        governor: RateGovernor = None,
+        response_cache: ResponseCache = None,
     ):
         """
         Creates API client for API operations.
@@ -30,6 +38,12 @@ class APIClient(BaseClient):
             If Tuple, ('cert', 'key') path pair. If None will use `self.certs`
         :param bool lightweight: If True endpoints will return dict not a resource (22x faster)
         :param requests.Session session: Pass requests session object, defaults to a new request each request
+        :param bool lazy: If True child lists (runners / orders) of resources are created on first attribute access
+        :param bool pooled: If True (and session not provided) uses a PooledSession, a keep-alive
+            connection pool per endpoint (betting, account, identity etc.) warmed on login
+        :param int pool_maxsize: Max connections kept alive per pool (number of concurrent workers)
+        :param RateGovernor governor: Rate governor used to queue / reject requests (transaction limit)
+        :param ResponseCache response_cache: Cache used for static lookups (catalogue, event types etc.)
         """
         super(APIClient, self).__init__(
             username,
@@ -40,6 +54,11 @@ class APIClient(BaseClient):
             cert_files=cert_files,
             lightweight=lightweight,
             session=session,
+            lazy=lazy,
+            pooled=pooled,
+            pool_maxsize=pool_maxsize,
+            governor=governor,
+            response_cache=response_cache,
         )
 
         self.login = endpoints.Login(self)
@@ -60,3 +79,89 @@ class APIClient(BaseClient):
 
     def __str__(self) -> str:
         return "APIClient"
+
+
+class AsyncAPIClient(APIClient):
+    def __init__(
+        self,
+        username: str,
+        password: str = None,
+        app_key: str = None,
+        certs: str = None,
+        locale: str = None,
+        cert_files: Union[Tuple[str, str], str, None] = None,
+        lightweight: bool = False,
+        session: requests.Session = None,
+        lazy: bool = False,
+        async_session: "httpx.AsyncClient" = None,
+        max_connections: int = 100,
+        governor: RateGovernor = None,
+        response_cache: ResponseCache = None,
+    ):
+        """
+        Creates API client for asyncio API operations, betting,
+        account, scores, in_play_service, race_card and historic
+        methods return coroutines. Login, keep alive and logout
+        remain sync (requests).
+
+        :param str username: Betfair username
+        :param str password: Betfair password for supplied username, if None will look in .bashprofile
+        :param str app_key: App Key for account, if None will look in .bashprofile
+        :param str certs: Directory for certificates, if None will look in /certs
+        :param str locale: Exchange to be used, defaults to international (.com) exchange
+        :param list cert_files: if String, path to ssl client cert file (.pem).
+            If Tuple, ('cert', 'key') path pair. If None will use `self.certs`
+        :param bool lightweight: If True endpoints will return dict not a resource (22x faster)
+        :param requests.Session session: Pass requests session object used for login / keep alive / logout
+        :param bool lazy: If True child lists (runners / orders) of resources are created on first attribute access
+        :param httpx.AsyncClient async_session: Pass httpx AsyncClient, defaults to a new pooled client
+        :param int max_connections: Max connections (kept alive) used by the default async_session
+        :param RateGovernor governor: Rate governor used to queue / reject requests (transaction limit)
+        :param ResponseCache response_cache: Cache used for static lookups (catalogue, event types etc.)
+        """
+        super(AsyncAPIClient, self).__init__(
+            username,
+            password,
+            app_key=app_key,
+            certs=certs,
+            locale=locale,
+            cert_files=cert_files,
+            lightweight=lightweight,
+            session=session,
+            lazy=lazy,
+            governor=governor,
+            response_cache=response_cache,
+        )
+        if async_session is None:
+            if httpx is None:
+                raise ImportError("httpx is required for AsyncAPIClient")
+            async_session = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                )
+            )
+        self.async_session = async_session
+
+        self.betting = endpoints.AsyncBetting(self)
+        self.account = endpoints.AsyncAccount(self)
+        self.scores = endpoints.AsyncScores(self)
+        self.in_play_service = endpoints.AsyncInPlayService(self)
+        self.race_card = endpoints.AsyncRaceCard(self)
+        self.historic = endpoints.AsyncHistoric(self)
+
+    async def close(self) -> None:
+        """Closes the async session (connection pool)."""
+        await self.async_session.aclose()
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        return "<AsyncAPIClient [%s]>" % self.username
+
+    def __str__(self) -> str:
+        return "AsyncAPIClient"
@@ -6,6 +6,9 @@ import requests
 import collections
 
 from .exceptions import PasswordError, AppKeyError, CertsError
+from .governor import RateGovernor
+from .pooledsession import PooledSession
+from .responsecache import ResponseCache
 from .utils import default_user_agent
 
 IDENTITY = "https://identitysso.betfair{tld}/api/"
@@ -14,6 +17,9 @@ API = "https://api.betfair{tld}/exchange/"
 NAVIGATION = (
     "https://api.betfair{tld}/exchange/betting/rest/v1/{locale}/navigation/menu.json"
 )
+HISTORIC = "https://historicdata.betfair.com/api/"
+INPLAY_SERVICE = "https://ips.betfair.com/inplayservice/v1.1/"
+RACECARD = "https://www.betfair.com/"
 USER_AGENT = default_user_agent()
 
 
@@ -62,6 +68,11 @@ class BaseClient:
         cert_files: Union[Tuple[str, str], str, None] = None,
         lightweight: bool = False,
         session: requests.Session = None,
+        lazy: bool = False,
+        pooled: bool = False,
+        pool_maxsize: int = 10,
+        governor: RateGovernor = None,
+        response_cache: ResponseCache = None,
     ):
         """
         Creates base client for API operations.
@@ -75,6 +86,12 @@ class BaseClient:
             If Tuple, ('cert', 'key') path pair. If None will use `self.certs`
         :param bool lightweight: If True endpoints will return dict not a resource (22x faster)
         :param requests.Session session: Pass requests session object, defaults to a new request each request
+        :param bool lazy: If True child lists (runners / orders) of resources are created on first attribute access
+        :param bool pooled: If True (and session not provided) uses a PooledSession, a keep-alive
+            connection pool per endpoint (betting, account, identity etc.) warmed on login
+        :param int pool_maxsize: Max connections kept alive per pool (number of concurrent workers)
+        :param RateGovernor governor: Rate governor used to queue / reject requests (transaction limit)
+        :param ResponseCache response_cache: Cache used for static lookups (catalogue, event types etc.)
         """
         self.username = username
         self.password = password
@@ -83,8 +100,10 @@ class BaseClient:
         self.locale = locale
         self.cert_files = cert_files
         self.lightweight = lightweight
+        self.lazy = lazy
+        self.governor = governor
+        self.response_cache = response_cache
 
-        self.session = session if session else requests
         self._login_time = None
         self.session_token = None
         self.identity_uri = self.IDENTITY_URLS[locale]
@@ -92,6 +111,12 @@ class BaseClient:
         self.api_uri = self.API_URLS[locale]
         self.navigation_uri = self.NAVIGATION_URLS[locale]
         self.session_timeout = self.SESSION_TIMEOUT[locale]
+        if session:
+            self.session = session
+        elif pooled:
+            self.session = PooledSession(self.pool_urls, pool_maxsize=pool_maxsize)
+        else:
+            self.session = requests
 
         self.get_password()
         self.get_app_key()
@@ -105,6 +130,14 @@ class BaseClient:
         self.session_token = session_token
         self._login_time = time.time()
 
+    def warm_session(self) -> None:
+        """
+        Opens the betting / account connections if
+        using a PooledSession (called on login).
+        """
+        if isinstance(self.session, PooledSession):
+            self.session.warm(["betting", "account"])
+
     def get_password(self) -> str:
         """
         If password is not provided will look in environment variables
@@ -183,6 +216,22 @@ class BaseClient:
         hint = " (make sure .crt and .key pair or a single .pem is present)"
         raise CertsError(msg + hint)
 
+    @property
+    def pool_urls(self) -> dict:
+        """
+        Url prefix per connection pool.
+        """
+        return {
+            "identity": self.identity_uri,
+            "identity_cert": self.identity_cert_uri,
+            "betting": "%s%s" % (self.api_uri, "betting/"),
+            "account": "%s%s" % (self.api_uri, "account/"),
+            "scores": "%s%s" % (self.api_uri, "scores/"),
+            "historic": HISTORIC,
+            "inplay_service": INPLAY_SERVICE,
+            "racecard": RACECARD,
+        }
+
     @property
     def login_headers(self) -> dict:
         return {
@@ -16,6 +16,18 @@ except ImportError:
     import json
 
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
 try:
     import ciso8601
 
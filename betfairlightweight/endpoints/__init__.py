@@ -10,3 +10,11 @@ from .inplayservice import InPlayService
 from .streaming import Streaming
 from .racecard import RaceCard
 from .historic import Historic
+from .asyncendpoints import (
+    AsyncBetting,
+    AsyncAccount,
+    AsyncScores,
+    AsyncInPlayService,
+    AsyncRaceCard,
+    AsyncHistoric,
+)
@@ -1,5 +1,5 @@
 import requests
-from typing import Union, List
+from typing import Iterator, Union, List
 
 from .baseendpoint import BaseEndpoint
 from .. import resources
@@ -91,6 +91,31 @@ class Account(BaseEndpoint):
             lightweight,
         )
 
+    def iter_account_statement(
+        self,
+        page_size: int = 100,
+        prefetch: bool = False,
+        **kwargs,
+    ) -> Iterator:
+        """
+        Yields account statement items, pages are requested until
+        moreAvailable is False.
+
+        :param int page_size: Items per request (max 100)
+        :param bool prefetch: Request the next page whilst the current page is consumed
+        :param kwargs: Additional get_account_statement params
+
+        :rtype: Iterator[resources.accountresources.AccountStatement]
+        """
+        return self._paginate(
+            self.get_account_statement,
+            "accountStatement",
+            "account_statement",
+            [kwargs],
+            page_size,
+            prefetch,
+        )
+
     def list_currency_rates(
         self,
         from_currency: str = None,
@@ -0,0 +1,395 @@
+import asyncio
+import functools
+import time
+from typing import AsyncIterator, Callable, Optional
+
+from ..exceptions import APIError, BetfairError, InvalidResponse
+from ..utils import check_status_code
+from ..compat import json
+from ..filters import market_filter
+from .betting import Betting
+from .account import Account
+from .scores import Scores
+from .inplayservice import InPlayService
+from .racecard import RaceCard
+from .historic import Historic
+
+
+class _Request:
+    """Request args recorded when a sync endpoint
+    method calls `request`.
+    """
+
+    __slots__ = ("args", "kwargs")
+
+    def __init__(self, args: tuple, kwargs: dict):
+        self.args = args
+        self.kwargs = kwargs
+
+
+class _Process:
+    """process_response args recorded when a sync
+    endpoint method calls `process_response`.
+    """
+
+    __slots__ = ("request", "resource", "lightweight")
+
+    def __init__(self, request: _Request, resource, lightweight: bool):
+        self.request = request
+        self.resource = resource
+        self.lightweight = lightweight
+
+
+def _coroutine(sync_method: Callable) -> Callable:
+    """Wraps a sync endpoint method so that it returns
+    a coroutine, params / validation / resource creation
+    are handled by the sync method.
+    """
+
+    @functools.wraps(sync_method)
+    async def wrapper(self, *args, **kwargs):
+        return await self._call(sync_method, args, kwargs)
+
+    return wrapper
+
+
+class AsyncEndpointMixin:
+    """
+    Runs the sync endpoint methods without making a
+    request, the request and process_response args are
+    recorded and the request is then made using the
+    clients async session (httpx.AsyncClient) before
+    processing the response as per the sync endpoint.
+    """
+
+    _check_errors = True
+    _api_ng = True  # api-ng requests use client.governor / response_cache
+
+    async def _call(self, sync_method: Callable, args: tuple, kwargs: dict):
+        recorded = sync_method(self, *args, **kwargs)
+        if isinstance(recorded, _Process):
+            (response, response_json, elapsed_time) = await self._send(
+                *recorded.request.args, **recorded.request.kwargs
+            )
+            return super(AsyncEndpointMixin, self).process_response(
+                response_json, recorded.resource, elapsed_time, recorded.lightweight
+            )
+        elif isinstance(recorded, _Request):  # method returns response_json
+            (response, response_json, elapsed_time) = await self._send(
+                *recorded.args, **recorded.kwargs
+            )
+            return response_json
+        return recorded
+
+    def request(self, *args, **kwargs) -> tuple:
+        return None, _Request(args, kwargs), None
+
+    def process_response(self, response_json, resource, elapsed_time, lightweight):
+        if isinstance(response_json, _Request):
+            return _Process(response_json, resource, lightweight)
+        return super(AsyncEndpointMixin, self).process_response(
+            response_json, resource, elapsed_time, lightweight
+        )
+
+    async def _paginate(
+        self,
+        func: Callable,
+        key: str,
+        attribute: str,
+        requests_kwargs: list,
+        record_count: int,
+        prefetch: bool,
+    ) -> AsyncIterator:
+        # async generator version of BaseEndpoint._paginate, prefetch uses a task
+        next_page = None
+        try:
+            for kwargs in requests_kwargs:
+                from_record = kwargs.pop("from_record", None) or 0
+                page = await func(
+                    from_record=from_record, record_count=record_count, **kwargs
+                )
+                while True:
+                    items, more_available = self._page_items(page, key, attribute)
+                    from_record += len(items)
+                    more_available = more_available and items
+                    if more_available and prefetch:
+                        next_page = asyncio.ensure_future(
+                            func(
+                                from_record=from_record,
+                                record_count=record_count,
+                                **kwargs,
+                            )
+                        )
+                    for item in items:
+                        yield item
+                    if not more_available:
+                        break
+                    elif next_page:
+                        page, next_page = await next_page, None
+                    else:
+                        page = await func(
+                            from_record=from_record, record_count=record_count, **kwargs
+                        )
+        finally:
+            if next_page:
+                next_page.cancel()
+
+    async def _send(
+        self, method: str = None, params: dict = None, session=None, **kwargs
+    ) -> tuple:
+        """
+        :param str method: Betfair api-ng method to be used.
+        :param dict params: Params to be used in request
+        :param httpx.AsyncClient session: Async session to be used, defaults to client.async_session
+        """
+        cache = self.client.response_cache
+        if cache is not None and self._api_ng and cache.ttl(method):
+            elapsed_time = 0  # served from the cache, response None
+
+            async def fetch() -> dict:
+                nonlocal elapsed_time
+                (_, response_json, elapsed_time) = await self._send_request(
+                    method, params, session, **kwargs
+                )
+                return response_json
+
+            response_json = await cache.fetch_async(method, params, fetch)
+            return None, response_json, elapsed_time
+        return await self._send_request(method, params, session, **kwargs)
+
+    async def _send_request(
+        self, method: str = None, params: dict = None, session=None, **kwargs
+    ) -> tuple:
+        session = session or self.client.async_session
+        (http_method, url, request_kwargs) = self._prepare(method, params, **kwargs)
+        if self.client.governor and self._api_ng:
+            await self.client.governor.acquire_async(method, params)
+        time_sent = time.time()
+        try:
+            response = await session.request(
+                http_method,
+                url,
+                timeout=(
+                    self.connect_timeout,  # connect
+                    self.read_timeout,  # read
+                    self.read_timeout,  # write
+                    self.connect_timeout,  # pool
+                ),
+                **request_kwargs,
+            )
+        except Exception as e:
+            raise APIError(None, method, params, e)
+        elapsed_time = time.time() - time_sent
+
+        check_status_code(response)
+        try:
+            response_json = json.loads(response.content.decode("utf-8"))
+        except ValueError:
+            raise InvalidResponse(response.text)
+
+        if self._check_errors:
+            self._error_handler(response_json, method, params)
+        return response, response_json, elapsed_time
+
+    def _prepare(self, method: str, params: dict) -> tuple:
+        # json-rpc
+        return (
+            "POST",
+            self.url,
+            {
+                "content": self.create_req(method, params),
+                "headers": self.client.request_headers,
+            },
+        )
+
+
+class AsyncBetting(AsyncEndpointMixin, Betting):
+    """
+    Betting operations (async), iter_current_orders /
+    iter_cleared_orders return async generators.
+    """
+
+    list_event_types = _coroutine(Betting.list_event_types)
+    list_competitions = _coroutine(Betting.list_competitions)
+    list_time_ranges = _coroutine(Betting.list_time_ranges)
+    list_events = _coroutine(Betting.list_events)
+    list_market_types = _coroutine(Betting.list_market_types)
+    list_countries = _coroutine(Betting.list_countries)
+    list_venues = _coroutine(Betting.list_venues)
+    list_market_catalogue = _coroutine(Betting.list_market_catalogue)
+    list_market_book = _coroutine(Betting.list_market_book)
+    list_runner_book = _coroutine(Betting.list_runner_book)
+    list_current_orders = _coroutine(Betting.list_current_orders)
+    list_cleared_orders = _coroutine(Betting.list_cleared_orders)
+    list_market_profit_and_loss = _coroutine(Betting.list_market_profit_and_loss)
+    place_orders = _coroutine(Betting.place_orders)
+    cancel_orders = _coroutine(Betting.cancel_orders)
+    update_orders = _coroutine(Betting.update_orders)
+    replace_orders = _coroutine(Betting.replace_orders)
+
+    async def list_market_book_chunked(
+        self,
+        market_ids: list,
+        price_projection: Optional[dict] = None,
+        max_workers: int = 10,
+        session=None,
+        lightweight: Optional[bool] = None,
+        **kwargs,
+    ) -> list:
+        """
+        As per Betting.list_market_book_chunked, max_workers
+        limits the number of requests in flight.
+        """
+        chunks = self._market_book_chunks(market_ids, price_projection)
+        kwargs.update(
+            price_projection=price_projection, session=session, lightweight=lightweight
+        )
+        results = await self._gather_chunks(
+            lambda chunk: self.list_market_book(chunk, **kwargs), chunks, max_workers
+        )
+        return self._merge_chunks(market_ids, results)
+
+    async def list_market_catalogue_chunked(
+        self,
+        market_ids: list,
+        market_projection: Optional[list] = None,
+        locale: Optional[str] = None,
+        max_workers: int = 10,
+        session=None,
+        lightweight: Optional[bool] = None,
+    ) -> list:
+        """
+        As per Betting.list_market_catalogue_chunked, max_workers
+        limits the number of requests in flight.
+        """
+        chunks = self._market_catalogue_chunks(market_ids, market_projection)
+        results = await self._gather_chunks(
+            lambda chunk: self.list_market_catalogue(
+                filter=market_filter(market_ids=chunk),
+                market_projection=market_projection,
+                max_results=len(chunk),
+                locale=locale,
+                session=session,
+                lightweight=lightweight,
+            ),
+            chunks,
+            max_workers,
+        )
+        return self._merge_chunks(market_ids, results)
+
+    async def _batch_orders(
+        self,
+        operation: str,
+        resource,
+        orders: dict,
+        max_workers: int,
+        session,
+        lightweight: Optional[bool],
+        **params,
+    ) -> list:
+        chunks = self._order_chunks(operation, orders, params)
+        results = await self._gather_chunks(
+            lambda chunk: self._order_request(operation, chunk, session),
+            chunks,
+            max_workers,
+        )
+        return self._merge_orders(chunks, results, resource, lightweight)
+
+    async def _order_request(self, operation: str, params: dict, session) -> tuple:
+        method = "%s%s" % (self.URI, operation)
+        try:
+            (response, response_json, elapsed_time) = await self._send(
+                method, params, session
+            )
+        except BetfairError as e:
+            return self._order_error(operation, params, e), 0
+        return response_json.get("result", response_json), elapsed_time
+
+    @staticmethod
+    async def _gather_chunks(func, chunks: list, max_workers: int) -> list:
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def run(chunk: list):
+            async with semaphore:
+                return await func(chunk)
+
+        return await asyncio.gather(*[run(chunk) for chunk in chunks])
+
+
+class AsyncAccount(AsyncEndpointMixin, Account):
+    """
+    Account operations (async), iter_account_statement
+    returns an async generator.
+    """
+
+    get_account_funds = _coroutine(Account.get_account_funds)
+    get_account_details = _coroutine(Account.get_account_details)
+    get_account_statement = _coroutine(Account.get_account_statement)
+    list_currency_rates = _coroutine(Account.list_currency_rates)
+
+
+class AsyncScores(AsyncEndpointMixin, Scores):
+    """
+    Scores operations (async).
+    """
+
+    list_race_details = _coroutine(Scores.list_race_details)
+    list_available_events = _coroutine(Scores.list_available_events)
+    list_scores = _coroutine(Scores.list_scores)
+    list_incidents = _coroutine(Scores.list_incidents)
+
+
+class AsyncInPlayService(AsyncEndpointMixin, InPlayService):
+    """
+    In play service operations (async).
+    """
+
+    _check_errors = False
+    _api_ng = False
+
+    get_event_timeline = _coroutine(InPlayService.get_event_timeline)
+    get_event_timelines = _coroutine(InPlayService.get_event_timelines)
+    get_scores = _coroutine(InPlayService.get_scores)
+
+    def _prepare(self, method: str, params: dict, url: str = None) -> tuple:
+        return "GET", url, {"params": params, "headers": self.headers}
+
+
+class AsyncRaceCard(AsyncEndpointMixin, RaceCard):
+    """
+    RaceCard operations (async), login is sync.
+    """
+
+    _check_errors = False
+    _api_ng = False
+
+    get_race_card = _coroutine(RaceCard.get_race_card)
+    get_race_result = _coroutine(RaceCard.get_race_result)
+
+    def _prepare(self, method: str, params: dict) -> tuple:
+        return (
+            "GET",
+            "%s%s" % (self.url, method),
+            {"params": params, "headers": self.headers},
+        )
+
+
+class AsyncHistoric(AsyncEndpointMixin, Historic):
+    """
+    Historic operations (async), download_file is sync.
+    """
+
+    _check_errors = False
+    _api_ng = False
+
+    get_my_data = _coroutine(Historic.get_my_data)
+    get_collection_options = _coroutine(Historic.get_collection_options)
+    get_data_size = _coroutine(Historic.get_data_size)
+    get_file_list = _coroutine(Historic.get_file_list)
+
+    def _prepare(self, method: str, params: dict) -> tuple:
+        return (
+            "POST",
+            "%s%s" % (self.url, method),
+            {"content": json.dumps(params), "headers": self.headers},
+        )
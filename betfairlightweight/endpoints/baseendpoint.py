@@ -1,6 +1,7 @@
 import time
 import requests
-from typing import Union, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Union, Type
 
 from ..baseclient import BaseClient
 from ..exceptions import APIError, InvalidResponse
@@ -27,9 +28,28 @@ class BaseEndpoint:
         :param str method: Betfair api-ng method to be used.
         :param dict params: Params to be used in request
         :param Session session: Requests session to be used, reduces latency.
+        :return: response (None if served from the response_cache), json, elapsed time (0 if cached)
         """
+        cache = self.client.response_cache
+        if cache is not None and cache.ttl(method):
+            elapsed_time = 0
+
+            def fetch() -> dict:
+                nonlocal elapsed_time
+                _, response_json, elapsed_time = self._request(method, params, session)
+                return response_json
+
+            response_json = cache.fetch(method, params, fetch)
+            return None, response_json, elapsed_time
+        return self._request(method, params, session)
+
+    def _request(
+        self, method: str, params: dict, session: requests.Session
+    ) -> (dict, float):
         session = session or self.client.session
         request = self.create_req(method, params)
+        if self.client.governor:
+            self.client.governor.acquire(method, params)
         time_sent = time.time()
         try:
             response = session.post(
@@ -102,6 +122,12 @@ class BaseEndpoint:
             return result
         elif self.client.lightweight and lightweight is not False:
             return result
+        elif self.client.lazy:
+            if isinstance(result, list):
+                return [
+                    resource.create_lazy(x, elapsed_time=elapsed_time) for x in result
+                ]
+            return resource.create_lazy(result, elapsed_time=elapsed_time)
         elif isinstance(result, list):
             try:
                 return [resource(elapsed_time=elapsed_time, **x) for x in result]
@@ -113,6 +139,64 @@ class BaseEndpoint:
             except TypeError:
                 raise InvalidResponse(response=result)
 
+    def _paginate(
+        self,
+        func: Callable,
+        key: str,
+        attribute: str,
+        requests_kwargs: list,
+        record_count: int,
+        prefetch: bool,
+    ) -> Iterator:
+        """
+        Yields items from each page until moreAvailable is False,
+        if prefetch the next page is requested (thread) whilst the
+        current page is consumed.
+
+        :param func: Endpoint method (accepts from_record / record_count)
+        :param str key: Items key (lightweight)
+        :param str attribute: Items attribute (resource)
+        :param list requests_kwargs: func kwargs, paged in turn
+        :param int record_count: Page size
+        :param bool prefetch: Request next page concurrently
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            for kwargs in requests_kwargs:
+                from_record = kwargs.pop("from_record", None) or 0
+                page = func(
+                    from_record=from_record, record_count=record_count, **kwargs
+                )
+                while True:
+                    items, more_available = self._page_items(page, key, attribute)
+                    from_record += len(items)
+                    more_available = more_available and items
+                    if more_available and executor:
+                        page = executor.submit(
+                            func,
+                            from_record=from_record,
+                            record_count=record_count,
+                            **kwargs,
+                        )
+                    yield from items
+                    if not more_available:
+                        break
+                    elif executor:
+                        page = page.result()
+                    else:
+                        page = func(
+                            from_record=from_record, record_count=record_count, **kwargs
+                        )
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _page_items(page, key: str, attribute: str) -> tuple:
+        if isinstance(page, dict):
+            return page.get(key) or [], page.get("moreAvailable", False)
+        return getattr(page, attribute), page.more_available
+
     @property
     def url(self) -> str:
         return "%s%s" % (self.client.api_uri, "betting/json-rpc/v1")
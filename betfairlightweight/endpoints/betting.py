@@ -1,10 +1,25 @@
+import logging
 import requests
-from typing import Optional, Union, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional, Union, List
 
 from .baseendpoint import BaseEndpoint
 from .. import resources
+from ..exceptions import APIError, BetfairError, RateLimitError
 from ..filters import market_filter, time_range
-from ..utils import clean_locals
+from ..metadata import (
+    list_current_orders as list_current_orders_limits,
+    list_market_catalogue_max_results,
+    order_limits,
+)
+from ..utils import (
+    clean_locals,
+    calculate_market_book_weight,
+    calculate_market_catalogue_weight,
+    chunk_market_ids,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class Betting(BaseEndpoint):
@@ -436,6 +451,66 @@ class Betting(BaseEndpoint):
             response_json, resources.ClearedOrders, elapsed_time, lightweight
         )
 
+    def iter_current_orders(
+        self,
+        page_size: int = list_current_orders_limits["orders"],
+        prefetch: bool = False,
+        market_ids: Optional[list] = None,
+        **kwargs,
+    ) -> Iterator:
+        """
+        Yields current orders, pages are requested until moreAvailable
+        is False and market_ids are split into requests of up to 250.
+
+        :param int page_size: Orders per request (max 1000)
+        :param bool prefetch: Request the next page whilst the current page is consumed
+        :param list market_ids: One or more market ids
+        :param kwargs: Additional list_current_orders params
+
+        :rtype: Iterator[resources.bettingresources.CurrentOrder]
+        """
+        if market_ids:
+            limit = list_current_orders_limits["marketIds"]
+            requests_kwargs = [
+                dict(kwargs, market_ids=market_ids[i : i + limit])
+                for i in range(0, len(market_ids), limit)
+            ]
+        else:
+            requests_kwargs = [kwargs]
+        return self._paginate(
+            self.list_current_orders,
+            "currentOrders",
+            "orders",
+            requests_kwargs,
+            page_size,
+            prefetch,
+        )
+
+    def iter_cleared_orders(
+        self,
+        page_size: int = 1000,
+        prefetch: bool = False,
+        **kwargs,
+    ) -> Iterator:
+        """
+        Yields cleared orders, pages are requested until moreAvailable
+        is False.
+
+        :param int page_size: Orders per request (max 1000)
+        :param bool prefetch: Request the next page whilst the current page is consumed
+        :param kwargs: Additional list_cleared_orders params
+
+        :rtype: Iterator[resources.bettingresources.ClearedOrder]
+        """
+        return self._paginate(
+            self.list_cleared_orders,
+            "clearedOrders",
+            "orders",
+            [kwargs],
+            page_size,
+            prefetch,
+        )
+
     def list_market_profit_and_loss(
         self,
         market_ids: list,
@@ -593,3 +668,345 @@ class Betting(BaseEndpoint):
         return self.process_response(
             response_json, resources.ReplaceOrders, elapsed_time, lightweight
         )
+
+    def list_market_book_chunked(
+        self,
+        market_ids: list,
+        price_projection: Optional[dict] = None,
+        max_workers: int = 10,
+        session: Optional[requests.Session] = None,
+        lightweight: Optional[bool] = None,
+        **kwargs,
+    ) -> Union[list, List[resources.MarketBook]]:
+        """
+        listMarketBook split into the largest requests within the
+        data weight limit (based on price_projection), requests are
+        made concurrently and market books returned in market_ids order.
+
+        :param list market_ids: One or more market ids
+        :param dict price_projection: The projection of price data you want to receive in the response
+        :param int max_workers: Max concurrent requests (use a pooled session)
+        :param requests.session session: Requests session object
+        :param bool lightweight: If True will return dict not a resource
+        :param kwargs: Additional list_market_book params
+
+        :rtype: list[resources.MarketBook]
+        """
+        chunks = self._market_book_chunks(market_ids, price_projection)
+        kwargs.update(
+            price_projection=price_projection, session=session, lightweight=lightweight
+        )
+        results = self._map_chunks(
+            lambda chunk: self.list_market_book(chunk, **kwargs), chunks, max_workers
+        )
+        return self._merge_chunks(market_ids, results)
+
+    def list_market_catalogue_chunked(
+        self,
+        market_ids: list,
+        market_projection: Optional[list] = None,
+        locale: Optional[str] = None,
+        max_workers: int = 10,
+        session: Optional[requests.Session] = None,
+        lightweight: Optional[bool] = None,
+    ) -> Union[list, List[resources.MarketCatalogue]]:
+        """
+        listMarketCatalogue filtered by market_ids split into the largest
+        requests within the data weight limit (based on market_projection),
+        requests are made concurrently and catalogues returned in market_ids order.
+
+        :param list market_ids: One or more market ids
+        :param list market_projection: The type and amount of data returned about the market
+        :param str locale: The language used for the response
+        :param int max_workers: Max concurrent requests (use a pooled session)
+        :param requests.session session: Requests session object
+        :param bool lightweight: If True will return dict not a resource
+
+        :rtype: list[resources.MarketCatalogue]
+        """
+        chunks = self._market_catalogue_chunks(market_ids, market_projection)
+        results = self._map_chunks(
+            lambda chunk: self.list_market_catalogue(
+                filter=market_filter(market_ids=chunk),
+                market_projection=market_projection,
+                max_results=len(chunk),
+                locale=locale,
+                session=session,
+                lightweight=lightweight,
+            ),
+            chunks,
+            max_workers,
+        )
+        return self._merge_chunks(market_ids, results)
+
+    def place_orders_batched(
+        self,
+        orders: dict,
+        customer_strategy_ref: Optional[str] = None,
+        async_: Optional[bool] = None,
+        max_workers: int = 10,
+        session: Optional[requests.Session] = None,
+        lightweight: Optional[bool] = None,
+    ) -> Union[list, List[resources.PlaceOrders]]:
+        """
+        Place orders in one or more markets, instructions are split into
+        requests within metadata.order_limits and placed concurrently,
+        reports are merged per market with the request latency recorded
+        on each instruction report (elapsed_time).
+
+        :param dict orders: Place instructions per market {market_id: instructions}
+        :param str customer_strategy_ref: An optional reference customers can use to specify
+        which strategy has sent the order
+        :param bool async_: An optional flag (not setting equates to false) which specifies if
+        the orders should be placed asynchronously
+        :param int max_workers: Max concurrent requests (use a pooled session)
+        :param requests.session session: Requests session object
+        :param bool lightweight: If True will return dict not a resource
+
+        :rtype: list[resources.PlaceOrders]
+        """
+        return self._batch_orders(
+            "placeOrders",
+            resources.PlaceOrders,
+            orders,
+            max_workers,
+            session,
+            lightweight,
+            customerStrategyRef=customer_strategy_ref,
+            **{"async": async_},
+        )
+
+    def cancel_orders_batched(
+        self,
+        orders: dict,
+        max_workers: int = 10,
+        session: Optional[requests.Session] = None,
+        lightweight: Optional[bool] = None,
+    ) -> Union[list, List[resources.CancelOrders]]:
+        """
+        Cancel orders in one or more markets, instructions are split into
+        requests within metadata.order_limits and cancelled concurrently,
+        reports are merged per market with the request latency recorded
+        on each instruction report (elapsed_time).
+
+        :param dict orders: Cancel instructions per market {market_id: instructions}
+        :param int max_workers: Max concurrent requests (use a pooled session)
+        :param requests.session session: Requests session object
+        :param bool lightweight: If True will return dict not a resource
+
+        :rtype: list[resources.CancelOrders]
+        """
+        return self._batch_orders(
+            "cancelOrders",
+            resources.CancelOrders,
+            orders,
+            max_workers,
+            session,
+            lightweight,
+        )
+
+    def update_orders_batched(
+        self,
+        orders: dict,
+        max_workers: int = 10,
+        session: Optional[requests.Session] = None,
+        lightweight: Optional[bool] = None,
+    ) -> Union[list, List[resources.UpdateOrders]]:
+        """
+        Update orders in one or more markets, as per cancel_orders_batched.
+
+        :param dict orders: Update instructions per market {market_id: instructions}
+        :param int max_workers: Max concurrent requests (use a pooled session)
+        :param requests.session session: Requests session object
+        :param bool lightweight: If True will return dict not a resource
+
+        :rtype: list[resources.UpdateOrders]
+        """
+        return self._batch_orders(
+            "updateOrders",
+            resources.UpdateOrders,
+            orders,
+            max_workers,
+            session,
+            lightweight,
+        )
+
+    def replace_orders_batched(
+        self,
+        orders: dict,
+        async_: Optional[bool] = None,
+        max_workers: int = 10,
+        session: Optional[requests.Session] = None,
+        lightweight: Optional[bool] = None,
+    ) -> Union[list, List[resources.ReplaceOrders]]:
+        """
+        Replace orders in one or more markets, as per cancel_orders_batched.
+
+        :param dict orders: Replace instructions per market {market_id: instructions}
+        :param bool async_: An optional flag (not setting equates to false) which specifies
+        if the orders should be replaced asynchronously
+        :param int max_workers: Max concurrent requests (use a pooled session)
+        :param requests.session session: Requests session object
+        :param bool lightweight: If True will return dict not a resource
+
+        :rtype: list[resources.ReplaceOrders]
+        """
+        return self._batch_orders(
+            "replaceOrders",
+            resources.ReplaceOrders,
+            orders,
+            max_workers,
+            session,
+            lightweight,
+            **{"async": async_},
+        )
+
+    def _batch_orders(
+        self,
+        operation: str,
+        resource,
+        orders: dict,
+        max_workers: int,
+        session: Optional[requests.Session],
+        lightweight: Optional[bool],
+        **params,
+    ) -> list:
+        chunks = self._order_chunks(operation, orders, params)
+        results = self._map_chunks(
+            lambda chunk: self._order_request(operation, chunk, session),
+            chunks,
+            max_workers,
+        )
+        return self._merge_orders(chunks, results, resource, lightweight)
+
+    def _order_request(
+        self, operation: str, params: dict, session: Optional[requests.Session]
+    ) -> tuple:
+        method = "%s%s" % (self.URI, operation)
+        try:
+            (response, response_json, elapsed_time) = self.request(
+                method, params, session
+            )
+        except BetfairError as e:
+            return self._order_error(operation, params, e), 0
+        return response_json.get("result", response_json), elapsed_time
+
+    @staticmethod
+    def _order_error(operation: str, params: dict, error: BetfairError) -> dict:
+        # failed chunk is returned as a report so other chunks are not lost
+        if isinstance(error, RateLimitError) or (
+            isinstance(error, APIError) and error.response
+        ):
+            status = "FAILURE"  # rejected, not processed
+        else:
+            status = "TIMEOUT"  # outcome unknown, may have been processed
+        logger.error(
+            "%s request (%s instructions) for market %s failed: %s",
+            operation,
+            len(params["instructions"]),
+            params["marketId"],
+            error,
+        )
+        report = {"status": status}
+        if status == "FAILURE":
+            report["errorCode"] = "ERROR_IN_ORDER"
+        if operation == "replaceOrders":
+            reports = [
+                dict(
+                    report,
+                    cancelInstructionReport=dict(
+                        report, instruction={"betId": instruction.get("betId")}
+                    ),
+                    placeInstructionReport=report,
+                )
+                for instruction in params["instructions"]
+            ]
+        else:
+            reports = [
+                dict(report, instruction=instruction)
+                for instruction in params["instructions"]
+            ]
+        return {
+            "marketId": params["marketId"],
+            "status": status,
+            "errorCode": "SERVICE_UNAVAILABLE",
+            "instructionReports": reports,
+        }
+
+    @staticmethod
+    def _order_chunks(operation: str, orders: dict, params: dict) -> list:
+        # customerRef is not supported as it de-dupes per request
+        limit = order_limits[operation]
+        params = {k: v for k, v in params.items() if v is not None}
+        chunks = []
+        for market_id, instructions in orders.items():
+            for i in range(0, len(instructions), limit):
+                chunk = {
+                    "marketId": market_id,
+                    "instructions": instructions[i : i + limit],
+                }
+                chunk.update(params)
+                chunks.append(chunk)
+        return chunks
+
+    def _merge_orders(
+        self, chunks: list, results: list, resource, lightweight: Optional[bool]
+    ) -> list:
+        merged, elapsed_times = {}, {}
+        for params, (result, elapsed_time) in zip(chunks, results):
+            market_id = params["marketId"]
+            reports = [
+                dict(report, elapsedTime=elapsed_time)
+                for report in result.get("instructionReports") or []
+            ]
+            if market_id not in merged:
+                merged[market_id] = dict(result, instructionReports=reports)
+                elapsed_times[market_id] = elapsed_time
+                continue
+            market = merged[market_id]
+            market["instructionReports"] += reports
+            if "TIMEOUT" in (market.get("status"), result.get("status")):
+                market["status"] = "TIMEOUT"  # outcome unknown takes precedence
+            elif market.get("status") != result.get("status"):
+                market["status"] = "PROCESSED_WITH_ERRORS"
+            if result.get("errorCode") and not market.get("errorCode"):
+                market["errorCode"] = result["errorCode"]
+            elapsed_times[market_id] = max(elapsed_times[market_id], elapsed_time)
+        return [
+            self.process_response(
+                result, resource, elapsed_times[market_id], lightweight
+            )
+            for market_id, result in merged.items()
+        ]
+
+    @staticmethod
+    def _market_book_chunks(market_ids: list, price_projection: dict) -> list:
+        return chunk_market_ids(
+            market_ids, calculate_market_book_weight(price_projection)
+        )
+
+    @staticmethod
+    def _market_catalogue_chunks(market_ids: list, market_projection: list) -> list:
+        return chunk_market_ids(
+            market_ids,
+            calculate_market_catalogue_weight(market_projection),
+            max_size=list_market_catalogue_max_results,
+        )
+
+    @staticmethod
+    def _map_chunks(func, chunks: list, max_workers: int) -> list:
+        if len(chunks) < 2:
+            return [func(chunk) for chunk in chunks]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            return list(executor.map(func, chunks))
+
+    @staticmethod
+    def _merge_chunks(market_ids: list, results: list) -> list:
+        order = {market_id: i for i, market_id in enumerate(market_ids)}
+
+        def key(item) -> int:
+            if isinstance(item, dict):
+                return order.get(item.get("marketId"), len(order))
+            return order.get(item.market_id, len(order))
+
+        return sorted([item for result in results for item in result], key=key)
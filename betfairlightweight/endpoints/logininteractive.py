@@ -31,6 +31,7 @@ class LoginInteractive(BaseEndpoint):
             self.url, session=session
         )
         self.client.set_session_token(response_json.get("token"))
+        self.client.warm_session()
         return self.process_response(
             response_json, LoginResource, elapsed_time, lightweight
         )
@@ -20,6 +20,11 @@ class Navigation(BaseEndpoint):
 
         :rtype: json
         """
+        cache = self.client.response_cache
+        if cache is not None and cache.ttl("navigation"):
+            return cache.fetch(
+                "navigation", None, lambda: self.request(session=session)
+            )
         return self.request(session=session)
 
     def request(
@@ -1,10 +1,16 @@
+import os
+import queue
+from typing import IO, Union
+
 from ..baseclient import BaseClient
 from ..streaming import (
     BaseListener,
     StreamListener,
     BetfairStream,
+    AsyncBetfairStream,
     HistoricalStream,
     HistoricalGeneratorStream,
+    ShardedStream,
 )
 
 
@@ -26,6 +32,8 @@ class Streaming:
         timeout: float = 64,
         buffer_size: int = 1024,
         host: str = None,
+        max_buffer_size: int = 2**20,
+        batch: bool = False,
     ) -> BetfairStream:
         """
         Creates BetfairStream.
@@ -33,8 +41,10 @@ class Streaming:
         :param int unique_id: Id used to start unique id's of the stream (+1 before every request)
         :param resources.Listener listener:  Listener class to use
         :param float timeout: Socket timeout
-        :param int buffer_size: Socket buffer size
+        :param int buffer_size: Socket buffer size (initial)
         :param str host: Host endpoint (prod (default), integration or sports_data)
+        :param int max_buffer_size: Max size the socket buffer can grow to
+        :param bool batch: Deliver all lines from a read to listener.on_data_batch
 
         :rtype: BetfairStream
         """
@@ -47,48 +57,172 @@ class Streaming:
             timeout=timeout,
             buffer_size=buffer_size,
             host=host,
+            max_buffer_size=max_buffer_size,
+            batch=batch,
+        )
+
+    def create_async_stream(
+        self,
+        unique_id: int = 0,
+        listener: BaseListener = None,
+        timeout: float = 64,
+        limit: int = 2**24,
+        host: str = None,
+    ) -> AsyncBetfairStream:
+        """
+        Creates AsyncBetfairStream (asyncio).
+
+        :param int unique_id: Id used to start unique id's of the stream (+1 before every request)
+        :param resources.Listener listener:  Listener class to use
+        :param float timeout: Read/connect timeout
+        :param int limit: Max size of a single received line
+        :param str host: Host endpoint (prod (default), integration or sports_data)
+
+        :rtype: AsyncBetfairStream
+        """
+        listener = listener if listener else StreamListener()
+        return AsyncBetfairStream(
+            unique_id,
+            listener,
+            app_key=self.client.app_key,
+            session_token=self.client.session_token,
+            timeout=timeout,
+            limit=limit,
+            host=host,
         )
 
+    def create_sharded_stream(
+        self,
+        shards: int = 2,
+        output_queue: queue.Queue = None,
+        unique_id: int = 0,
+        listener_kwargs: dict = None,
+        timeout: float = 64,
+        buffer_size: int = 1024,
+        host: str = None,
+        max_buffer_size: int = 2**20,
+        batch: bool = False,
+    ) -> ShardedStream:
+        """
+        Creates ShardedStream, a BetfairStream and StreamListener
+        per shard with all output put on the same queue.
+
+        :param int shards: Number of connections to split the markets across
+        :param Queue output_queue: Queue used to return data from all shards
+        :param int unique_id: Id used to start unique id's of the streams (shared across shards, +1 before every request)
+        :param dict listener_kwargs: Keyword arguments passed to each StreamListener
+        :param float timeout: Socket timeout
+        :param int buffer_size: Socket buffer size (initial)
+        :param str host: Host endpoint (prod (default), integration or sports_data)
+        :param int max_buffer_size: Max size the socket buffer can grow to
+        :param bool batch: Deliver all lines from a read to listener.on_data_batch
+
+        :rtype: ShardedStream
+        """
+        streams = [
+            self.create_stream(
+                unique_id=unique_id,
+                listener=StreamListener(
+                    output_queue=output_queue, **(listener_kwargs or {})
+                ),
+                timeout=timeout,
+                buffer_size=buffer_size,
+                host=host,
+                max_buffer_size=max_buffer_size,
+                batch=batch,
+            )
+            for shard in range(shards)
+        ]
+        return ShardedStream(streams)
+
     @staticmethod
     def create_historical_stream(
-        file_path: str = None,
+        file_path: Union[str, os.PathLike, IO[bytes]] = None,
         listener: BaseListener = None,
         operation: str = "marketSubscription",
         unique_id: int = 0,
+        threaded: bool = False,
+        buffer_size: int = 2**20,
+        market_ids: list = None,
+        start_publish_time: int = None,
+        end_publish_time: int = None,
     ) -> HistoricalStream:
         """
         Uses streaming listener/cache to parse betfair
         historical data:
             https://historicdata.betfair.com/#/home
 
-        :param str file_path: Path to historic betfair file
+        :param file_path: Path to historic betfair file (bz2/gz/xz/zst compressed
+        or not) or binary file-like object
         :param BaseListener listener: Listener object
         :param str operation: Operation type
         :param int unique_id: Stream id (added to updates)
+        :param bool threaded: Read/decompress the file in a background thread
+        :param int buffer_size: Read buffer size
+        :param list market_ids: Only process lines containing these markets (seeks to first image)
+        :param int start_publish_time: Output updates from this publish time (epoch ms)
+        :param int end_publish_time: Stop after this publish time (epoch ms)
 
         :rtype: HistoricalStream
         """
         listener = listener if listener else StreamListener()
-        return HistoricalStream(file_path, listener, operation, unique_id)
+        return HistoricalStream(
+            file_path,
+            listener,
+            operation,
+            unique_id,
+            threaded=threaded,
+            buffer_size=buffer_size,
+            market_ids=market_ids,
+            start_publish_time=start_publish_time,
+            end_publish_time=end_publish_time,
+        )
 
     @staticmethod
     def create_historical_generator_stream(
-        file_path: str = None,
+        file_path: Union[str, os.PathLike, IO[bytes]] = None,
         listener: BaseListener = None,
         operation: str = "marketSubscription",
         unique_id: int = 0,
+        threaded: bool = False,
+        buffer_size: int = 2**20,
+        market_ids: list = None,
+        start_publish_time: int = None,
+        end_publish_time: int = None,
+        conflate_ms: int = None,
+        changed_only: bool = False,
     ) -> HistoricalGeneratorStream:
         """
         Uses generator listener/cache to parse betfair
         historical data:
             https://historicdata.betfair.com/#/home
 
-        :param str file_path: Path to historic betfair file
+        :param file_path: Path to historic betfair file (bz2/gz/xz/zst compressed
+        or not) or binary file-like object
         :param BaseListener listener: Listener object
         :param str operation: Operation type
         :param int unique_id: Stream id (added to updates)
+        :param bool threaded: Read/decompress the file in a background thread
+        :param int buffer_size: Read buffer size
+        :param list market_ids: Only process lines containing these markets (seeks to first image)
+        :param int start_publish_time: Output updates from this publish time (epoch ms)
+        :param int end_publish_time: Stop after this publish time (epoch ms)
+        :param int conflate_ms: Only yield once per conflate_ms (publish time)
+        :param bool changed_only: Only yield markets updated since the previous yield
 
         :rtype: HistoricalGeneratorStream
         """
         listener = listener if listener else StreamListener()
-        return HistoricalGeneratorStream(file_path, listener, operation, unique_id)
+        return HistoricalGeneratorStream(
+            file_path,
+            listener,
+            operation,
+            unique_id,
+            threaded=threaded,
+            buffer_size=buffer_size,
+            market_ids=market_ids,
+            start_publish_time=start_publish_time,
+            end_publish_time=end_publish_time,
+            conflate_ms=conflate_ms,
+            changed_only=changed_only,
+        )
@@ -214,3 +214,16 @@ class RaceCardError(BetfairError):
 
     def __str__(self):
         return self.message
+
+
+class RateLimitError(BetfairError):
+    """
+    Exception raised if a request would exceed the rate governor limits.
+    """
+
+    def __init__(self, message: str):
+        super(RateLimitError, self).__init__(message)
+        self.message = message
+
+    def __str__(self):
+        return self.message
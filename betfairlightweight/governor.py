@@ -0,0 +1,243 @@
+import asyncio
+import threading
+import time
+from typing import Optional, Tuple
+
+from . import metadata
+from .exceptions import RateLimitError
+
+
+def _min(*values: Optional[float]) -> Optional[float]:
+    values = [value for value in values if value is not None]
+    return min(values) if values else None
+
+
+class TokenBucket:
+    """
+    Bucket of capacity tokens refilled at rate tokens per second.
+    """
+
+    def __init__(self, capacity: float, rate: float):
+        """
+        :param float capacity: Max tokens (burst)
+        :param float rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.consumed = 0
+        self._updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def wait_time(self, tokens: float) -> float:
+        """Seconds until tokens are available (inf if
+        greater than capacity).
+        """
+        if tokens > self.capacity:
+            return float("inf")
+        return max(0.0, (tokens - self.tokens) / self.rate)
+
+    def consume(self, tokens: float) -> None:
+        self.tokens -= tokens
+        self.consumed += tokens
+
+    @property
+    def utilisation(self) -> float:
+        return 1 - self.tokens / self.capacity
+
+
+class RateGovernor:
+    """
+    Client wide request scheduler, placeOrders / replaceOrders
+    instructions are counted as transactions against the hourly
+    transaction limit and every request optionally against a
+    requests per second limit. Requests are queued (blocked)
+    until tokens are available or rejected with RateLimitError,
+    order operations take priority over data requests waiting
+    on the requests bucket.
+    """
+
+    TRANSACTION_OPERATIONS = ("placeOrders", "replaceOrders")
+    ORDER_OPERATIONS = ("placeOrders", "cancelOrders", "updateOrders", "replaceOrders")
+
+    def __init__(
+        self,
+        transaction_limit: int = metadata.transaction_limit,
+        transaction_period: float = 3600,
+        requests_per_second: float = None,
+        burst: int = None,
+        block: bool = True,
+        timeout: float = None,
+    ):
+        """
+        :param int transaction_limit: Transactions per transaction_period
+        :param float transaction_period: Period in seconds (betfair limit is per hour)
+        :param float requests_per_second: Max requests per second, if None requests are not limited
+        :param int burst: Max requests in a burst, defaults to requests_per_second
+        :param bool block: If True requests are queued until within limits, else rejected
+        :param float timeout: Max time to queue a request before it is rejected
+        """
+        self.transactions = TokenBucket(
+            transaction_limit, transaction_limit / transaction_period
+        )
+        self.requests = (
+            TokenBucket(burst or requests_per_second, requests_per_second)
+            if requests_per_second
+            else None
+        )
+        self.block = block
+        self.timeout = timeout
+        self._condition = threading.Condition()
+        self._orders_waiting = 0
+
+    @classmethod
+    def classify(cls, method: str, params: dict) -> Tuple[int, bool]:
+        """Returns the number of transactions and True if
+        the request is an order operation.
+
+        :param str method: Betfair api-ng method e.g. SportsAPING/v1.0/placeOrders
+        :param dict params: Request params
+        """
+        operation = method.rsplit("/", 1)[-1] if method else None
+        if operation in cls.TRANSACTION_OPERATIONS:
+            return len((params or {}).get("instructions") or ()), True
+        return 0, operation in cls.ORDER_OPERATIONS
+
+    def acquire(
+        self,
+        method: str,
+        params: dict,
+        block: bool = None,
+        timeout: float = None,
+    ) -> float:
+        """Blocks until the request is within limits,
+        returns the time queued.
+
+        :param str method: Betfair api-ng method
+        :param dict params: Request params
+        :param bool block: Override governor block
+        :param float timeout: Override governor timeout
+        :raises: RateLimitError if rejected
+        """
+        transactions, order = self.classify(method, params)
+        start = time.monotonic()
+        waiting = False
+        with self._condition:
+            try:
+                while True:
+                    wait = self._try_acquire(transactions, order)
+                    if wait == 0:
+                        return time.monotonic() - start
+                    remaining = self._check(method, wait, start, block, timeout)
+                    waiting = self._update_waiting(order, waiting)
+                    self._condition.wait(_min(wait, remaining))
+            finally:
+                if waiting:
+                    self._orders_waiting -= 1
+                self._condition.notify_all()
+
+    async def acquire_async(
+        self,
+        method: str,
+        params: dict,
+        block: bool = None,
+        timeout: float = None,
+    ) -> float:
+        """asyncio version of acquire, the event loop is
+        not blocked while the request is queued.
+        """
+        transactions, order = self.classify(method, params)
+        start = time.monotonic()
+        waiting = False
+        try:
+            while True:
+                with self._condition:
+                    wait = self._try_acquire(transactions, order)
+                    if wait == 0:
+                        return time.monotonic() - start
+                    remaining = self._check(method, wait, start, block, timeout)
+                    waiting = self._update_waiting(order, waiting)
+                await asyncio.sleep(_min(0.01 if wait is None else wait, remaining))
+        finally:
+            if waiting:
+                with self._condition:
+                    self._orders_waiting -= 1
+                    self._condition.notify_all()
+
+    def utilisation(self) -> dict:
+        """Returns the utilisation (0-1) of each bucket
+        and the number of order requests queued.
+        """
+        with self._condition:
+            now = time.monotonic()
+            self.transactions.refill(now)
+            utilisation = {
+                "transactions": self.transactions.utilisation,
+                "transactions_consumed": self.transactions.consumed,
+                "orders_waiting": self._orders_waiting,
+            }
+            if self.requests:
+                self.requests.refill(now)
+                utilisation["requests"] = self.requests.utilisation
+                utilisation["requests_consumed"] = self.requests.consumed
+            return utilisation
+
+    def _try_acquire(self, transactions: int, order: bool) -> Optional[float]:
+        # lock held, returns 0 if consumed, time to wait
+        # or None if waiting on queued order requests
+        now = time.monotonic()
+        self.transactions.refill(now)
+        wait = self.transactions.wait_time(transactions)
+        if self.requests:
+            self.requests.refill(now)
+            if not order and self._orders_waiting:
+                return None
+            wait = max(wait, self.requests.wait_time(1))
+        if wait == 0:
+            self.transactions.consume(transactions)
+            if self.requests:
+                self.requests.consume(1)
+        return wait
+
+    def _update_waiting(self, order: bool, waiting: bool) -> bool:
+        # lock held, only order requests blocked on the requests
+        # bucket are counted (data requests queue behind them),
+        # orders waiting on transactions alone are not
+        blocked = bool(order and self.requests and self.requests.wait_time(1) > 0)
+        if blocked != waiting:
+            self._orders_waiting += 1 if blocked else -1
+        return blocked
+
+    def _check(
+        self,
+        method: str,
+        wait: Optional[float],
+        start: float,
+        block: Optional[bool],
+        timeout: Optional[float],
+    ) -> Optional[float]:
+        # raises if the request should be rejected else
+        # returns the remaining time allowed to queue
+        block = self.block if block is None else block
+        timeout = self.timeout if timeout is None else timeout
+        if wait == float("inf"):
+            raise RateLimitError("%s exceeds the transaction limit" % method)
+        elif not block:
+            raise RateLimitError("%s rate limited" % method)
+        elif timeout is None:
+            return None
+        remaining = timeout - (time.monotonic() - start)
+        if remaining <= 0 or (wait is not None and wait > remaining):
+            raise RateLimitError("%s rate limited (timeout)" % method)
+        return remaining
+
+    def __str__(self) -> str:
+        return "<RateGovernor [%s transactions]>" % self.transactions.capacity
+
+    def __repr__(self) -> str:
+        return "<RateGovernor>"
@@ -28,9 +28,13 @@ Market Data Request Limits
         EX_BEST_OFFERS + EX_TRADED	20
         EX_ALL_OFFERS + EX_TRADED   32
 
-    If exBestOffersOverrides is used the weight is calculated by weight * (requestedDepth/3).
+    If exBestOffersOverrides is used the EX_BEST_OFFERS weight is calculated by weight * (requestedDepth/3).
 """
 
+data_weight_limit = 200  # max weight points per request (TOO_MUCH_DATA)
+
+list_market_catalogue_max_results = 1000
+
 list_market_catalogue = {
     "MARKET_DESCRIPTION": 1,
     "RUNNER_DESCRIPTION": 0,
@@ -50,6 +54,11 @@ list_market_book = {
     "EX_TRADED": 17,
 }
 
+list_market_book_combined = {
+    ("EX_BEST_OFFERS", "EX_TRADED"): 20,
+    ("EX_ALL_OFFERS", "EX_TRADED"): 32,
+}
+
 list_market_profit_and_loss = {"": 4}
 
 
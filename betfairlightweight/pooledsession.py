@@ -0,0 +1,87 @@
+import logging
+from typing import Iterable
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class PooledSession(requests.Session):
+    """
+    requests Session with a separate keep-alive connection
+    pool (HTTPAdapter) mounted per endpoint url, urllib3
+    pools are thread safe so a single session can be shared
+    across workers.
+    """
+
+    def __init__(
+        self,
+        urls: dict,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        max_retries: int = 0,
+    ):
+        """
+        :param dict urls: {name: url prefix} a pool is mounted per url
+        :param int pool_maxsize: Max connections kept alive per pool (number of concurrent workers)
+        :param bool pool_block: Block when the pool is exhausted rather than opening a new (discarded) connection
+        :param int max_retries: Retries on connection failure
+        """
+        super(PooledSession, self).__init__()
+        self.urls = urls
+        self.pool_maxsize = pool_maxsize
+        self.adapters_by_name = {}
+        for name, url in urls.items():
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                max_retries=max_retries,
+            )
+            self.mount(url, adapter)
+            self.adapters_by_name[name] = adapter
+
+    def warm(self, names: Iterable[str] = None, timeout: float = 3.05) -> None:
+        """Opens a connection (TCP + TLS handshake) in the
+        pools provided (defaults to all) by making a HEAD
+        request, any response / error is ignored.
+
+        :param names: Pools to warm
+        :param float timeout: Request timeout
+        """
+        for name in names or self.urls:
+            url = self.urls[name]
+            try:
+                self.head(url, timeout=timeout)
+            except requests.RequestException as e:
+                logger.warning("Unable to warm %s pool (%s): %s", name, url, e)
+
+    def stats(self) -> dict:
+        """Returns the number of requests made, connections
+        opened and connections idle (available) per pool.
+        """
+        stats = {}
+        for name, adapter in self.adapters_by_name.items():
+            requests_made, connections, idle = 0, 0, 0
+            pools = adapter.poolmanager.pools
+            for pool in [pools[key] for key in pools.keys()]:
+                requests_made += pool.num_requests
+                connections += pool.num_connections
+                if pool.pool is not None:
+                    idle += sum(1 for conn in list(pool.pool.queue) if conn is not None)
+            stats[name] = {
+                "requests": requests_made,
+                "connections": connections,
+                "idle": idle,
+            }
+        return stats
+
+    def __str__(self) -> str:
+        return "<PooledSession [%s pools %s maxsize]>" % (
+            len(self.adapters_by_name),
+            self.pool_maxsize,
+        )
+
+    def __repr__(self) -> str:
+        return "<PooledSession>"
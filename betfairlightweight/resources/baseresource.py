@@ -3,12 +3,16 @@ import datetime
 from typing import Union, Optional
 
 from ..compat import basestring, integer_types, json, parse_datetime
+from ..exceptions import InvalidResponse
 from ..utils import utcfromtimestamp, utcnow
 
 
 class BaseResource:
     """Lightweight data structure for resources."""
 
+    _lazy_children = {}  # key: (attribute, cls) created lazily, see create_lazy
+    _lazy_pending = None  # attribute: (key, cls) not yet created
+
     def __init__(self, **kwargs):
         self.elapsed_time = kwargs.pop("elapsed_time", None)
         now = utcnow()
@@ -16,6 +20,32 @@ class BaseResource:
         self._datetime_updated = now
         self._data = kwargs
 
+    @classmethod
+    def create_lazy(cls, data: dict, **kwargs) -> "BaseResource":
+        """Creates the resource from the response data with
+        the `_lazy_children` lists only created on first
+        attribute access.
+
+        :param dict data: Response data
+        :param kwargs: Additional kwargs used to create the resource (elapsed_time)
+        :raises: InvalidResponse if the resource cannot be created
+        """
+        lazy_children = cls._lazy_children
+        try:
+            resource = cls(
+                **kwargs,
+                **{k: [] if k in lazy_children else v for k, v in data.items()},
+            )
+        except TypeError:
+            raise InvalidResponse(response=data)
+        if lazy_children:
+            resource._lazy_pending = {}
+            for key, (attribute, child_cls) in lazy_children.items():
+                delattr(resource, attribute)
+                resource._lazy_pending[attribute] = (key, child_cls)
+        resource._data = data
+        return resource
+
     def json(self) -> str:
         return json.dumps(self._data)
 
@@ -36,6 +66,21 @@ class BaseResource:
             except (ValueError, OverflowError, OSError):
                 return
 
+    def __getattr__(self, name: str):
+        # only called if not found, creates pending lazy children
+        pending = self._lazy_pending
+        if pending and name in pending:
+            key, child_cls = pending.pop(name)
+            try:
+                value = [child_cls(**i) for i in self._data.get(key) or []]
+            except TypeError:
+                raise InvalidResponse(response=self._data.get(key))
+            setattr(self, name, value)
+            return value
+        raise AttributeError(
+            "'%s' object has no attribute '%s'" % (self.__class__.__name__, name)
+        )
+
     def __repr__(self) -> str:
         return "<%s>" % self.__class__.__name__
 
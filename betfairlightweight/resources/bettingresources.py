@@ -1,5 +1,8 @@
+import datetime
+from typing import Optional
+
 from .baseresource import BaseResource
-from ..utils import to_snake_case
+from ..utils import to_snake_case, utcnow
 
 
 class BettingResource:
@@ -9,7 +12,7 @@ class BettingResource:
         attribute_name = self._item_name_to_attribute_name_overrides.get(
             item, to_snake_case(item)
         )
-        return self.__getattribute__(attribute_name)
+        return getattr(self, attribute_name)
 
     def get(self, key, default=None):
         try:
@@ -298,6 +301,8 @@ class MarketCatalogue(BaseResource, BettingResource):
     :type total_matched: float
     """
 
+    _lazy_children = {"runners": ("runners", RunnerCatalogue)}
+
     def __init__(self, **kwargs):
         super(MarketCatalogue, self).__init__(**kwargs)
         self.market_id = kwargs.get("marketId")
@@ -380,6 +385,26 @@ class RunnerBookSP(BettingResource):
         self.back_stake_taken = [PriceSize(**i) for i in backStakeTaken]
         self.lay_liability_taken = [PriceSize(**i) for i in layLiabilityTaken]
 
+    @classmethod
+    def create(
+        cls,
+        near_price: float,
+        far_price: float,
+        back_stake_taken: list,
+        lay_liability_taken: list,
+        actual_sp: float,
+    ) -> "RunnerBookSP":
+        """Direct constructor (streaming), ladders are
+        lists of PriceSize.
+        """
+        sp = cls.__new__(cls)
+        sp.near_price = near_price
+        sp.far_price = far_price
+        sp.actual_sp = actual_sp
+        sp.back_stake_taken = back_stake_taken
+        sp.lay_liability_taken = lay_liability_taken
+        return sp
+
 
 class RunnerBookEX(BettingResource):
     """
@@ -398,6 +423,19 @@ class RunnerBookEX(BettingResource):
         self.available_to_lay = [PriceSize(**i) for i in availableToLay]
         self.traded_volume = [PriceSize(**i) for i in tradedVolume]
 
+    @classmethod
+    def create(
+        cls, available_to_back: list, available_to_lay: list, traded_volume: list
+    ) -> "RunnerBookEX":
+        """Direct constructor (streaming), ladders are
+        lists of PriceSize.
+        """
+        ex = cls.__new__(cls)
+        ex.available_to_back = available_to_back
+        ex.available_to_lay = available_to_lay
+        ex.traded_volume = traded_volume
+        return ex
+
 
 class RunnerBookOrder(BettingResource):
     """
@@ -532,6 +570,39 @@ class RunnerBook(BettingResource):
         self.suspend_reason = suspendReason
         self.bet_delay_models = betDelayModels
 
+    @classmethod
+    def create(
+        cls,
+        selection_id: int,
+        status: str,
+        handicap: float,
+        adjustment_factor: Optional[float],
+        last_price_traded: Optional[float],
+        total_matched: Optional[float],
+        removal_date: Optional[datetime.datetime],
+        sp: Optional[RunnerBookSP],
+        ex: Optional[RunnerBookEX],
+    ) -> "RunnerBook":
+        """Direct constructor (streaming), avoids the
+        kwargs / serialised dict.
+        """
+        runner_book = cls.__new__(cls)
+        runner_book.selection_id = selection_id
+        runner_book.status = status
+        runner_book.total_matched = total_matched
+        runner_book.adjustment_factor = adjustment_factor
+        runner_book.handicap = handicap
+        runner_book.last_price_traded = last_price_traded
+        runner_book.removal_date = removal_date
+        runner_book.sp = sp
+        runner_book.ex = ex
+        runner_book.orders = []
+        runner_book.matches = []
+        runner_book.matches_by_strategy = None
+        runner_book.suspend_reason = None
+        runner_book.bet_delay_models = None
+        return runner_book
+
     def __str__(self):
         return "RunnerBook: %s" % self.selection_id
 
@@ -587,41 +658,71 @@ class MarketBook(BaseResource, BettingResource):
     :type version: int
     """
 
+    _lazy_children = {"runners": ("runners", RunnerBook)}
+
     def __init__(self, **kwargs):
         self.streaming_unique_id = kwargs.pop("streaming_unique_id", None)
         self.streaming_update = kwargs.pop("streaming_update", None)
         self.streaming_snap = kwargs.pop("streaming_snap", False)
         self.market_definition = kwargs.pop("market_definition", None)
         super(MarketBook, self).__init__(**kwargs)
-        self.market_id = kwargs.get("marketId")
-        self.bet_delay = kwargs.get("betDelay")
-        self.bet_delay_models = kwargs.get("betDelayModels")
-        self.bsp_reconciled = kwargs.get("bspReconciled")
-        self.complete = kwargs.get("complete")
-        self.cross_matching = kwargs.get("crossMatching")
-        self.inplay = kwargs.get("inplay")
-        self.is_market_data_delayed = kwargs.get("isMarketDataDelayed")
-        self.last_match_time = self.strip_datetime(kwargs.get("lastMatchTime"))
-        self.number_of_active_runners = kwargs.get("numberOfActiveRunners")
-        self.number_of_runners = kwargs.get("numberOfRunners")
-        self.number_of_winners = kwargs.get("numberOfWinners")
-        self.runners_voidable = kwargs.get("runnersVoidable")
-        self.status = kwargs.get("status")
-        self.suspend_reason = kwargs.get("suspendReason")
-        self.total_available = kwargs.get("totalAvailable")
-        self.total_matched = kwargs.get("totalMatched")
-        self.version = kwargs.get("version")
-        self.runners = [RunnerBook(**i) for i in kwargs.get("runners")]
-        self.publish_time = self.strip_datetime(kwargs.get("publishTime"))
-        self.publish_time_epoch = kwargs.get("publishTime")
+        self._set_attributes(kwargs, [RunnerBook(**i) for i in kwargs.get("runners")])
+
+    @classmethod
+    def create(
+        cls,
+        data: dict,
+        runners: list,
+        market_definition: object = None,
+        streaming_unique_id: Optional[int] = None,
+        streaming_update: Optional[dict] = None,
+        streaming_snap: bool = False,
+    ) -> "MarketBook":
+        """Direct constructor used by the streaming cache,
+        data is the serialised market book (held as _data)
+        and runners the RunnerBook resources.
+        """
+        market_book = cls.__new__(cls)
+        market_book.streaming_unique_id = streaming_unique_id
+        market_book.streaming_update = streaming_update
+        market_book.streaming_snap = streaming_snap
+        market_book.market_definition = market_definition
+        market_book.elapsed_time = None
+        market_book._datetime_created = market_book._datetime_updated = utcnow()
+        market_book._data = data
+        market_book._set_attributes(data, runners)
+        return market_book
+
+    def _set_attributes(self, data: dict, runners: list) -> None:
+        self.market_id = data.get("marketId")
+        self.bet_delay = data.get("betDelay")
+        self.bet_delay_models = data.get("betDelayModels")
+        self.bsp_reconciled = data.get("bspReconciled")
+        self.complete = data.get("complete")
+        self.cross_matching = data.get("crossMatching")
+        self.inplay = data.get("inplay")
+        self.is_market_data_delayed = data.get("isMarketDataDelayed")
+        self.last_match_time = self.strip_datetime(data.get("lastMatchTime"))
+        self.number_of_active_runners = data.get("numberOfActiveRunners")
+        self.number_of_runners = data.get("numberOfRunners")
+        self.number_of_winners = data.get("numberOfWinners")
+        self.runners_voidable = data.get("runnersVoidable")
+        self.status = data.get("status")
+        self.suspend_reason = data.get("suspendReason")
+        self.total_available = data.get("totalAvailable")
+        self.total_matched = data.get("totalMatched")
+        self.version = data.get("version")
+        self.runners = runners
+        self.publish_time = self.strip_datetime(data.get("publishTime"))
+        self.publish_time_epoch = data.get("publishTime")
         self.key_line_description = (
-            KeyLine(**kwargs.get("keyLineDescription"))
-            if kwargs.get("keyLineDescription")
+            KeyLine(**data.get("keyLineDescription"))
+            if data.get("keyLineDescription")
             else None
         )
         self.price_ladder_definition = (
-            PriceLadderDescription(**kwargs.get("priceLadderDefinition"))
-            if kwargs.get("priceLadderDefinition")
+            PriceLadderDescription(**data.get("priceLadderDefinition"))
+            if data.get("priceLadderDefinition")
             else None
         )
 
@@ -733,6 +834,7 @@ class CurrentOrders(BaseResource, BettingResource):
     """
 
     _item_name_to_attribute_name_overrides = {"currentOrders": "orders"}
+    _lazy_children = {"currentOrders": ("orders", CurrentOrder)}
 
     def __init__(self, **kwargs):
         self.streaming_unique_id = kwargs.pop("streaming_unique_id", None)
@@ -846,6 +948,7 @@ class ClearedOrders(BaseResource, BettingResource):
     """
 
     _item_name_to_attribute_name_overrides = {"clearedOrders": "orders"}
+    _lazy_children = {"clearedOrders": ("orders", ClearedOrder)}
 
     def __init__(self, **kwargs):
         super(ClearedOrders, self).__init__(**kwargs)
@@ -979,6 +1082,7 @@ class PlaceOrderInstructionReports(BettingResource):
     """
     :type average_price_matched: float
     :type bet_id: unicode
+    :type elapsed_time: float
     :type error_code: str
     :type instruction: PlaceOrderInstruction
     :type order_status: unicode
@@ -997,6 +1101,7 @@ class PlaceOrderInstructionReports(BettingResource):
         sizeMatched: float = None,
         placedDate: str = None,
         errorCode: str = None,
+        elapsedTime: float = None,
     ):
         self.status = status
         self.order_status = orderStatus
@@ -1006,6 +1111,7 @@ class PlaceOrderInstructionReports(BettingResource):
         self.placed_date = BaseResource.strip_datetime(placedDate)
         self.instruction = PlaceOrderInstruction(**instruction) if instruction else None
         self.error_code = errorCode
+        self.elapsed_time = elapsedTime  # request latency (batched orders)
 
 
 class PlaceOrders(BaseResource, BettingResource):
@@ -1046,6 +1152,7 @@ class CancelOrderInstruction(BettingResource):
 class CancelOrderInstructionReports(BettingResource):
     """
     :type cancelled_date: datetime.datetime
+    :type elapsed_time: float
     :type error_code: str
     :type instruction: CancelOrderInstruction
     :type size_cancelled: float
@@ -1059,12 +1166,14 @@ class CancelOrderInstructionReports(BettingResource):
         sizeCancelled: float = None,
         cancelledDate: str = None,
         errorCode: str = None,
+        elapsedTime: float = None,
     ):
         self.status = status
         self.size_cancelled = sizeCancelled
         self.cancelled_date = BaseResource.strip_datetime(cancelledDate)
         self.instruction = CancelOrderInstruction(**instruction)
         self.error_code = errorCode
+        self.elapsed_time = elapsedTime  # request latency (batched orders)
 
 
 class CancelOrders(BaseResource, BettingResource):
@@ -1104,15 +1213,23 @@ class UpdateOrderInstruction(BettingResource):
 
 class UpdateOrderInstructionReports(BettingResource):
     """
+    :type elapsed_time: float
     :type error_code: str
     :type instruction: UpdateOrderInstruction
     :type status: unicode
     """
 
-    def __init__(self, status: str, instruction: dict, errorCode: str = None):
+    def __init__(
+        self,
+        status: str,
+        instruction: dict,
+        errorCode: str = None,
+        elapsedTime: float = None,
+    ):
         self.status = status
         self.instruction = UpdateOrderInstruction(**instruction)
         self.error_code = errorCode
+        self.elapsed_time = elapsedTime  # request latency (batched orders)
 
 
 class UpdateOrders(BaseResource, BettingResource):
@@ -1142,6 +1259,7 @@ class UpdateOrders(BaseResource, BettingResource):
 class ReplaceOrderInstructionReports(BettingResource):
     """
     :type cancel_instruction_reports: CancelOrderInstructionReports
+    :type elapsed_time: float
     :type error_code: str
     :type place_instruction_reports: PlaceOrderInstructionReports
     :type status: unicode
@@ -1153,6 +1271,7 @@ class ReplaceOrderInstructionReports(BettingResource):
         cancelInstructionReport: dict,
         placeInstructionReport: dict,
         errorCode: str = None,
+        elapsedTime: float = None,
     ):
         self.status = status
         self.cancel_instruction_reports = CancelOrderInstructionReports(
@@ -1162,6 +1281,7 @@ class ReplaceOrderInstructionReports(BettingResource):
             **placeInstructionReport
         )
         self.error_code = errorCode
+        self.elapsed_time = elapsedTime  # request latency (batched orders)
 
 
 class ReplaceOrders(BaseResource, BettingResource):
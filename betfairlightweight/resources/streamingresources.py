@@ -1,5 +1,62 @@
 from .baseresource import BaseResource
-from .bettingresources import PriceLadderDescription
+from .bettingresources import (
+    PriceLadderDescription,
+    RunnerBook,
+    RunnerBookEX,
+    RunnerBookSP,
+    Slotable,
+)
+
+
+class RunnerBookSPStream(Slotable, RunnerBookSP):
+    """
+    RunnerBookSP created by the streaming cache, attributes
+    are held in slots so the instance dict (inherited
+    from the unslotted RunnerBookSP) is left empty.
+    """
+
+    __slots__ = [
+        "near_price",
+        "far_price",
+        "actual_sp",
+        "back_stake_taken",
+        "lay_liability_taken",
+    ]
+
+
+class RunnerBookEXStream(Slotable, RunnerBookEX):
+    """
+    RunnerBookEX created by the streaming cache, attributes
+    are held in slots so the instance dict (inherited
+    from the unslotted RunnerBookEX) is left empty.
+    """
+
+    __slots__ = ["available_to_back", "available_to_lay", "traded_volume"]
+
+
+class RunnerBookStream(Slotable, RunnerBook):
+    """
+    RunnerBook created by the streaming cache, attributes
+    are held in slots so the instance dict (inherited
+    from the unslotted RunnerBook) is left empty.
+    """
+
+    __slots__ = [
+        "selection_id",
+        "status",
+        "total_matched",
+        "adjustment_factor",
+        "handicap",
+        "last_price_traded",
+        "removal_date",
+        "sp",
+        "ex",
+        "orders",
+        "matches",
+        "matches_by_strategy",
+        "suspend_reason",
+        "bet_delay_models",
+    ]
 
 
 class MarketDefinitionRunner:
@@ -0,0 +1,215 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from json import dumps  # sort_keys used for a stable key
+from typing import Awaitable, Callable, Optional
+
+from .compat import json
+
+logger = logging.getLogger(__name__)
+
+# seconds, keyed by api-ng operation
+DEFAULT_TTLS = {
+    "listEventTypes": 3600,
+    "listCompetitions": 3600,
+    "listCountries": 3600,
+    "listVenues": 3600,
+    "listMarketTypes": 3600,
+    "listMarketCatalogue": 60,
+    "navigation": 300,
+}
+
+
+def _dumps(data) -> str:
+    data = json.dumps(data)
+    return data.decode("utf-8") if isinstance(data, bytes) else data
+
+
+class ResponseCache:
+    """
+    Opt-in cache of responses for rarely changing (static)
+    lookups, keyed by method + params with a ttl per method,
+    least recently used entries are evicted above maxsize.
+    Responses are stored parsed and shared between callers
+    (not copied) so must be treated as read only. Once expired an entry is returned (stale)
+    for up to stale_while_revalidate seconds whilst it is
+    refreshed in the background.
+    """
+
+    def __init__(
+        self,
+        ttls: dict = None,
+        maxsize: int = 1000,
+        stale_while_revalidate: float = 60,
+        path: str = None,
+    ):
+        """
+        :param dict ttls: Seconds to cache per operation e.g. {"listMarketCatalogue": 60}, defaults to DEFAULT_TTLS
+        :param int maxsize: Max entries cached
+        :param float stale_while_revalidate: Seconds an expired entry is served whilst refreshed, 0 to disable
+        :param str path: File to persist the cache to (save) and load from on creation
+        """
+        self.ttls = DEFAULT_TTLS.copy() if ttls is None else ttls
+        self.maxsize = maxsize
+        self.stale_while_revalidate = stale_while_revalidate
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key: (expires, response)
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            self.load()
+
+    def ttl(self, method: Optional[str]) -> Optional[float]:
+        """Returns the ttl for the method (None if not cached).
+
+        :param str method: Betfair api-ng method e.g. SportsAPING/v1.0/listEventTypes
+        """
+        if method:
+            return self.ttls.get(method.rsplit("/", 1)[-1])
+
+    @staticmethod
+    def key(method: str, params: Optional[dict]) -> str:
+        # stdlib json, orjson does not support sort_keys
+        return dumps([method, params], sort_keys=True, separators=(",", ":"))
+
+    def get(self, key: str) -> Optional[tuple]:
+        """Returns (response, stale) or None if not cached
+        or expired beyond stale_while_revalidate, the
+        response is shared (not copied).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            expires, response = entry
+            now = time.time()
+            if now > expires + self.stale_while_revalidate:
+                del self._entries[key]
+                return
+            self._entries.move_to_end(key)
+        return response, now > expires
+
+    def set(self, key: str, response, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def fetch(self, method: str, params: Optional[dict], func: Callable):
+        """Returns the cached response or calls func and
+        caches the response, stale responses are returned
+        and refreshed using func in a thread.
+
+        :param str method: Betfair api-ng method
+        :param dict params: Request params
+        :param func: Returns the (json serialisable) response
+        """
+        key, ttl = self.key(method, params), self.ttl(method)
+        entry = self.get(key)
+        if entry is None:
+            self.misses += 1
+            response = func()
+            self.set(key, response, ttl)
+            return response
+        self.hits += 1
+        response, stale = entry
+        if stale and self._start_refresh(key):
+            threading.Thread(
+                name="ResponseCacheRefresh",
+                target=self._refresh,
+                args=(key, ttl, func),
+                daemon=True,
+            ).start()
+        return response
+
+    async def fetch_async(
+        self, method: str, params: Optional[dict], func: Callable[[], Awaitable]
+    ):
+        """asyncio version of fetch, func returns an
+        awaitable and stale responses are refreshed in
+        a task.
+        """
+        key, ttl = self.key(method, params), self.ttl(method)
+        entry = self.get(key)
+        if entry is None:
+            self.misses += 1
+            response = await func()
+            self.set(key, response, ttl)
+            return response
+        self.hits += 1
+        response, stale = entry
+        if stale and self._start_refresh(key):
+            asyncio.ensure_future(self._refresh_async(key, ttl, func))
+        return response
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def save(self) -> None:
+        """Writes the cache to path."""
+        with self._lock:
+            entries = [
+                [key, expires, response]
+                for key, (expires, response) in self._entries.items()
+            ]
+        tmp_path = "%s.tmp" % self.path
+        with open(tmp_path, "w") as f:
+            f.write(_dumps(entries))
+        os.replace(tmp_path, self.path)
+
+    def load(self) -> None:
+        """Loads the cache from path, entries expired
+        beyond stale_while_revalidate are ignored.
+        """
+        with open(self.path, "rb") as f:
+            entries = json.loads(f.read())
+        now = time.time()
+        with self._lock:
+            for key, expires, response in entries:
+                if now <= expires + self.stale_while_revalidate:
+                    self._entries[key] = (expires, response)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _start_refresh(self, key: str) -> bool:
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _refresh(self, key: str, ttl: float, func: Callable) -> None:
+        try:
+            self.set(key, func(), ttl)
+        except Exception as e:
+            logger.warning("Unable to refresh cached response: %s", e)
+        finally:
+            self._refreshing.discard(key)
+
+    async def _refresh_async(self, key: str, ttl: float, func: Callable) -> None:
+        try:
+            self.set(key, await func(), ttl)
+        except Exception as e:
+            logger.warning("Unable to refresh cached response: %s", e)
+        finally:
+            self._refreshing.discard(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __str__(self) -> str:
+        return "<ResponseCache [%s entries %s hits %s misses]>" % (
+            len(self),
+            self.hits,
+            self.misses,
+        )
+
+    def __repr__(self) -> str:
+        return "<ResponseCache>"
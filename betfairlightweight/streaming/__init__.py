@@ -1,3 +1,13 @@
-from .betfairstream import BetfairStream, HistoricalStream, HistoricalGeneratorStream
+from .betfairstream import (
+    BetfairStream,
+    AsyncBetfairStream,
+    HistoricalStream,
+    HistoricalGeneratorStream,
+)
 from .listener import BaseListener, StreamListener
 from .stream import MarketStream, OrderStream
+from .shardedstream import ShardedStream
+from .historicalrunner import HistoricalRunner
+from .columnar import ColumnarWriter, ColumnarReader
+from .historicalindex import HistoricalIndex
+from .snapshot import MarketBookSnapshot, RunnerBookSnapshot
@@ -1,24 +1,38 @@
+import io
+import os
+import abc
+import bz2
+import gzip
+import lzma
+import sys
+import queue
 import socket
 import ssl
+import asyncio
 import logging
+import threading
+import itertools
+import contextlib
 import collections
-from typing import Optional
+from typing import IO, Iterator, Optional, Union
 
 from ..exceptions import SocketError, ListenerError
-from ..compat import json
+from ..compat import json, zstandard
 from ..utils import utcnow
 from .listener import BaseListener
+from .historicalindex import HistoricalIndex, PUBLISH_TIME_RE
 
 logger = logging.getLogger(__name__)
 
 
-class BetfairStream:
-    """Socket holder, connects to betfair and
-    pushes any received data to listener
+class BaseBetfairStream(abc.ABC):
+    """Stream api requests shared by BetfairStream and
+    AsyncBetfairStream, messages are built here and sent
+    using the transport of the subclass (`_request`
+    returns the unique id or, if async, an awaitable).
     """
 
-    __port = 443
-    __CRLF = "\r\n"
+    __CRLF = b"\r\n"
     __encoding = "utf-8"
 
     HOSTS = collections.defaultdict(
@@ -34,70 +48,25 @@ class BetfairStream:
         app_key: str,
         session_token: str,
         timeout: float,
-        buffer_size: int,
         host: Optional[str],
     ):
         self._unique_id = unique_id
+        self._unique_ids = itertools.count(unique_id + 1)  # shared by ShardedStream
         self.listener = listener
         self.app_key = app_key
         self.session_token = session_token
         self.timeout = timeout
-        self.buffer_size = buffer_size
         self.host = self.HOSTS[host]
         self.receive_count = 0
         self.datetime_last_received = None
 
-        self._socket = None
         self._running = False
 
-    def start(self) -> None:
-        """Starts read loop, connects/authenticates
-        if not already running.
-        """
-        if not self._running:
-            self._connect()
-            self.authenticate()
-        self._read_loop()
-
-    def stop(self) -> None:
-        """Stops read loop and closes socket if it has been created."""
-        self._running = False
-
-        if self._socket is None:
-            return
-        # attempt graceful shutdown
-        try:
-            self._socket.shutdown(socket.SHUT_RDWR)
-        except socket.error:
-            pass
-        # close socket
-        try:
-            self._socket.close()
-        except socket.error:
-            pass
-        self._socket = None
-
-    def authenticate(self) -> int:
-        """Authentication request."""
-        unique_id = self.new_unique_id()
-        message = {
-            "op": "authentication",
-            "id": unique_id,
-            "appKey": self.app_key,
-            "session": self.session_token,
-        }
-        self._send(message)
-        # wait for response
-        received_data = self._receive_all()
-        self._data(received_data)
-        return unique_id
-
     def heartbeat(self) -> int:
         """Heartbeat request to keep session alive."""
         unique_id = self.new_unique_id()
         message = {"op": "heartbeat", "id": unique_id}
-        self._send(message)
-        return unique_id
+        return self._request(message)
 
     def subscribe_to_markets(
         self,
@@ -139,8 +108,7 @@ class BetfairStream:
         else:
             self.listener.register_stream(unique_id, "marketSubscription")
         self.listener.conflate_ms = conflate_ms
-        self._send(message)
-        return unique_id
+        return self._request(message)
 
     def subscribe_to_orders(
         self,
@@ -179,31 +147,138 @@ class BetfairStream:
         else:
             self.listener.register_stream(unique_id, "orderSubscription")
         self.listener.conflate_ms = conflate_ms
-        self._send(message)
-        return unique_id
+        return self._request(message)
 
     def subscribe_to_races(self) -> int:
         """Race subscription request."""
         unique_id = self.new_unique_id()
         message = {"op": "raceSubscription", "id": unique_id}
         self.listener.register_stream(unique_id, "raceSubscription")
-        self._send(message)
-        return unique_id
+        return self._request(message)
 
     def subscribe_to_cricket_matches(self) -> int:
         unique_id = self.new_unique_id()
         message = {"op": "cricketSubscription", "id": unique_id}
         self.listener.register_stream(unique_id, "cricketSubscription")
-        self._send(message)
-        return unique_id
+        return self._request(message)
 
     def new_unique_id(self) -> int:
-        self._unique_id += 1
+        self._unique_id = next(self._unique_ids)
         return self._unique_id
 
+    def _authentication_message(self) -> dict:
+        return {
+            "op": "authentication",
+            "id": self.new_unique_id(),
+            "appKey": self.app_key,
+            "session": self.session_token,
+        }
+
+    def _encode(self, message: dict) -> bytes:
+        """Dumps message and adds CRLF.
+
+        :param message: Data to be sent to Betfair.
+        """
+        message_dumped = json.dumps(message)
+        if not isinstance(
+            message_dumped, bytes
+        ):  # handles orjson as `orjson.dumps -> bytes` but `json.dumps -> str`
+            message_dumped = message_dumped.encode(encoding=self.__encoding)
+        return message_dumped + self.__CRLF
+
+    @abc.abstractmethod
+    def _request(self, message: dict):
+        """Sends the message, returns the unique id."""
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+
+class BetfairStream(BaseBetfairStream):
+    """Socket holder, connects to betfair and
+    pushes any received data to listener
+    """
+
+    __port = 443
+    __CRLF_BYTES = b"\r\n"
+
+    def __init__(
+        self,
+        unique_id: int,
+        listener: BaseListener,
+        app_key: str,
+        session_token: str,
+        timeout: float,
+        buffer_size: int,
+        host: Optional[str],
+        max_buffer_size: int = 2**20,
+        batch: bool = False,
+    ):
+        """
+        :param int unique_id: Id used to start unique id's of the stream
+        :param BaseListener listener: Listener object
+        :param str app_key: App key
+        :param str session_token: Session token
+        :param float timeout: Socket timeout
+        :param int buffer_size: Initial socket receive size
+        :param str host: Host endpoint (prod (default), integration or sports_data)
+        :param int max_buffer_size: Receive size grows toward the observed
+        frame size up to this limit (set to buffer_size to disable)
+        :param bool batch: Pass all complete lines from a read to
+        listener.on_data_batch rather than on_data per line
+        """
+        super(BetfairStream, self).__init__(
+            unique_id, listener, app_key, session_token, timeout, host
+        )
+        self.buffer_size = buffer_size
+        self.max_buffer_size = max(max_buffer_size, buffer_size)
+        self.batch = batch
+
+        self._socket = None
+        self._buffer = bytearray()  # received data not yet framed
+        self._chunk = bytearray(buffer_size)  # reused by recv_into
+
+    def start(self) -> None:
+        """Starts read loop, connects/authenticates
+        if not already running.
+        """
+        if not self._running:
+            self._connect()
+            self.authenticate()
+        self._read_loop()
+
+    def stop(self) -> None:
+        """Stops read loop and closes socket if it has been created."""
+        self._running = False
+
+        if self._socket is None:
+            return
+        # attempt graceful shutdown
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except socket.error:
+            pass
+        # close socket
+        try:
+            self._socket.close()
+        except socket.error:
+            pass
+        self._socket = None
+
+    def authenticate(self) -> int:
+        """Authentication request."""
+        message = self._authentication_message()
+        self._send(message)
+        # wait for response
+        received_data = self._receive_all()
+        self._data(received_data)
+        return message["id"]
+
     def _connect(self) -> None:
         """Creates socket and sets running to True."""
         self._socket = self._create_socket()
+        self._buffer = bytearray()
         self._running = True
         # wait for response
         received_data = self._receive_all()
@@ -226,26 +301,39 @@ class BetfairStream:
         """Read loop, splits by CRLF and pushes received data
         to _data.
         """
+        crlf = self.__CRLF_BYTES
         while self._running:
             received_data_raw = self._receive_all()
             if self._running:
                 self.receive_count += 1
                 self.datetime_last_received = utcnow()
-                received_data_split = received_data_raw.split(self.__CRLF)
+                received_data_split = [
+                    received_data
+                    for received_data in received_data_raw.split(crlf)
+                    if received_data
+                ]
+                if self.batch:
+                    if received_data_split:
+                        self._data_batch(received_data_split)
+                    continue
                 for received_data in received_data_split:
-                    if received_data:
-                        self._data(received_data)
+                    self._data(received_data)
 
-    def _receive_all(self) -> Optional[str]:
-        """Whilst socket is running receives data from socket,
-        till CRLF is detected.
+    def _receive_all(self) -> Optional[bytes]:
+        """Whilst socket is running receives data from socket
+        into the buffer till CRLF is detected, returns all
+        complete lines (bytes), any partial line is kept in
+        the buffer for the next call.
         """
-        (data, part) = ("", "")
-        crlf_bytes = bytes(self.__CRLF, encoding=self.__encoding)
+        crlf = self.__CRLF_BYTES
+        buffer = self._buffer
+        chunk = self._chunk
+        view = memoryview(chunk)
+        end = -1
 
-        while self._running and part[-2:] != crlf_bytes:
+        while self._running:
             try:
-                part = self._socket.recv(self.buffer_size)
+                size = self._socket.recv_into(chunk)
             except (socket.timeout, socket.error) as e:
                 if self._running:
                     self.stop()
@@ -253,8 +341,8 @@ class BetfairStream:
                 else:
                     return  # 133, prevents error if stop is called mid recv
 
-            # an empty string indicates the server shutdown the socket
-            if len(part) == 0:
+            # zero bytes indicates the server shutdown the socket
+            if size == 0:
                 if self._running:
                     self.stop()
                     raise SocketError(
@@ -264,19 +352,59 @@ class BetfairStream:
                 else:
                     return  # 165, prevents error if stop is called mid recv
 
-            data += part.decode(self.__encoding)
+            # only scan the newly received bytes (+1 in case CRLF is split)
+            start = max(len(buffer) - 1, 0)
+            buffer += view[:size]
+            end = buffer.rfind(crlf, start)
+            if end != -1:
+                break
+
+        if end == -1:
+            return b""
+        end += 2
+        data = bytes(buffer[:end])
+        del buffer[:end]
+        if end > len(chunk) and len(chunk) < self.max_buffer_size:
+            self._grow_buffer(end)
         return data
 
-    def _data(self, received_data: str) -> None:
+    def _grow_buffer(self, frame_size: int) -> None:
+        """Grows the receive buffer to the next power of two
+        above the frame size (capped at max_buffer_size) so
+        large images need fewer recv calls.
+
+        :param frame_size: Size of the frame just received.
+        """
+        size = min(1 << (frame_size - 1).bit_length(), self.max_buffer_size)
+        logger.debug(
+            "[Connect: %s]: Receive buffer grown from %s to %s",
+            self._unique_id,
+            len(self._chunk),
+            size,
+        )
+        self.buffer_size = size
+        self._chunk = bytearray(size)
+
+    def _data(self, received_data: bytes) -> None:
         """Sends data to listener, if False is returned; socket
         is closed.
 
-        :param received_data: Decoded data received from socket.
+        :param received_data: Data (line) received from socket.
         """
         if self.listener.on_data(received_data) is False:
             self.stop()
             raise ListenerError(self.listener.connection_id, received_data)
 
+    def _data_batch(self, received_data: list) -> None:
+        """Sends all lines from a read to listener, if False
+        is returned; socket is closed.
+
+        :param received_data: Data (lines) received from socket.
+        """
+        if self.listener.on_data_batch(received_data) is False:
+            self.stop()
+            raise ListenerError(self.listener.connection_id, received_data)
+
     def _send(self, message: dict) -> None:
         """If not running connects socket and
         authenticates. Adds CRLF and sends message
@@ -288,15 +416,7 @@ class BetfairStream:
             self._connect()
             self.authenticate()
 
-        message_dumped = json.dumps(message)
-
-        if not isinstance(
-            message_dumped, bytes
-        ):  # handles orjson as `orjson.dumps -> bytes` but `json.dumps -> str`
-            message_dumped = message_dumped.encode(encoding=self.__encoding)
-        crlf = bytes(self.__CRLF, encoding=self.__encoding)
-        message_dumped += crlf
-
+        message_dumped = self._encode(message)
         logger.debug(
             "[Subscription: %s] Sending: %s", self._unique_id, repr(message_dumped)
         )
@@ -306,9 +426,9 @@ class BetfairStream:
             self.stop()
             raise SocketError("[Connect: %s]: Socket %s" % (self._unique_id, e))
 
-    @property
-    def running(self) -> bool:
-        return self._running
+    def _request(self, message: dict) -> int:
+        self._send(message)
+        return message["id"]
 
     def __str__(self) -> str:
         return "<BetfairStream [%s]>" % ("running" if self._running else "not running")
@@ -317,25 +437,223 @@ class BetfairStream:
         return "<BetfairStream>"
 
 
+class AsyncBetfairStream(BaseBetfairStream):
+    """asyncio version of 'Betfair Stream', connects
+    to betfair using asyncio streams and pushes any
+    received data to listener, allowing multiple
+    connections to be driven from a single event loop,
+    requests (heartbeat / subscribe_to_*) are awaited.
+    """
+
+    __port = 443
+    __CRLF = b"\r\n"
+
+    def __init__(
+        self,
+        unique_id: int,
+        listener: BaseListener,
+        app_key: str,
+        session_token: str,
+        timeout: float,
+        limit: int,
+        host: Optional[str],
+    ):
+        """
+        :param int unique_id: Id used to start unique id's of the stream
+        :param BaseListener listener: Listener object
+        :param str app_key: App key
+        :param str session_token: Session token
+        :param float timeout: Read/connect timeout
+        :param int limit: Max size of a single line (StreamReader buffer limit)
+        :param str host: Host endpoint (prod (default), integration or sports_data)
+        """
+        super(AsyncBetfairStream, self).__init__(
+            unique_id, listener, app_key, session_token, timeout, host
+        )
+        self.limit = limit
+
+        self._reader = None
+        self._writer = None
+
+    async def start(self) -> None:
+        """Starts read loop, connects/authenticates
+        if not already running.
+        """
+        if not self._running:
+            await self._connect()
+            await self.authenticate()
+        await self._read_loop()
+
+    async def stop(self) -> None:
+        """Stops read loop and closes connection if it has been created."""
+        self._running = False
+
+        writer = self._writer
+        if writer is None:
+            return
+        self._reader = None
+        self._writer = None
+        try:
+            writer.close()
+            await writer.wait_closed()
+        except (OSError, RuntimeError):
+            pass
+
+    async def authenticate(self) -> int:
+        """Authentication request."""
+        message = self._authentication_message()
+        await self._send(message)
+        # wait for response
+        received_data = await self._receive()
+        await self._data(received_data)
+        return message["id"]
+
+    async def _connect(self) -> None:
+        """Opens connection and sets running to True."""
+        self._reader, self._writer = await self._open_connection()
+        self._running = True
+        # wait for response
+        received_data = await self._receive()
+        await self._data(received_data)
+
+    async def _open_connection(self) -> tuple:
+        """Opens ssl connection to stream api."""
+        context = ssl.create_default_context()
+        try:
+            return await asyncio.wait_for(
+                asyncio.open_connection(
+                    self.host,
+                    self.__port,
+                    ssl=context,
+                    server_hostname=self.host,
+                    limit=self.limit,
+                ),
+                self.timeout,
+            )
+        except (asyncio.TimeoutError, OSError) as e:
+            raise SocketError("[Connect: %s]: Socket %s" % (self._unique_id, e))
+
+    async def _read_loop(self) -> None:
+        """Read loop, pushes each received line to _data."""
+        while self._running:
+            received_data = await self._receive()
+            if self._running:
+                self.receive_count += 1
+                self.datetime_last_received = utcnow()
+                await self._data(received_data)
+
+    async def _receive(self) -> Optional[bytes]:
+        """Whilst running receives data from the
+        connection till CRLF is detected.
+        """
+        if not self._running:
+            return  # stop called
+        try:
+            data = await asyncio.wait_for(
+                self._reader.readuntil(self.__CRLF), self.timeout
+            )
+        except asyncio.IncompleteReadError:
+            # an incomplete read indicates the server shutdown the connection
+            if self._running:
+                await self.stop()
+                raise SocketError(
+                    "[Connect: %s]: Connection closed by server" % (self._unique_id,)
+                )
+            return
+        except (asyncio.TimeoutError, asyncio.LimitOverrunError, OSError) as e:
+            if self._running:
+                await self.stop()
+                raise SocketError("[Connect: %s]: Socket %s" % (self._unique_id, e))
+            return
+        return data
+
+    async def _data(self, received_data: bytes) -> None:
+        """Sends data to listener, if False is returned;
+        connection is closed.
+
+        :param received_data: Data (line) received from connection.
+        """
+        if self.listener.on_data(received_data) is False:
+            await self.stop()
+            raise ListenerError(self.listener.connection_id, received_data)
+
+    async def _send(self, message: dict) -> None:
+        """If not running connects and authenticates.
+        Adds CRLF and sends message to Betfair.
+
+        :param message: Data to be sent to Betfair.
+        """
+        if not self._running:
+            await self._connect()
+            await self.authenticate()
+
+        message_dumped = self._encode(message)
+        logger.debug(
+            "[Subscription: %s] Sending: %s", self._unique_id, repr(message_dumped)
+        )
+        try:
+            self._writer.write(message_dumped)
+            await asyncio.wait_for(self._writer.drain(), self.timeout)
+        except (asyncio.TimeoutError, OSError) as e:
+            await self.stop()
+            raise SocketError("[Connect: %s]: Socket %s" % (self._unique_id, e))
+
+    async def _request(self, message: dict) -> int:
+        await self._send(message)
+        return message["id"]
+
+    def __str__(self) -> str:
+        return "<AsyncBetfairStream [%s]>" % (
+            "running" if self._running else "not running"
+        )
+
+    def __repr__(self) -> str:
+        return "<AsyncBetfairStream>"
+
+
 class HistoricalStream:
     """Copy of 'Betfair Stream' for parsing
     historical data.
     """
 
     def __init__(
-        self, file_path: str, listener: BaseListener, operation: str, unique_id: int
+        self,
+        file_path: Union[str, os.PathLike, IO[bytes]],
+        listener: BaseListener,
+        operation: str,
+        unique_id: int,
+        threaded: bool = False,
+        buffer_size: int = 2**20,
+        market_ids: Optional[list] = None,
+        start_publish_time: Optional[int] = None,
+        end_publish_time: Optional[int] = None,
+        index: Optional[HistoricalIndex] = None,
     ):
         """
-        :param str file_path: Directory of betfair data
+        :param file_path: Path to betfair data (bz2/gz/xz/zst compressed or not) or
+        binary file-like object
         :param BaseListener listener: Listener object
         :param str operation: Operation type
         :param int unique_id: Stream id (added to updates)
+        :param bool threaded: Read/decompress the file in a background thread
+        :param int buffer_size: Read buffer size
+        :param list market_ids: Only process lines containing these markets
+        :param int start_publish_time: Output updates from this publish time (epoch ms)
+        :param int end_publish_time: Stop after this publish time (epoch ms)
+        :param HistoricalIndex index: Index used to seek (built if filtering and not provided)
         """
         self.file_path = file_path
         self.listener = listener
         self.operation = operation
         self.unique_id = unique_id
+        self.threaded = threaded
+        self.buffer_size = buffer_size
+        self.market_ids = market_ids
+        self.start_publish_time = start_publish_time
+        self.end_publish_time = end_publish_time
+        self.index = index
         self._running = False
+        self._warming_up = False  # processing lines before start_publish_time
 
     def start(self) -> None:
         self._running = True
@@ -346,8 +664,8 @@ class HistoricalStream:
 
     def _read_loop(self) -> None:
         self.listener.register_stream(self.unique_id, self.operation)
-        with open(self.file_path, "r") as f:
-            for update in f:
+        with self._open() as f:
+            for update in self._lines(f):
                 if self.listener.on_data(update) is False:
                     # if on_data returns an error stop the stream and raise error
                     self.stop()
@@ -358,30 +676,228 @@ class HistoricalStream:
                 # if f has finished, also stop the stream
                 self.stop()
 
+    @property
+    def filtered(self) -> bool:
+        return bool(
+            self.market_ids
+            or self.start_publish_time is not None
+            or self.end_publish_time is not None
+        )
+
+    def _lines(self, f: IO[bytes]) -> Iterator[bytes]:
+        if self.filtered:
+            return self._filter(f)
+        return self._read_ahead(f) if self.threaded else f
+
+    def _filter(self, f: IO[bytes]) -> Iterator[bytes]:
+        """Seeks to the latest image of the markets before
+        start_publish_time and yields lines (containing the
+        markets) till end_publish_time, output is disabled
+        whilst processing lines before start_publish_time.
+
+        The index is only built for uncompressed seekable
+        files, otherwise lines are filtered in a single
+        forward pass using the publish time of each line.
+        """
+        if self.index is None and self._indexable(f):
+            self.index = HistoricalIndex.build(f)
+        if self.index is not None and f.seekable():
+            # position is the byte offset of each line
+            seek, start, end = self.index.seek(
+                self.market_ids, self.start_publish_time, self.end_publish_time
+            )
+            f.seek(seek)
+            offset = seek
+        else:
+            # position is the (latest) publish time of each line
+            offset = None
+            seek = 0
+            start = self.start_publish_time or 0
+            end = (
+                sys.maxsize
+                if self.end_publish_time is None
+                else self.end_publish_time + 1
+            )
+        timed = offset is None and (start or end != sys.maxsize)
+        needles = [b'"%s"' % m.encode() for m in self.market_ids or []]
+        stream = getattr(self.listener, "stream", None)
+        output_queue = getattr(stream, "output_queue", None)
+        position = seek
+        self._warming_up = position < start
+        if self._warming_up and output_queue:
+            stream.output_queue = None
+        try:
+            for line in self._read_ahead(f) if self.threaded else f:
+                if offset is not None:
+                    position = offset
+                    offset += len(line)
+                elif timed:
+                    match = PUBLISH_TIME_RE.search(line)
+                    if match:
+                        position = int(match.group(1))
+                if position >= end:
+                    break
+                elif self._warming_up and position >= start:
+                    self._warming_up = False
+                    if output_queue:
+                        stream.output_queue = output_queue
+                if needles and not any(needle in line for needle in needles):
+                    continue
+                yield line
+        finally:
+            self._warming_up = False
+            if output_queue:
+                stream.output_queue = output_queue
+
+    @staticmethod
+    def _indexable(f: IO[bytes]) -> bool:
+        # compressed files are seekable but building the index decompresses twice
+        return f.seekable() and not isinstance(
+            getattr(f, "raw", f), (bz2.BZ2File, gzip.GzipFile, lzma.LZMAFile)
+        )
+
+    def _open(self) -> IO[bytes]:
+        """Opens file_path in binary mode, decompressing
+        (streaming) based on the file extension, file-like
+        objects are used as is and not closed.
+        """
+        if hasattr(self.file_path, "read"):
+            return contextlib.nullcontext(self.file_path)
+        file_path = os.fspath(self.file_path)
+        if file_path.endswith(".bz2"):
+            raw = bz2.BZ2File(file_path)
+        elif file_path.endswith(".gz"):
+            raw = gzip.GzipFile(file_path)
+        elif file_path.endswith(".xz"):
+            raw = lzma.LZMAFile(file_path)
+        elif file_path.endswith(".zst"):
+            if zstandard is None:
+                raise ImportError("zstandard required to read .zst files")
+            raw = zstandard.ZstdDecompressor().stream_reader(
+                open(file_path, "rb"), closefd=True
+            )
+        else:
+            return open(file_path, "rb", buffering=self.buffer_size)
+        return io.BufferedReader(raw, self.buffer_size)
+
+    def _read_ahead(self, f: IO[bytes]) -> Iterator[bytes]:
+        """Reads lines from f in a background thread, decompression
+        releases the GIL so this runs in parallel to the parsing.
+        """
+        lines_queue = queue.Queue(maxsize=8)
+        stopped = threading.Event()
+
+        def read() -> None:
+            try:
+                while not stopped.is_set():
+                    lines = f.readlines(self.buffer_size)
+                    lines_queue.put(lines)
+                    if not lines:
+                        break
+            except Exception as e:
+                lines_queue.put(e)
+
+        thread = threading.Thread(target=read, name="HistoricalRead", daemon=True)
+        thread.start()
+        try:
+            while True:
+                lines = lines_queue.get()
+                if isinstance(lines, Exception):
+                    raise lines
+                elif not lines:
+                    break
+                yield from lines
+        finally:
+            # unblock and wait for the thread before the file is closed
+            stopped.set()
+            while thread.is_alive():
+                try:
+                    lines_queue.get(timeout=0.01)
+                except queue.Empty:
+                    pass
+            thread.join()
+
 
 class HistoricalGeneratorStream(HistoricalStream):
     """Copy of 'Betfair Stream' for parsing
     historical data (no threads).
     """
 
+    def __init__(
+        self,
+        *args,
+        conflate_ms: Optional[int] = None,
+        changed_only: bool = False,
+        **kwargs,
+    ):
+        """
+        :param int conflate_ms: Only yield once per conflate_ms (publish time),
+        every update is still applied to the cache
+        :param bool changed_only: Only yield markets updated since the previous yield
+        (listener.snap(changed_only=True))
+        """
+        super(HistoricalGeneratorStream, self).__init__(*args, **kwargs)
+        self.conflate_ms = conflate_ms
+        self.changed_only = changed_only
+
     def get_generator(self):
+        if self.conflate_ms is not None or self.changed_only:
+            return self._read_loop_conflated
         return self._read_loop
 
     def _read_loop(self) -> dict:
         self._running = True
         self.listener.register_stream(self.unique_id, self.operation)
-        with open(self.file_path, "r") as f:
-            for update in f:
+        with self._open() as f:
+            for update in self._lines(f):
                 if self.listener.on_data(update) is False:
                     # if on_data returns an error stop the stream and raise error
                     self.stop()
                     raise ListenerError("HISTORICAL", update)
                 if not self._running:
                     break
-                else:
-                    data = self.listener.snap()
+                elif not self._warming_up:
+                    data = self.listener.snap(self.market_ids)
                     if data:  # can return empty list
                         yield data
             else:
                 # if f has finished, also stop the stream
                 self.stop()
+
+    def _read_loop_conflated(self) -> dict:
+        """As _read_loop but updates are grouped into windows
+        (by publish time) of conflate_ms, a snap is yielded
+        before the first update of the next window is applied
+        and at the end of the file.
+        """
+        self._running = True
+        self.listener.register_stream(self.unique_id, self.operation)
+        conflate_ms = max(self.conflate_ms or 0, 1)  # 0: every publish time
+        window_start = None  # publish time of first update in window
+        with self._open() as f:
+            for update in self._lines(f):
+                match = PUBLISH_TIME_RE.search(update)
+                if match and window_start is not None:
+                    if int(match.group(1)) - window_start >= conflate_ms:
+                        data = self._snap()
+                        window_start = None
+                        if data:
+                            yield data
+                if self.listener.on_data(update) is False:
+                    # if on_data returns an error stop the stream and raise error
+                    self.stop()
+                    raise ListenerError("HISTORICAL", update)
+                if not self._running:
+                    break
+                elif match and window_start is None and not self._warming_up:
+                    window_start = int(match.group(1))
+            else:
+                # if f has finished, also stop the stream
+                self.stop()
+                if window_start is not None:
+                    data = self._snap()
+                    if data:
+                        yield data
+
+    def _snap(self) -> list:
+        return self.listener.snap(self.market_ids, changed_only=self.changed_only)
@@ -1,3 +1,6 @@
+import logging
+from array import array
+from bisect import bisect_left, insort
 from typing import Union, Optional
 
 from ..resources import (
@@ -9,14 +12,46 @@ from ..resources import (
     Race,
     CricketMatch,
 )
-from ..resources.bettingresources import CurrentOrder
+from ..resources.bettingresources import CurrentOrder, PriceSize
+from ..resources.streamingresources import (
+    RunnerBookEXStream,
+    RunnerBookSPStream,
+    RunnerBookStream,
+)
 from ..enums import (
     StreamingOrderType,
     StreamingPersistenceType,
     StreamingSide,
     StreamingStatus,
 )
-from ..utils import create_date_string
+from ..utils import PRICE_TICKS, PRICE_TICK_INDEX, create_date_string
+from .snapshot import (
+    MarketBookSnapshot,
+    RunnerBookExSnapshot,
+    RunnerBookSPSnapshot,
+    RunnerBookSnapshot,
+    create_ladder,
+    freeze,
+)
+
+logger = logging.getLogger(__name__)
+
+# market data filter fields: runner change keys
+MARKET_DATA_FIELDS = {
+    "EX_BEST_OFFERS_DISP": ("bdatb", "bdatl"),
+    "EX_BEST_OFFERS": ("batb", "batl"),
+    "EX_ALL_OFFERS": ("atb", "atl"),
+    "EX_TRADED": ("trd",),
+    "EX_TRADED_VOL": ("tv",),
+    "EX_LTP": ("ltp",),
+    "EX_MARKET_DEF": (),
+    "SP_TRADED": ("spb", "spl"),
+    "SP_PROJECTED": ("spn", "spf"),
+}
+
+
+class OffLadderPrice(ValueError):
+    """Price not on the CLASSIC tick ladder."""
 
 
 class Available:
@@ -30,6 +65,7 @@ class Available:
         "deletion_select",
         "reverse",
         "serialised",
+        "stale",
     ]
 
     def __init__(self, prices: list, deletion_select: int, reverse: bool = False):
@@ -42,6 +78,7 @@ class Available:
         self.deletion_select = deletion_select
         self.reverse = reverse
         self.serialised = []
+        self.stale = False  # updated without serialisation
         self.update(prices or [], True)
 
     def update(self, book_update: list, active: bool) -> None:
@@ -74,22 +111,172 @@ class Available:
             self._sort_order_book()
         if active:
             self.serialise()
+        else:
+            self.stale = True
 
     def clear(self) -> None:
         self.order_book = {}
         self.serialise()
 
+    def get_size(self, key: float) -> float:
+        book = self.order_book.get(key)
+        return book[self.deletion_select] if book else 0
+
+    @property
+    def total_size(self) -> float:
+        deletion_select = self.deletion_select
+        return sum(book[deletion_select] for book in self.order_book.values())
+
     def serialise(self) -> None:
         self.serialised = [book[-1] for book in self.order_book.values()]
 
     def refresh(self) -> None:
         self._sort_order_book()
         self.serialise()
+        self.stale = False
 
     def _sort_order_book(self) -> None:
         self.order_book = dict(sorted(self.order_book.items(), reverse=self.reverse))
 
 
+class CompactAvailable(Available):
+    """
+    Available without the per level copy of the
+    streaming update, levels are held as their
+    serialised dict only (streaming_update is
+    left untouched).
+    """
+
+    __slots__ = []
+
+    def update(self, book_update: list, active: bool) -> None:
+        deletion_select, order_book = (
+            self.deletion_select,
+            self.order_book,
+        )  # local vars
+        _sort = False
+        for book in book_update:
+            key = book[0]  # price or position
+            size = book[deletion_select]
+            if size == 0:
+                # remove price/size
+                try:
+                    del order_book[key]
+                except KeyError:
+                    continue
+            else:
+                if active and key not in order_book:
+                    # new price requiring a reorder
+                    # to the book.
+                    _sort = True
+                # update book
+                order_book[key] = {"price": book[deletion_select - 1], "size": size}
+        if _sort:
+            self._sort_order_book()
+        if active:
+            self.serialise()
+        else:
+            self.stale = True
+
+    def get_size(self, key: float) -> float:
+        book = self.order_book.get(key)
+        return book["size"] if book else 0
+
+    @property
+    def total_size(self) -> float:
+        return sum(book["size"] for book in self.order_book.values())
+
+    def serialise(self) -> None:
+        self.serialised = list(self.order_book.values())
+
+
+class TickAvailable:
+    """
+    Price keyed data structure (atb/atl/trd/spb/spl) backed
+    by preallocated arrays indexed on the betfair CLASSIC
+    tick ladder, levels are updated in place and the book
+    never requires sorting.
+    """
+
+    __slots__ = [
+        "order_book",
+        "sizes",
+        "levels",
+        "reverse",
+        "serialised",
+        "stale",
+    ]
+
+    def __init__(self, prices: list, reverse: bool = False):
+        """
+        :param list prices: Current prices
+        :param bool reverse: Used for ordering
+        """
+        self.order_book = []  # sorted tick index of each populated level
+        self.sizes = array("d", bytes(8 * len(PRICE_TICKS)))
+        self.levels = [None] * len(PRICE_TICKS)
+        self.reverse = reverse
+        self.serialised = []
+        self.stale = False  # updated without serialisation
+        self.update(prices or [], True)
+
+    def update(self, book_update: list, active: bool) -> None:
+        order_book, sizes, levels = (
+            self.order_book,
+            self.sizes,
+            self.levels,
+        )  # local vars
+        for price, size in book_update:
+            try:
+                tick = PRICE_TICK_INDEX[price]
+            except KeyError:
+                raise OffLadderPrice(
+                    "Price %s is not on the CLASSIC price ladder" % price
+                ) from None
+            if size == 0:
+                # remove price/size
+                if levels[tick] is None:
+                    continue
+                del order_book[bisect_left(order_book, tick)]
+                levels[tick] = None
+                sizes[tick] = 0
+            else:
+                if levels[tick] is None:
+                    insort(order_book, tick)
+                # serialise once and cache in the level
+                levels[tick] = {"price": price, "size": size}
+                sizes[tick] = size
+        if active:
+            self.serialise()
+        else:
+            self.stale = True
+
+    def clear(self) -> None:
+        self.order_book = []
+        self.sizes = array("d", bytes(8 * len(PRICE_TICKS)))
+        self.levels = [None] * len(PRICE_TICKS)
+        self.serialise()
+
+    def get_size(self, price: float) -> float:
+        tick = PRICE_TICK_INDEX.get(price)
+        return 0 if tick is None else self.sizes[tick]
+
+    @property
+    def total_size(self) -> float:
+        return sum(self.sizes)
+
+    def serialise(self) -> None:
+        levels = self.levels
+        if self.reverse:
+            self.serialised = [levels[tick] for tick in reversed(self.order_book)]
+        else:
+            self.serialised = [levels[tick] for tick in self.order_book]
+
+    def refresh(self) -> None:
+        self.serialise()
+        self.stale = False
+
+
 class RunnerBookCache:
     def __init__(
         self,
@@ -110,20 +297,31 @@ class RunnerBookCache:
         spl: list = None,
         hc: int = 0,
         definition: dict = None,
+        tick_ladder: bool = False,
+        zero_copy: bool = False,
     ):
         self.selection_id = id
         self.lightweight = lightweight
         self.last_price_traded = ltp
         self.total_matched = tv
-        self.traded = Available(trd, 1)
-        self.available_to_back = Available(atb, 1, True)
-        self.best_available_to_back = Available(batb, 2)
-        self.best_display_available_to_back = Available(bdatb, 2)
-        self.available_to_lay = Available(atl, 1)
-        self.best_available_to_lay = Available(batl, 2)
-        self.best_display_available_to_lay = Available(bdatl, 2)
-        self.starting_price_back = Available(spb, 1, True)
-        self.starting_price_lay = Available(spl, 1)
+        _available = CompactAvailable if zero_copy else Available
+        if tick_ladder:
+            self.traded = TickAvailable(trd)
+            self.available_to_back = TickAvailable(atb, True)
+            self.available_to_lay = TickAvailable(atl)
+            self.starting_price_back = TickAvailable(spb, True)
+            self.starting_price_lay = TickAvailable(spl)
+        else:
+            self.traded = _available(trd, 1)
+            self.available_to_back = _available(atb, 1, True)
+            self.available_to_lay = _available(atl, 1)
+            self.starting_price_back = _available(spb, 1, True)
+            self.starting_price_lay = _available(spl, 1)
+        self.traded_volume = self.traded.total_size  # running total of traded
+        self.best_available_to_back = _available(batb, 2)
+        self.best_display_available_to_back = _available(bdatb, 2)
+        self.best_available_to_lay = _available(batl, 2)
+        self.best_display_available_to_lay = _available(bdatl, 2)
         self.starting_price_near = spn
         self.starting_price_far = spf
         self.handicap = hc
@@ -135,6 +333,8 @@ class RunnerBookCache:
         self.update_definition(self.definition)
         self.serialised = {}  # cache is king
         self.resource = None
+        self.snapshot = None  # immutable snapshot, reset on serialise
+        self._snapshot_ladders = ((), ())  # (serialised, snapshot) ladders
 
     def update_definition(self, definition: dict) -> None:
         self.definition = definition
@@ -144,11 +344,54 @@ class RunnerBookCache:
         self._definition_adjustment_factor = self.definition.get("adjustmentFactor")
         self._definition_removal_date = self.definition.get("removalDate")
 
+    def remove_tick_ladder(self) -> None:
+        # off ladder price received, convert to the dict backed ladders
+        _available = type(self.best_available_to_back)
+        for name, reverse in (
+            ("traded", False),
+            ("available_to_back", True),
+            ("available_to_lay", False),
+            ("starting_price_back", True),
+            ("starting_price_lay", False),
+        ):
+            ladder = getattr(self, name)
+            if isinstance(ladder, TickAvailable):
+                prices = [
+                    [level["price"], level["size"]] for level in ladder.levels if level
+                ]
+                setattr(self, name, _available(prices, 1, reverse))
+        self.traded_volume = round(self.traded.total_size, 2)
+
     def update_traded(self, traded_update: list, active: bool) -> None:
         if not traded_update:
             self.traded.clear()
+            self.traded_volume = 0
         else:
+            get_size, sizes, delta = self.traded.get_size, {}, 0
+            for price, size in traded_update:
+                # apply in order so a repeated price is only counted once
+                previous = sizes.get(price)
+                delta += size - (get_size(price) if previous is None else previous)
+                sizes[price] = size
             self.traded.update(traded_update, active)
+            # sizes are 2dp, rounding prevents float drift in the running total
+            self.traded_volume = round(self.traded_volume + delta, 2)
+
+    def refresh(self) -> None:
+        # refresh ladders updated without serialisation
+        for available in (
+            self.traded,
+            self.available_to_back,
+            self.available_to_lay,
+            self.best_available_to_back,
+            self.best_available_to_lay,
+            self.best_display_available_to_back,
+            self.best_display_available_to_lay,
+            self.starting_price_back,
+            self.starting_price_lay,
+        ):
+            if available.stale:
+                available.refresh()
 
     def serialise_available_to_back(self) -> list:
         if self.available_to_back.order_book:
@@ -191,8 +434,80 @@ class RunnerBookCache:
             "totalMatched": self.total_matched,
             "selectionId": self.selection_id,
         }
+        self.snapshot = None
         if self.lightweight is False:  # cache resource
-            self.resource = RunnerBook(**self.serialised)
+            self.resource = self._create_resource()
+
+    def _create_resource(self) -> RunnerBook:
+        # fast path, skips the kwargs processing of RunnerBook(**serialised)
+        ex, sp = self.serialised["ex"], self.serialised["sp"]
+        return RunnerBookStream.create(
+            self.selection_id,
+            self._definition_status,
+            self.handicap,
+            self._definition_adjustment_factor,
+            self.last_price_traded,
+            self.total_matched,
+            BaseResource.strip_datetime(self._definition_removal_date),
+            RunnerBookSPStream.create(
+                self.starting_price_near,
+                self.starting_price_far,
+                [PriceSize(i["price"], i["size"]) for i in sp["backStakeTaken"]],
+                [PriceSize(i["price"], i["size"]) for i in sp["layLiabilityTaken"]],
+                self._definition_bsp,
+            ),
+            RunnerBookEXStream.create(
+                [PriceSize(i["price"], i["size"]) for i in ex["availableToBack"]],
+                [PriceSize(i["price"], i["size"]) for i in ex["availableToLay"]],
+                [PriceSize(i["price"], i["size"]) for i in ex["tradedVolume"]],
+            ),
+        )
+
+    def create_snapshot(self) -> RunnerBookSnapshot:
+        """Returns the immutable snapshot, only
+        recreated once serialised and ladders not
+        updated are shared with the previous one.
+        """
+        if self.snapshot is None:
+            serialised = self.serialised
+            ex, sp = serialised["ex"], serialised["sp"]
+            sources = (
+                ex["availableToBack"],
+                ex["availableToLay"],
+                ex["tradedVolume"],
+                sp["backStakeTaken"],
+                sp["layLiabilityTaken"],
+            )
+            previous_sources, previous_ladders = self._snapshot_ladders
+            ladders = tuple(
+                [
+                    (
+                        previous_ladders[i]
+                        if previous_sources and source is previous_sources[i]
+                        else create_ladder(source)
+                    )
+                    for i, source in enumerate(sources)
+                ]
+            )
+            self._snapshot_ladders = (sources, ladders)
+            self.snapshot = RunnerBookSnapshot(
+                serialised["selectionId"],
+                serialised["handicap"],
+                serialised["status"],
+                serialised["adjustmentFactor"],
+                serialised["removalDate"],
+                serialised["lastPriceTraded"],
+                serialised["totalMatched"],
+                RunnerBookExSnapshot(ladders[0], ladders[1], ladders[2]),
+                RunnerBookSPSnapshot(
+                    sp["nearPrice"],
+                    sp["farPrice"],
+                    ladders[3],
+                    ladders[4],
+                    sp["actualSP"],
+                ),
+            )
+        return self.snapshot
 
 
 class MarketBookCache(BaseResource):
@@ -203,6 +518,12 @@ class MarketBookCache(BaseResource):
         lightweight: bool,
         calculate_market_tv: bool,
         cumulative_runner_tv: bool,
+        tick_ladder: bool = False,
+        lazy_serialise: bool = False,
+        verify_tv: bool = False,
+        zero_copy: bool = False,
+        market_data_fields: list = None,
+        immutable: bool = False,
     ):
         super(MarketBookCache, self).__init__()
         self.active = False
@@ -211,9 +532,17 @@ class MarketBookCache(BaseResource):
         self.lightweight = lightweight
         self.calculate_market_tv = calculate_market_tv
         self.cumulative_runner_tv = cumulative_runner_tv
+        self.tick_ladder = tick_ladder
+        self.lazy_serialise = lazy_serialise
+        self.verify_tv = verify_tv
+        self.zero_copy = zero_copy
+        self.market_data_fields = market_data_fields
+        self._ignored_keys = self._create_ignored_keys(market_data_fields)
+        self.immutable = immutable
         self.total_matched = 0
         self.market_definition = {}
         self._market_definition_resource = None
+        self._market_definition_frozen = None  # snapshot, frozen on first use
         self._definition_bet_delay = None
         self._definition_version = None
         self._definition_complete = None
@@ -230,74 +559,155 @@ class MarketBookCache(BaseResource):
         self.runners = []
         self.runner_dict = {}
         self._number_of_runners = 0
+        self._traded_volume = 0  # running total of runner traded
+        self._stale_runners = set()  # lazy serialisation, processed on create_resource
 
     def update_cache(
         self, market_change: dict, publish_time: int, active: bool
     ) -> None:
         self.streaming_update = market_change
         self.publish_time = publish_time
+        # serialisation deferred till create_resource if lazy
+        serialise = active and not self.lazy_serialise
 
         if "marketDefinition" in market_change:
             self._process_market_definition(market_change["marketDefinition"])
 
-        if "tv" in market_change and not self.calculate_market_tv:
+        ignored_keys = self._ignored_keys
+        if (
+            "tv" in market_change
+            and not self.calculate_market_tv
+            and "tv" not in ignored_keys
+        ):
             self.total_matched = market_change["tv"]
 
         if "rc" in market_change:
             calculate_tv = False
             for new_data in market_change["rc"]:
+                if ignored_keys and not ignored_keys.isdisjoint(new_data):
+                    # client side projection, streaming_update remains raw
+                    new_data = {
+                        k: v for k, v in new_data.items() if k not in ignored_keys
+                    }
                 runner = self.runner_dict.get((new_data["id"], new_data.get("hc", 0)))
                 if runner:
-                    if "ltp" in new_data:
-                        runner.last_price_traded = new_data["ltp"]
-                    if "tv" in new_data:  # if runner removed tv: 0 is returned
-                        if not self.cumulative_runner_tv:
-                            runner.total_matched = new_data["tv"]
-                    if "spn" in new_data:
-                        runner.starting_price_near = new_data["spn"]
-                    if "spf" in new_data:
-                        runner.starting_price_far = new_data["spf"]
-                    if "trd" in new_data:
-                        runner.update_traded(new_data["trd"], active)
-                        if self.cumulative_runner_tv:
-                            runner.total_matched = round(
-                                sum([vol["size"] for vol in runner.traded.serialised]),
-                                2,
-                            )
-                        calculate_tv = True
-                    if "atb" in new_data:
-                        runner.available_to_back.update(new_data["atb"], active)
-                    if "atl" in new_data:
-                        runner.available_to_lay.update(new_data["atl"], active)
-                    if "batb" in new_data:
-                        runner.best_available_to_back.update(new_data["batb"], active)
-                    if "batl" in new_data:
-                        runner.best_available_to_lay.update(new_data["batl"], active)
-                    if "bdatb" in new_data:
-                        runner.best_display_available_to_back.update(
-                            new_data["bdatb"], active
-                        )
-                    if "bdatl" in new_data:
-                        runner.best_display_available_to_lay.update(
-                            new_data["bdatl"], active
-                        )
-                    if "spb" in new_data:
-                        runner.starting_price_back.update(new_data["spb"], active)
-                    if "spl" in new_data:
-                        runner.starting_price_lay.update(new_data["spl"], active)
+                    try:
+                        calculate_tv |= self._update_runner(runner, new_data, serialise)
+                    except OffLadderPrice as e:
+                        self._remove_tick_ladder(runner, e)
+                        calculate_tv |= self._update_runner(runner, new_data, serialise)
                 else:
                     runner = self._add_new_runner(**new_data)
-                if active:
+                if serialise:
                     runner.serialise()
-            if self.calculate_market_tv and calculate_tv:
-                self.total_matched = round(
-                    sum(
-                        vol["size"] for r in self.runners for vol in r.traded.serialised
-                    ),
-                    2,
-                )
+                else:
+                    self._stale_runners.add(runner)
+            if calculate_tv:
+                if self.verify_tv:
+                    self._verify_traded_volume()
+                if self.calculate_market_tv:
+                    self.total_matched = round(self._traded_volume, 2)
         self.active = active
 
+    def _update_runner(
+        self, runner: RunnerBookCache, new_data: dict, serialise: bool
+    ) -> bool:
+        # returns True if traded updated
+        if "ltp" in new_data:
+            runner.last_price_traded = new_data["ltp"]
+        if "tv" in new_data:  # if runner removed tv: 0 is returned
+            if not self.cumulative_runner_tv:
+                runner.total_matched = new_data["tv"]
+        if "spn" in new_data:
+            runner.starting_price_near = new_data["spn"]
+        if "spf" in new_data:
+            runner.starting_price_far = new_data["spf"]
+        if "atb" in new_data:
+            runner.available_to_back.update(new_data["atb"], serialise)
+        if "atl" in new_data:
+            runner.available_to_lay.update(new_data["atl"], serialise)
+        if "batb" in new_data:
+            runner.best_available_to_back.update(new_data["batb"], serialise)
+        if "batl" in new_data:
+            runner.best_available_to_lay.update(new_data["batl"], serialise)
+        if "bdatb" in new_data:
+            runner.best_display_available_to_back.update(new_data["bdatb"], serialise)
+        if "bdatl" in new_data:
+            runner.best_display_available_to_lay.update(new_data["bdatl"], serialise)
+        if "spb" in new_data:
+            runner.starting_price_back.update(new_data["spb"], serialise)
+        if "spl" in new_data:
+            runner.starting_price_lay.update(new_data["spl"], serialise)
+        if "trd" in new_data:
+            traded_volume = runner.traded_volume
+            runner.update_traded(new_data["trd"], serialise)
+            self._traded_volume = round(
+                self._traded_volume + runner.traded_volume - traded_volume, 2
+            )
+            if self.cumulative_runner_tv:
+                runner.total_matched = round(runner.traded_volume, 2)
+            return True
+        return False
+
+    def _remove_tick_ladder(self, runner: RunnerBookCache, error: ValueError) -> None:
+        logger.warning(
+            "[MarketBookCache: %s]: %s, runner %s using non tick ladder",
+            self.market_id,
+            error,
+            runner.selection_id,
+        )
+        traded_volume = runner.traded_volume
+        runner.remove_tick_ladder()
+        self._traded_volume = round(
+            self._traded_volume + runner.traded_volume - traded_volume, 2
+        )
+
+    @staticmethod
+    def _create_ignored_keys(market_data_fields: Optional[list]) -> frozenset:
+        # runner change keys not in the requested fields
+        if not market_data_fields:
+            return frozenset()
+        for field in market_data_fields:
+            if field not in MARKET_DATA_FIELDS:
+                raise ValueError("Unknown market data field: %s" % field)
+        return frozenset(
+            key
+            for field, keys in MARKET_DATA_FIELDS.items()
+            if field not in market_data_fields
+            for key in keys
+        )
+
+    def _refresh_stale_runners(self) -> None:
+        for runner in self._stale_runners:
+            runner.refresh()
+            runner.serialise()
+        self._stale_runners.clear()
+
+    def _verify_traded_volume(self) -> None:
+        # debug, compare running totals against the full sum of traded
+        for runner in self.runners:
+            traded_volume = runner.traded.total_size
+            if round(runner.traded_volume, 2) != round(traded_volume, 2):
+                logger.warning(
+                    "[MarketBookCache: %s]: runner %s traded volume %s does not match %s",
+                    self.market_id,
+                    runner.selection_id,
+                    runner.traded_volume,
+                    traded_volume,
+                )
+                runner.traded_volume = traded_volume
+                if self.cumulative_runner_tv:
+                    runner.total_matched = round(traded_volume, 2)
+        traded_volume = sum(runner.traded_volume for runner in self.runners)
+        if round(self._traded_volume, 2) != round(traded_volume, 2):
+            logger.warning(
+                "[MarketBookCache: %s]: market traded volume %s does not match %s",
+                self.market_id,
+                self._traded_volume,
+                traded_volume,
+            )
+            self._traded_volume = traded_volume
+
     def refresh_cache(self) -> None:
         for runner in self.runners:
             runner.traded.refresh()
@@ -313,6 +723,7 @@ class MarketBookCache(BaseResource):
 
     def _process_market_definition(self, market_definition: dict) -> None:
         self.market_definition = market_definition
+        self._market_definition_frozen = None
         if self.lightweight is False:  # cache resource
             self._market_definition_resource = MarketDefinition(**market_definition)
         # cache values used in serialisation to prevent duplicate <get>
@@ -345,12 +756,32 @@ class MarketBookCache(BaseResource):
                 runner = self._add_new_runner(
                     id=selection_id, hc=hc, definition=runner_definition
                 )
-            runner.serialise()
+            if self.lazy_serialise:
+                self._stale_runners.add(runner)
+            else:
+                runner.serialise()
 
     def _add_new_runner(self, **kwargs) -> RunnerBookCache:
-        runner = RunnerBookCache(lightweight=self.lightweight, **kwargs)
+        try:
+            runner = RunnerBookCache(
+                lightweight=self.lightweight,
+                tick_ladder=self._use_tick_ladder,
+                zero_copy=self.zero_copy,
+                **kwargs,
+            )
+        except OffLadderPrice as e:
+            logger.warning(
+                "[MarketBookCache: %s]: %s, runner %s using non tick ladder",
+                self.market_id,
+                e,
+                kwargs["id"],
+            )
+            runner = RunnerBookCache(
+                lightweight=self.lightweight, zero_copy=self.zero_copy, **kwargs
+            )
         self.runners.append(runner)
         self._number_of_runners = len(self.runners)
+        self._traded_volume += runner.traded_volume
         # update runner_dict
         self.runner_dict = {
             (runner.selection_id, runner.handicap): runner for runner in self.runners
@@ -362,20 +793,67 @@ class MarketBookCache(BaseResource):
         unique_id: int,
         snap: bool = False,
         publish_time: Optional[int] = None,
-    ) -> Union[dict, MarketBook]:
+    ) -> Union[dict, MarketBook, MarketBookSnapshot]:
+        if self._stale_runners:
+            self._refresh_stale_runners()
+        if self.immutable:
+            return self.create_snapshot(unique_id, snap)
         data = self.serialise
         data["streaming_unique_id"] = unique_id
         data["streaming_snap"] = snap
         if self.lightweight:
             return data
         else:
-            _runners = data.pop("runners", [])
-            market_book = MarketBook(
-                market_definition=self._market_definition_resource, runners=[], **data
+            return MarketBook.create(
+                data,
+                [r.resource for r in self.runners],
+                self._market_definition_resource,
+                data.pop("streaming_unique_id"),
+                data.pop("streaming_update", None),
+                data.pop("streaming_snap"),
             )
-            market_book.runners = [r.resource for r in self.runners]
-            market_book._data["runners"] = _runners
-            return market_book
+
+    def create_snapshot(self, unique_id: int, snap: bool = False) -> MarketBookSnapshot:
+        """Creates an immutable market book, unchanged
+        runner snapshots are shared by reference and
+        the frozen definition is reused until updated.
+        """
+        market_definition = self._market_definition_frozen
+        if market_definition is None:
+            market_definition = freeze(self.market_definition)
+            self._market_definition_frozen = market_definition
+        return MarketBookSnapshot(
+            self.market_id,
+            self.publish_time,
+            self._definition_status,
+            self._definition_in_play,
+            self._definition_bet_delay,
+            self._definition_version,
+            self._definition_complete,
+            self._definition_runners_voidable,
+            self.total_matched,
+            self._definition_bsp_reconciled,
+            self._definition_cross_matching,
+            self._definition_number_of_winners,
+            self._number_of_runners,
+            self._definition_number_of_active_runners,
+            market_definition.get("priceLadderDefinition"),
+            market_definition.get("keyLineDefinition"),
+            market_definition,
+            tuple([runner.create_snapshot() for runner in self.runners]),
+            unique_id,
+            snap,
+            freeze(self.streaming_update),
+        )
+
+    @property
+    def _use_tick_ladder(self) -> bool:
+        # tick ladder only valid for CLASSIC markets (assumed if definition missing)
+        if self.tick_ladder is False:
+            return False
+        elif self._definition_price_ladder_definition:
+            return self._definition_price_ladder_definition.get("type") == "CLASSIC"
+        return True
 
     @property
     def closed(self) -> bool:
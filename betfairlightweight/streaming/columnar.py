@@ -0,0 +1,389 @@
+import os
+import mmap
+import struct
+import logging
+from array import array
+from json import dumps  # sort_keys used to de-duplicate
+from typing import IO, Iterator, Optional, Union
+
+from ..compat import json
+from ..resources.bettingresources import MarketBook
+from ..resources.streamingresources import MarketDefinition
+from .betfairstream import HistoricalGeneratorStream
+from .listener import StreamListener
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"BFLWCOL1"
+HEADER = struct.Struct("<8sQ")  # magic, metadata length
+NAN = float("nan")
+
+# column name: typecode
+FRAME_COLUMNS = {
+    "publish_time": "q",
+    "market": "I",
+    "meta": "I",
+    "total_matched": "d",
+    "runner_start": "I",
+    "runner_count": "I",
+}
+RUNNER_COLUMNS = {
+    "meta": "I",
+    "last_price_traded": "d",
+    "total_matched": "d",
+    "near_price": "d",
+    "far_price": "d",
+    "level_start": "I",
+    "available_to_back": "I",
+    "available_to_lay": "I",
+    "traded_volume": "I",
+    "back_stake_taken": "I",
+    "lay_liability_taken": "I",
+}
+LEVEL_COLUMNS = {"price": "d", "size": "d"}
+# (book key, ladder key, runner column)
+LADDERS = (
+    ("ex", "availableToBack", "available_to_back"),
+    ("ex", "availableToLay", "available_to_lay"),
+    ("ex", "tradedVolume", "traded_volume"),
+    ("sp", "backStakeTaken", "back_stake_taken"),
+    ("sp", "layLiabilityTaken", "lay_liability_taken"),
+)
+# market / runner book values stored per frame (not de-duplicated)
+MARKET_VALUES = ("marketId", "publishTime", "totalMatched", "runners")
+MARKET_EXCLUDE = ("streaming_update",)
+RUNNER_VALUES = ("ex", "lastPriceTraded", "totalMatched")
+SP_VALUES = ("nearPrice", "farPrice", "backStakeTaken", "layLiabilityTaken")
+
+
+def _float(value: Optional[float]) -> float:
+    return NAN if value is None else value
+
+
+def _value(value: float) -> Optional[float]:
+    return None if value != value else value  # NaN -> None
+
+
+class ColumnarWriter:
+    """Replays historical files through a StreamListener
+    (lightweight) once and writes each market book per
+    update to a columnar file, ladders are stored
+    as fixed width price/size arrays and market/runner
+    definition values are de-duplicated.
+
+    Layout:
+        header (magic, metadata length), metadata json
+        (market ids, de-duplicated dicts and column
+        offsets) then each column as a contiguous
+        array in native byte order (8 byte aligned).
+    """
+
+    def __init__(self, listener_kwargs: dict = None):
+        """
+        :param dict listener_kwargs: kwargs used to create the StreamListener
+        """
+        self.listener_kwargs = dict(listener_kwargs or {}, lightweight=True)
+        self.market_ids = []
+        self.market_metas = []
+        self.runner_metas = []
+        self.frames = {k: array(v) for k, v in FRAME_COLUMNS.items()}
+        self.runners = {k: array(v) for k, v in RUNNER_COLUMNS.items()}
+        self.levels = {k: array(v) for k, v in LEVEL_COLUMNS.items()}
+        self._market_lookup = {}
+        self._market_meta_lookup = {}
+        self._runner_meta_lookup = {}
+        self._last_update = {}  # market id: streaming_update (or market book)
+
+    def add_file(
+        self,
+        file_path: Union[str, os.PathLike, IO[bytes]],
+        operation: str = "marketSubscription",
+    ) -> int:
+        """Processes a historical file adding a frame
+        per market update.
+
+        :param file_path: Path to historic betfair file (or file-like object)
+        :param str operation: Operation type
+        :return: Number of frames added
+        """
+        listener = StreamListener(**self.listener_kwargs)
+        stream = HistoricalGeneratorStream(file_path, listener, operation, 0)
+        count = len(self.frames["publish_time"])
+        for market_books in stream.get_generator()():
+            for market_book in market_books:
+                self.add_market_book(market_book)
+        return len(self.frames["publish_time"]) - count
+
+    def add_market_book(self, market_book: dict) -> bool:
+        """Adds a lightweight market book, books that have
+        not been updated since the previous frame (same
+        streaming_update, or the same market book if not
+        present) are skipped, updates sharing a publishTime
+        are each added.
+
+        :param dict market_book: Lightweight market book
+        :return: True if added
+        """
+        market_id = market_book["marketId"]
+        publish_time = market_book["publishTime"]
+        update = market_book.get("streaming_update") or market_book
+        if self._last_update.get(market_id) is update:
+            return False
+        self._last_update[market_id] = update
+
+        frames = self.frames
+        frames["publish_time"].append(publish_time)
+        frames["market"].append(self._lookup(market_id, self._market_lookup))
+        frames["meta"].append(
+            self._dedupe(
+                {
+                    k: v
+                    for k, v in market_book.items()
+                    if k not in MARKET_VALUES and k not in MARKET_EXCLUDE
+                },
+                self._market_meta_lookup,
+                self.market_metas,
+            )
+        )
+        frames["total_matched"].append(_float(market_book["totalMatched"]))
+        frames["runner_start"].append(len(self.runners["meta"]))
+        frames["runner_count"].append(len(market_book["runners"]))
+        for runner in market_book["runners"]:
+            self._add_runner(runner)
+        return True
+
+    def write(self, output_path: Union[str, os.PathLike]) -> None:
+        """Writes the columnar file.
+
+        :param output_path: Path of file to create
+        """
+        columns, offset = {}, 0
+        data = []
+        for table, table_columns in (
+            ("frames", self.frames),
+            ("runners", self.runners),
+            ("levels", self.levels),
+        ):
+            for name, column in table_columns.items():
+                raw = column.tobytes()
+                raw += b"\x00" * (-len(raw) % 8)  # align next column
+                columns["%s.%s" % (table, name)] = (offset, len(column))
+                data.append(raw)
+                offset += len(raw)
+        metadata = json.dumps(
+            {
+                "marketIds": self.market_ids,
+                "marketMetas": self.market_metas,
+                "runnerMetas": self.runner_metas,
+                "columns": columns,
+            }
+        )
+        if not isinstance(metadata, bytes):
+            metadata = metadata.encode("utf-8")
+        metadata += b" " * (-(HEADER.size + len(metadata)) % 8)  # align columns
+        with open(output_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, len(metadata)))
+            f.write(metadata)
+            for raw in data:
+                f.write(raw)
+        logger.info(
+            "[ColumnarWriter]: %s frames / %s markets written to %s",
+            len(self.frames["publish_time"]),
+            len(self.market_ids),
+            output_path,
+        )
+
+    def _add_runner(self, runner: dict) -> None:
+        runners, levels = self.runners, self.levels
+        sp = runner["sp"]
+        meta = {k: v for k, v in runner.items() if k not in RUNNER_VALUES}
+        meta["sp"] = {k: v for k, v in sp.items() if k not in SP_VALUES}
+        runners["meta"].append(
+            self._dedupe(meta, self._runner_meta_lookup, self.runner_metas)
+        )
+        runners["last_price_traded"].append(_float(runner["lastPriceTraded"]))
+        runners["total_matched"].append(_float(runner["totalMatched"]))
+        runners["near_price"].append(_float(sp["nearPrice"]))
+        runners["far_price"].append(_float(sp["farPrice"]))
+        runners["level_start"].append(len(levels["price"]))
+        for book, key, column in LADDERS:
+            ladder = runner[book][key]
+            runners[column].append(len(ladder))
+            levels["price"].extend([level["price"] for level in ladder])
+            levels["size"].extend([level["size"] for level in ladder])
+
+    def _lookup(self, market_id: str, lookup: dict) -> int:
+        try:
+            return lookup[market_id]
+        except KeyError:
+            lookup[market_id] = index = len(self.market_ids)
+            self.market_ids.append(market_id)
+            return index
+
+    @staticmethod
+    def _dedupe(value: dict, lookup: dict, values: list) -> int:
+        key = dumps(value, sort_keys=True)
+        try:
+            return lookup[key]
+        except KeyError:
+            lookup[key] = index = len(values)
+            values.append(value)
+            return index
+
+    def __len__(self) -> int:
+        return len(self.frames["publish_time"])
+
+
+class ColumnarReader:
+    """Memory maps a file created by ColumnarWriter and
+    yields lightweight market books (dicts) or MarketBook
+    resources, `streaming_update` is not stored (None) and
+    de-duplicated values (marketDefinition) are shared
+    between market books.
+    """
+
+    def __init__(self, file_path: Union[str, os.PathLike], lightweight: bool = True):
+        """
+        :param file_path: Path to columnar file
+        :param bool lightweight: Yield dicts rather than MarketBook resources
+        """
+        self.file_path = file_path
+        self.lightweight = lightweight
+        self._views = []  # released on close
+        with open(file_path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, metadata_length = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError("%s is not a columnar file" % file_path)
+        metadata = json.loads(self._mmap[HEADER.size : HEADER.size + metadata_length])
+        self.market_ids = metadata["marketIds"]
+        self._market_metas = metadata["marketMetas"]
+        self._runner_metas = metadata["runnerMetas"]
+        self._market_definitions = {}  # meta index: MarketDefinition
+
+        view = memoryview(self._mmap)
+        start = HEADER.size + metadata_length
+        self._views.append(view)
+        columns = metadata["columns"]
+        self.frames = self._columns(view, start, columns, "frames", FRAME_COLUMNS)
+        self.runners = self._columns(view, start, columns, "runners", RUNNER_COLUMNS)
+        self.levels = self._columns(view, start, columns, "levels", LEVEL_COLUMNS)
+
+    def __iter__(self) -> Iterator[Union[dict, MarketBook]]:
+        for i in range(len(self)):
+            yield self.get(i)
+
+    def iter_market(self, market_id: str) -> Iterator[Union[dict, MarketBook]]:
+        """Yields market books for a single market.
+
+        :param str market_id: Market id
+        """
+        try:
+            market = self.market_ids.index(market_id)
+        except ValueError:
+            return
+        for i, frame_market in enumerate(self.frames["market"]):
+            if frame_market == market:
+                yield self.get(i)
+
+    def get(self, index: int) -> Union[dict, MarketBook]:
+        """Returns market book for frame index.
+
+        :param int index: Frame index
+        """
+        frames = self.frames
+        meta = frames["meta"][index]
+        runner_start = frames["runner_start"][index]
+        data = dict(self._market_metas[meta])
+        data["marketId"] = self.market_ids[frames["market"][index]]
+        data["publishTime"] = frames["publish_time"][index]
+        data["totalMatched"] = _value(frames["total_matched"][index])
+        data["runners"] = [
+            self._runner(i)
+            for i in range(runner_start, runner_start + frames["runner_count"][index])
+        ]
+        data["streaming_update"] = None
+        if self.lightweight:
+            return data
+        return MarketBook(market_definition=self._market_definition(meta), **data)
+
+    def close(self) -> None:
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def _runner(self, index: int) -> dict:
+        runners, levels = self.runners, self.levels
+        meta = self._runner_metas[runners["meta"][index]]
+        prices, sizes = levels["price"], levels["size"]
+        start = runners["level_start"][index]
+        ladders = {}
+        for _, key, column in LADDERS:
+            end = start + runners[column][index]
+            ladders[key] = [
+                {"price": prices[i], "size": sizes[i]} for i in range(start, end)
+            ]
+            start = end
+        runner = dict(meta)
+        runner["ex"] = {
+            "tradedVolume": ladders["tradedVolume"],
+            "availableToBack": ladders["availableToBack"],
+            "availableToLay": ladders["availableToLay"],
+        }
+        runner["sp"] = dict(
+            meta["sp"],
+            nearPrice=_value(runners["near_price"][index]),
+            farPrice=_value(runners["far_price"][index]),
+            backStakeTaken=ladders["backStakeTaken"],
+            layLiabilityTaken=ladders["layLiabilityTaken"],
+        )
+        runner["lastPriceTraded"] = _value(runners["last_price_traded"][index])
+        runner["totalMatched"] = _value(runners["total_matched"][index])
+        return runner
+
+    def _market_definition(self, meta: int) -> Optional[MarketDefinition]:
+        try:
+            return self._market_definitions[meta]
+        except KeyError:
+            market_definition = self._market_metas[meta].get("marketDefinition")
+            self._market_definitions[meta] = resource = (
+                MarketDefinition(**market_definition) if market_definition else None
+            )
+            return resource
+
+    def _columns(
+        self,
+        view: memoryview,
+        start: int,
+        columns: dict,
+        table: str,
+        typecodes: dict,
+    ) -> dict:
+        result = {}
+        for name, typecode in typecodes.items():
+            offset, length = columns["%s.%s" % (table, name)]
+            offset += start
+            column = view[offset : offset + length * array(typecode).itemsize]
+            result[name] = column.cast(typecode)
+            self._views.extend((column, result[name]))
+        return result
+
+    def __enter__(self) -> "ColumnarReader":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.frames["publish_time"])
+
+    def __str__(self) -> str:
+        return "<ColumnarReader [%s frames %s markets]>" % (
+            len(self),
+            len(self.market_ids),
+        )
+
+    def __repr__(self) -> str:
+        return "<ColumnarReader>"
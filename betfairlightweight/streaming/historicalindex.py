@@ -0,0 +1,117 @@
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import IO, Optional, Tuple
+
+from ..compat import json
+
+PUBLISH_TIME_RE = re.compile(rb'"pt":\s*(\d+)')
+MARKET_ID_RE = re.compile(rb'"(?:id|marketId|mid)":\s*"(\d\.\d+)"')
+IMAGE_NEEDLES = (b'"img":true', b'"fullImage":true', b'"SUB_IMAGE"')
+
+
+class HistoricalIndex:
+    """Byte offset index of a historical file, records
+    the publish time of each line, the first line each
+    market appears in and the lines containing images
+    for each market (used to seek).
+    """
+
+    def __init__(self):
+        self.publish_times = array("q")  # per line
+        self.offsets = array("q")  # per line
+        self.markets = {}  # market_id: offset of first line
+        self.images = {}  # market_id: [offsets of image lines]
+        self.size = 0
+
+    @classmethod
+    def build(cls, f: IO[bytes]) -> "HistoricalIndex":
+        """Pre-scans a (binary) historical file, only
+        lines containing images are json decoded.
+
+        :param f: File object opened in binary mode
+        """
+        index = cls()
+        publish_times, offsets = index.publish_times, index.offsets
+        markets, images = index.markets, index.images
+        offset, publish_time = 0, 0
+        for line in f:
+            match = PUBLISH_TIME_RE.search(line)
+            if match:
+                publish_time = int(match.group(1))
+            publish_times.append(publish_time)
+            offsets.append(offset)
+            for market_id in MARKET_ID_RE.findall(line):
+                market_id = market_id.decode()
+                if market_id not in markets:
+                    markets[market_id] = offset
+            if any(needle in line for needle in IMAGE_NEEDLES):
+                for market_id in cls._image_market_ids(json.loads(line)):
+                    images.setdefault(market_id, []).append(offset)
+            offset += len(line)
+        index.size = offset
+        return index
+
+    def seek(
+        self,
+        market_ids: Optional[list] = None,
+        start_publish_time: Optional[int] = None,
+        end_publish_time: Optional[int] = None,
+    ) -> Tuple[int, int, int]:
+        """Returns the offsets to seek to (latest image
+        before start of each market), start (first line
+        at or after start_publish_time) and end (first
+        line after end_publish_time).
+
+        :param list market_ids: Markets to process (defaults to all)
+        :param int start_publish_time: Start publish time (epoch ms)
+        :param int end_publish_time: End publish time (epoch ms)
+        """
+        start = self._offset(bisect_left, start_publish_time, 0)
+        end = self._offset(bisect_right, end_publish_time, self.size)
+        seek = end
+        for market_id in market_ids or self.markets:
+            if market_id not in self.markets:
+                continue
+            market_offset = self.markets[market_id]
+            images = self.images.get(market_id)
+            if images:
+                # latest image before start
+                i = bisect_right(images, start)
+                if i:
+                    market_offset = images[i - 1]
+            seek = min(seek, market_offset)
+        return seek, max(start, seek), end
+
+    def _offset(self, bisect, publish_time: Optional[int], default: int) -> int:
+        if publish_time is None:
+            return default
+        i = bisect(self.publish_times, publish_time)
+        return self.offsets[i] if i < len(self.offsets) else self.size
+
+    @staticmethod
+    def _image_market_ids(data: dict) -> list:
+        sub_image = data.get("ct") == "SUB_IMAGE"
+        market_ids = []
+        for change in data.get("mc", []) + data.get("oc", []):
+            if sub_image or change.get("img") or change.get("fullImage"):
+                market_ids.append(change.get("id"))
+        for change in data.get("cc", []):
+            if sub_image:
+                market_ids.append(change.get("marketId"))
+        for change in data.get("rc", []):
+            if sub_image:
+                market_ids.append(change.get("mid"))
+        return market_ids
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __str__(self) -> str:
+        return "<HistoricalIndex [%s lines %s markets]>" % (
+            len(self),
+            len(self.markets),
+        )
+
+    def __repr__(self) -> str:
+        return "<HistoricalIndex>"
@@ -0,0 +1,204 @@
+import os
+import sys
+import glob
+import time
+import inspect
+import logging
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Iterator, Optional, Union
+
+from .betfairstream import HistoricalGeneratorStream
+from .listener import StreamListener
+
+logger = logging.getLogger(__name__)
+
+
+def process_files(
+    file_paths: list,
+    process: Callable,
+    listener_kwargs: Optional[dict],
+    operation: str,
+) -> list:
+    """Worker function, processes each file with its own
+    StreamListener / HistoricalGeneratorStream.
+
+    :param list file_paths: Paths to historic betfair files
+    :param process: Called with (file_path, generator) per file
+    :param dict listener_kwargs: kwargs used to create the StreamListener
+    :param str operation: Operation type
+
+    :return: List of (file_path, result, updates_processed, elapsed) per file
+    """
+    results = []
+    for file_path in file_paths:
+        start = time.perf_counter()
+        listener = StreamListener(**(listener_kwargs or {}))
+        stream = HistoricalGeneratorStream(file_path, listener, operation, 0)
+        result = process(file_path, stream.get_generator()())
+        if inspect.isgenerator(result):
+            result = list(result)  # generators can't be pickled
+        results.append(
+            (
+                file_path,
+                result,
+                listener.updates_processed or 0,
+                time.perf_counter() - start,
+            )
+        )
+    return results
+
+
+class HistoricalRunner:
+    """Processes historical files in parallel using a
+    ProcessPoolExecutor, each worker creates its own
+    StreamListener per file and calls `process` with
+    the file path and the market books generator.
+    """
+
+    def __init__(
+        self,
+        file_paths: Union[str, list],
+        process: Callable,
+        listener_kwargs: dict = None,
+        operation: str = "marketSubscription",
+        max_workers: int = None,
+        ordered: bool = True,
+        chunksize: int = 1,
+        max_tasks_per_child: int = None,
+        progress: Callable = None,
+    ):
+        """
+        :param file_paths: List of file paths or glob pattern
+        :param process: Picklable callable, called in the worker with (file_path, generator)
+        and returns the result for the file (generators are converted to lists)
+        :param dict listener_kwargs: kwargs used to create the StreamListener
+        :param str operation: Operation type
+        :param int max_workers: Number of processes (defaults to cpu count)
+        :param bool ordered: Yield results in file order, otherwise as completed
+        :param int chunksize: Number of files sent to a worker per task
+        :param int max_tasks_per_child: Recycle workers after this many tasks (python 3.11+)
+        :param progress: Called with the runner after each file is processed
+        """
+        if isinstance(file_paths, str):
+            file_paths = sorted(glob.glob(file_paths))
+        if chunksize < 1:
+            raise ValueError("chunksize must be >= 1")
+        if max_tasks_per_child and sys.version_info < (3, 11):
+            raise ValueError("max_tasks_per_child requires python 3.11+")
+        self.file_paths = list(file_paths)
+        self.process = process
+        self.listener_kwargs = listener_kwargs
+        self.operation = operation
+        self.max_workers = max_workers
+        self.ordered = ordered
+        self.chunksize = chunksize
+        self.max_tasks_per_child = max_tasks_per_child
+        self.progress = progress
+
+        self.files_processed = 0
+        self.updates_processed = 0
+        self.process_time = 0  # sum of worker time per file
+        self._start_time = None
+        self._end_time = None
+
+    def run(self) -> Iterator[tuple]:
+        """Generator yielding (file_path, result) per file,
+        errors raised in a worker are raised here.
+        """
+        self.files_processed = 0
+        self.updates_processed = 0
+        self.process_time = 0
+        self._start_time = time.perf_counter()
+        self._end_time = None
+
+        executor_kwargs = {"max_workers": self.max_workers}
+        if self.max_tasks_per_child:
+            executor_kwargs["max_tasks_per_child"] = self.max_tasks_per_child
+        with ProcessPoolExecutor(**executor_kwargs) as executor:
+            chunks = iter(self.chunks)
+            # in flight submissions are capped so results are not all held in memory
+            max_pending = (self.max_workers or os.cpu_count() or 1) * 2
+            pending = deque()
+
+            def submit() -> bool:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    return False
+                pending.append(
+                    executor.submit(
+                        process_files,
+                        chunk,
+                        self.process,
+                        self.listener_kwargs,
+                        self.operation,
+                    )
+                )
+                return True
+
+            while len(pending) < max_pending and submit():
+                pass
+            try:
+                while pending:
+                    if self.ordered:
+                        future = pending.popleft()
+                    else:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        future = done.pop()
+                        pending.remove(future)
+                    results = future.result()
+                    del future  # released once yielded
+                    submit()
+                    for file_path, result, updates, elapsed in results:
+                        self._update_stats(updates, elapsed)
+                        yield file_path, result
+                    del results
+            finally:
+                for future in pending:
+                    future.cancel()
+        self._end_time = time.perf_counter()
+        logger.info("[HistoricalRunner]: %s", self)
+
+    def _update_stats(self, updates: int, elapsed: float) -> None:
+        self.files_processed += 1
+        self.updates_processed += updates
+        self.process_time += elapsed
+        if self.progress:
+            self.progress(self)
+
+    @property
+    def chunks(self) -> list:
+        return [
+            self.file_paths[i : i + self.chunksize]
+            for i in range(0, len(self.file_paths), self.chunksize)
+        ]
+
+    @property
+    def elapsed_time(self) -> float:
+        if self._start_time is None:
+            return 0
+        return (self._end_time or time.perf_counter()) - self._start_time
+
+    @property
+    def files_per_second(self) -> float:
+        elapsed_time = self.elapsed_time
+        return self.files_processed / elapsed_time if elapsed_time else 0
+
+    @property
+    def updates_per_second(self) -> float:
+        elapsed_time = self.elapsed_time
+        return self.updates_processed / elapsed_time if elapsed_time else 0
+
+    def __len__(self) -> int:
+        return len(self.file_paths)
+
+    def __str__(self) -> str:
+        return "<HistoricalRunner [%s/%s files %.1f files/s %.0f updates/s]>" % (
+            self.files_processed,
+            len(self.file_paths),
+            self.files_per_second,
+            self.updates_per_second,
+        )
+
+    def __repr__(self) -> str:
+        return "<HistoricalRunner>"
@@ -38,18 +38,31 @@ class BaseListener:
         self.stream_unique_id = unique_id
         self.stream.unique_id = unique_id
 
-    def on_data(self, raw_data: str) -> None:
+    def on_data(self, raw_data: bytes) -> None:
         logger.info(raw_data)
 
-    def snap(self, market_ids: list = None) -> list:
+    def on_data_batch(self, raw_data_list: list) -> Optional[bool]:
+        """Called with all lines received in a single read
+        when the stream is batching.
+
+        :param raw_data_list: List of received raw data
+        :return: Return False to stop stream and close connection
+        """
+        for raw_data in raw_data_list:
+            if self.on_data(raw_data) is False:
+                return False
+
+    def snap(self, market_ids: list = None, changed_only: bool = False) -> list:
         """Returns a 'snap' of the current cache
         data.
 
         :param list market_ids: Market ids to return
+        :param bool changed_only: Only return markets updated since the
+        previous changed_only snap
         :return: Return List of resources
         """
         if self.stream_type:  # quicker than self.stream due to __len__ call
-            return self.stream.snap(market_ids)
+            return self.stream.snap(market_ids, changed_only=changed_only)
         else:
             return []
 
@@ -100,6 +113,12 @@ class StreamListener(BaseListener):
         calculate_market_tv: bool = False,
         cumulative_runner_tv: bool = False,
         order_updates_only: bool = False,
+        tick_ladder: bool = False,
+        lazy_serialise: bool = False,
+        verify_tv: bool = False,
+        zero_copy: bool = False,
+        market_data_fields: list = None,
+        immutable: bool = False,
     ):
         """
         :param Queue output_queue: Queue used to return data
@@ -109,6 +128,14 @@ class StreamListener(BaseListener):
         :param bool calculate_market_tv: Calculate market traded volume from runner traded (should be True if using betfair PRO data)
         :param bool cumulative_runner_tv: Cumulative runner traded volume (should be True if using betfair purchased data)
         :param bool order_updates_only: Output updated orders through queue only on process
+        :param bool tick_ladder: Use array backed price ladders indexed on the CLASSIC tick ladder (quicker)
+        :param bool lazy_serialise: Only serialise market books on snap/output (quicker if snapping without an output_queue)
+        :param bool verify_tv: Debug, verify calculated/cumulative traded volume against the full traded ladders (slow)
+        :param bool zero_copy: Ladder levels are not copied from the update and held as their serialised dict only (quicker)
+        :param list market_data_fields: Client side projection, only maintain the runner data for these
+        fields (as per streaming_market_data_filter) e.g. ["EX_BEST_OFFERS", "EX_LTP"]
+        :param bool immutable: Returns immutable MarketBookSnapshot's, unchanged runners are shared
+        between snapshots (thread safe, takes precedence over lightweight for market books)
         """
         super(StreamListener, self).__init__(max_latency)
         self.output_queue = output_queue
@@ -117,13 +144,19 @@ class StreamListener(BaseListener):
         self.calculate_market_tv = calculate_market_tv
         self.cumulative_runner_tv = cumulative_runner_tv
         self.order_updates_only = order_updates_only
-
-    def on_data(self, raw_data: str) -> Optional[bool]:
+        self.tick_ladder = tick_ladder
+        self.lazy_serialise = lazy_serialise
+        self.verify_tv = verify_tv
+        self.zero_copy = zero_copy
+        self.market_data_fields = market_data_fields
+        self.immutable = immutable
+
+    def on_data(self, raw_data: bytes) -> Optional[bool]:
         """Called when raw data is received from connection.
         Override this method if you wish to manually handle
         the stream data
 
-        :param raw_data: Received raw data
+        :param raw_data: Received raw data (bytes, live and historical)
         :return: Return False to stop stream and close connection
         """
         try:
@@ -154,6 +187,27 @@ class StreamListener(BaseListener):
                 return
             self._on_change_message(data, unique_id)
 
+    def on_data_batch(self, raw_data_list: list) -> Optional[bool]:
+        """Called with all lines received in a single read
+        when the stream is batching, output from the lines
+        is coalesced into a single put on the output_queue.
+
+        :param raw_data_list: List of received raw data
+        :return: Return False to stop stream and close connection
+        """
+        stream = self.stream
+        if stream is None or self.output_queue is None:
+            return super(StreamListener, self).on_data_batch(raw_data_list)
+        stream._batch = batch = []
+        try:
+            for raw_data in raw_data_list:
+                if self.on_data(raw_data) is False:
+                    return False
+        finally:
+            stream._batch = None
+            if batch:
+                self.output_queue.put(batch)
+
     def _on_connection(self, data: dict, unique_id: int) -> None:
         """Called on collection operation
 
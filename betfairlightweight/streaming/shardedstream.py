@@ -0,0 +1,153 @@
+import queue
+import logging
+import threading
+
+from .betfairstream import BetfairStream
+
+logger = logging.getLogger(__name__)
+
+
+class ShardedStream:
+    """Partitions a market subscription across multiple
+    BetfairStream connections, each with its own listener
+    and thread, output from every shard is put on the
+    listeners (shared) output_queue. The shards share
+    the unique id counter of the first stream so ids
+    are unique across all shards.
+    """
+
+    def __init__(self, streams: list):
+        """
+        :param list streams: BetfairStream per shard
+        """
+        self.streams = streams
+        for stream in streams[1:]:
+            stream._unique_ids = streams[0]._unique_ids
+        self.market_filters = [None] * len(streams)  # market filter per shard
+        self._running = False
+
+    def subscribe_to_markets(
+        self,
+        market_filter: dict,
+        market_data_filter: dict,
+        conflate_ms: int = None,
+        heartbeat_ms: int = None,
+        segmentation_enabled: bool = True,
+    ) -> list:
+        """
+        Market subscription request per shard, the marketIds
+        in the market filter are split across the shards.
+
+        :param dict market_filter: Market filter (must contain marketIds)
+        :param dict market_data_filter: Market data filter
+        :param int conflate_ms: conflation rate (bounds are 0 to 120000)
+        :param int heartbeat_ms: heartbeat rate (500 to 5000)
+        :param bool segmentation_enabled: allow the server to send large sets of data
+        in segments, instead of a single block
+
+        :return: List of unique ids (one per subscribed shard)
+        """
+        market_ids = market_filter.get("marketIds")
+        if not market_ids:
+            raise ValueError("marketIds required in market_filter to shard stream")
+        unique_ids = []
+        for i, stream in enumerate(self.streams):
+            shard_market_ids = market_ids[i :: len(self.streams)]
+            if not shard_market_ids:
+                self.market_filters[i] = None
+                continue
+            self.market_filters[i] = dict(market_filter, marketIds=shard_market_ids)
+            unique_ids.append(
+                stream.subscribe_to_markets(
+                    market_filter=self.market_filters[i],
+                    market_data_filter=market_data_filter,
+                    conflate_ms=conflate_ms,
+                    heartbeat_ms=heartbeat_ms,
+                    segmentation_enabled=segmentation_enabled,
+                )
+            )
+        return unique_ids
+
+    def start(self) -> None:
+        """Starts each subscribed shard in its own thread and
+        blocks until they have all stopped, if a shard raises
+        an error all shards are stopped and the error raised.
+        """
+        streams = [
+            stream
+            for stream, market_filter in zip(self.streams, self.market_filters)
+            if market_filter
+        ]
+        results = queue.Queue()
+        threads = [
+            threading.Thread(
+                target=self._run,
+                args=(stream, results),
+                name="%s-%s" % (self.__class__.__name__, i),
+                daemon=True,
+            )
+            for i, stream in enumerate(streams)
+        ]
+        self._running = True
+        for thread in threads:
+            thread.start()
+        try:
+            for _ in threads:
+                error = results.get()
+                if error is not None:
+                    raise error
+        finally:
+            self.stop()
+            for thread in threads:
+                thread.join()
+
+    def stop(self) -> None:
+        """Stops all shards."""
+        self._running = False
+        for stream in self.streams:
+            stream.stop()
+
+    def snap(self, market_ids: list = None, changed_only: bool = False) -> list:
+        """Returns a 'snap' of the current cache
+        data across all shards.
+
+        :param list market_ids: Market ids to return
+        :param bool changed_only: Only return markets updated since the
+        previous changed_only snap
+        :return: Return List of resources
+        """
+        return [
+            resource
+            for stream in self.streams
+            for resource in stream.listener.snap(market_ids, changed_only=changed_only)
+        ]
+
+    @staticmethod
+    def _run(stream: BetfairStream, results: queue.Queue) -> None:
+        try:
+            stream.start()
+        except Exception as e:
+            logger.error("[ShardedStream: %s]: %s", stream.listener.stream_unique_id, e)
+            results.put(e)
+        else:
+            results.put(None)
+
+    @property
+    def listeners(self) -> list:
+        return [stream.listener for stream in self.streams]
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def __len__(self) -> int:
+        return len(self.streams)
+
+    def __str__(self) -> str:
+        return "<ShardedStream [%s shards %s]>" % (
+            len(self.streams),
+            "running" if self._running else "not running",
+        )
+
+    def __repr__(self) -> str:
+        return "<ShardedStream>"
@@ -0,0 +1,85 @@
+from types import MappingProxyType
+from typing import NamedTuple, Optional
+
+
+class PriceSizeSnapshot(NamedTuple):
+    price: float
+    size: float
+
+
+class RunnerBookExSnapshot(NamedTuple):
+    available_to_back: tuple
+    available_to_lay: tuple
+    traded_volume: tuple
+
+
+class RunnerBookSPSnapshot(NamedTuple):
+    near_price: Optional[float]
+    far_price: Optional[float]
+    back_stake_taken: tuple
+    lay_liability_taken: tuple
+    actual_sp: Optional[float]
+
+
+class RunnerBookSnapshot(NamedTuple):
+    selection_id: int
+    handicap: float
+    status: Optional[str]
+    adjustment_factor: Optional[float]
+    removal_date: Optional[str]
+    last_price_traded: Optional[float]
+    total_matched: Optional[float]
+    ex: RunnerBookExSnapshot
+    sp: RunnerBookSPSnapshot
+
+
+class MarketBookSnapshot(NamedTuple):
+    """
+    Immutable market book, runners that have not
+    changed between snapshots are shared by
+    reference so snapshots can be handed to other
+    threads without copying. Values are as per
+    the lightweight dict (dates are not parsed),
+    nested values (market_definition and
+    streaming_update) are frozen all the way down,
+    dicts as MappingProxyType and lists as tuples.
+    """
+
+    market_id: str
+    publish_time: int
+    status: Optional[str]
+    inplay: Optional[bool]
+    bet_delay: Optional[int]
+    version: Optional[int]
+    complete: Optional[bool]
+    runners_voidable: Optional[bool]
+    total_matched: Optional[float]
+    bsp_reconciled: Optional[bool]
+    cross_matching: Optional[bool]
+    number_of_winners: Optional[int]
+    number_of_runners: int
+    number_of_active_runners: Optional[int]
+    price_ladder_definition: Optional[MappingProxyType]
+    key_line_description: Optional[MappingProxyType]
+    market_definition: MappingProxyType
+    runners: tuple
+    streaming_unique_id: int
+    streaming_snap: bool
+    streaming_update: Optional[MappingProxyType]
+
+
+def freeze(value):
+    """Returns a read only copy of a json value, dicts
+    as MappingProxyType and lists as tuples (recursively).
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    elif isinstance(value, list):
+        return tuple([freeze(v) for v in value])
+    return value
+
+
+def create_ladder(serialised: list) -> tuple:
+    return tuple(
+        [PriceSizeSnapshot(level["price"], level["size"]) for level in serialised]
+    )
@@ -26,11 +26,19 @@ class BaseStream:
         self._calculate_market_tv = listener.calculate_market_tv
         self._cumulative_runner_tv = listener.cumulative_runner_tv
         self._order_updates_only = listener.order_updates_only
+        self._tick_ladder = listener.tick_ladder
+        self._lazy_serialise = listener.lazy_serialise
+        self._verify_tv = listener.verify_tv
+        self._zero_copy = listener.zero_copy
+        self._market_data_fields = listener.market_data_fields
+        self._immutable = listener.immutable
 
         self._initial_clk = None
         self._clk = None
         self._caches = {}
         self._updates_processed = 0
+        self._batch = None  # output coalesced by listener.on_data_batch
+        self._changed = set()  # market ids updated since last changed_only snap
         self._on_creation()
 
         self.time_created = utcnow()
@@ -89,6 +97,7 @@ class BaseStream:
 
     def clear_cache(self) -> None:
         self._caches.clear()
+        self._changed.clear()
 
     def clear_stale_cache(self, publish_time: int) -> None:
         _to_remove = []
@@ -100,6 +109,7 @@ class BaseStream:
                 _to_remove.append(cache.market_id)
         for market_id in _to_remove:
             del self._caches[market_id]
+            self._changed.discard(market_id)
             logger.info(
                 "[%s: %s]: %s removed, %s markets in cache",
                 self,
@@ -108,7 +118,28 @@ class BaseStream:
                 len(self._caches),
             )
 
-    def snap(self, market_ids: list = None, publish_time: Optional[int] = None) -> list:
+    def snap(
+        self,
+        market_ids: list = None,
+        publish_time: Optional[int] = None,
+        changed_only: bool = False,
+    ) -> list:
+        if changed_only:
+            # only markets updated since the previous changed_only snap
+            changed = self._changed
+            if market_ids:
+                market_ids = [
+                    market_id for market_id in market_ids if market_id in changed
+                ]
+                changed.difference_update(market_ids)
+            else:
+                # cache order (as per snap) rather than set order
+                market_ids = [
+                    market_id for market_id in self._caches if market_id in changed
+                ]
+                changed.clear()
+            if not market_ids:
+                return []
         # yes you can avoid the if and have fewer lines of code but it's faster
         # to treat these cases separately as you can avoid list(...) and some
         # conditionals!
@@ -130,6 +161,7 @@ class BaseStream:
             ]
 
     def on_process(self, caches: list, publish_time: Optional[int] = None) -> None:
+        self._changed.update([cache.market_id for cache in caches])
         if self.output_queue:
             output = [
                 cache.create_resource(
@@ -137,7 +169,10 @@ class BaseStream:
                 )
                 for cache in caches
             ]
-            self.output_queue.put(output)
+            if self._batch is not None:
+                self._batch.extend(output)
+            else:
+                self.output_queue.put(output)
 
     def _on_creation(self) -> None:
         logger.info('[%s: %s]: "%s" created', self, self.unique_id, self)
@@ -198,6 +233,12 @@ class MarketStream(BaseStream):
                     self._lightweight,
                     self._calculate_market_tv,
                     self._cumulative_runner_tv,
+                    tick_ladder=self._tick_ladder,
+                    lazy_serialise=self._lazy_serialise,
+                    verify_tv=self._verify_tv,
+                    zero_copy=self._zero_copy,
+                    market_data_fields=self._market_data_fields,
+                    immutable=self._immutable,
                 )
                 self._caches[market_id] = market_book_cache
                 logger.info(
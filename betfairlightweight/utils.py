@@ -6,6 +6,7 @@ from typing import Optional
 
 from .compat import BETFAIR_DATE_FORMAT
 from .exceptions import StatusCodeError
+from . import metadata
 from .__version__ import __title__, __version__
 
 CAMEL_CASE_PATTERN = re.compile(r"(?<!^)(?=[A-Z])")
@@ -24,6 +25,25 @@ TICK_SIZES = {
 }
 
 
+def create_price_ticks() -> tuple:
+    """
+    Creates the betfair CLASSIC price ladder
+    (1.01 to 1000, 350 ticks) from TICK_SIZES.
+    """
+    prices = []
+    bands = sorted(TICK_SIZES.items())
+    for (lower, increment), (upper, _) in zip(bands, bands[1:]):
+        price = lower
+        while price < upper:
+            price = round(price + increment, 2)
+            prices.append(price)
+    return tuple(prices)
+
+
+PRICE_TICKS = create_price_ticks()
+PRICE_TICK_INDEX = {price: tick for tick, price in enumerate(PRICE_TICKS)}
+
+
 def check_status_code(response: requests.Response, codes: list = None) -> None:
     """
     Checks response.status_code is in codes.
@@ -37,6 +57,74 @@ def check_status_code(response: requests.Response, codes: list = None) -> None:
         raise StatusCodeError(response.status_code)
 
 
+def calculate_market_book_weight(price_projection: dict = None) -> float:
+    """
+    Returns the weight (per market) of a listMarketBook
+    request, combined price data weights are used and
+    the EX_BEST_OFFERS weight is scaled by
+    bestPricesDepth / 3 when exBestOffersOverrides depth
+    is provided (other price data is not scaled).
+
+    :param dict price_projection: Price projection as per filters.price_projection
+    :returns: float
+    """
+    price_projection = price_projection or {}
+    price_data = set(price_projection.get("priceData") or [])
+    best_offers = "EX_BEST_OFFERS" in price_data
+    weight = 0
+    for combined, combined_weight in metadata.list_market_book_combined.items():
+        if price_data.issuperset(combined):
+            weight += combined_weight
+            price_data.difference_update(combined)
+    weight += sum(metadata.list_market_book.get(i, 0) for i in price_data)
+    if not weight:
+        return metadata.list_market_book[""]
+    overrides = price_projection.get("exBestOffersOverrides") or {}
+    if best_offers and overrides.get("bestPricesDepth"):
+        # offers weight scaled by depth, added to / removed from the total
+        weight += metadata.list_market_book["EX_BEST_OFFERS"] * (
+            overrides["bestPricesDepth"] / 3 - 1
+        )
+    return weight
+
+
+def calculate_market_catalogue_weight(market_projection: list = None) -> int:
+    """
+    Returns the weight (per market) of a listMarketCatalogue
+    request.
+
+    :param list market_projection: Market projection
+    :returns: int
+    """
+    return sum(
+        metadata.list_market_catalogue.get(i, 0) for i in market_projection or []
+    )
+
+
+def chunk_market_ids(
+    market_ids: list,
+    weight: float,
+    max_weight: int = metadata.data_weight_limit,
+    max_size: int = None,
+) -> list:
+    """
+    Splits market ids into the largest chunks that keep the
+    request weight within max_weight, a market heavier than
+    max_weight is requested on its own.
+
+    :param list market_ids: Market ids
+    :param float weight: Weight per market
+    :param int max_weight: Max weight per request
+    :param int max_size: Max market ids per request
+    :returns: list of market id lists
+    """
+    size = int(max_weight // weight) if weight else len(market_ids)
+    if max_size:
+        size = min(size, max_size)
+    size = max(size, 1)
+    return [market_ids[i : i + size] for i in range(0, len(market_ids), size)]
+
+
 def clean_locals(data: dict) -> dict:
     """
     Clean up locals dict, remove empty and self/session/params params
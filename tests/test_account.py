@@ -67,6 +67,20 @@ class AccountTest(unittest.TestCase):
         )
         assert mock_process_response.call_count == 1
 
+    @mock.patch("betfairlightweight.endpoints.account.Account.get_account_statement")
+    def test_iter_account_statement(self, mock_get_account_statement):
+        mock_get_account_statement.side_effect = [
+            {"accountStatement": [1, 2], "moreAvailable": True},
+            {"accountStatement": [3], "moreAvailable": False},
+        ]
+        items = list(self.account.iter_account_statement(page_size=2, wallet="UK"))
+
+        assert items == [1, 2, 3]
+        mock_get_account_statement.assert_called_with(
+            from_record=2, record_count=2, wallet="UK"
+        )
+        assert mock_get_account_statement.call_count == 2
+
     @mock.patch("betfairlightweight.endpoints.account.Account.process_response")
     @mock.patch(
         "betfairlightweight.endpoints.account.Account.request",
@@ -1,6 +1,8 @@
 import unittest
 
-from betfairlightweight.apiclient import APIClient
+from unittest import mock
+
+from betfairlightweight.apiclient import APIClient, AsyncAPIClient
 
 
 class APIClientInit(unittest.TestCase):
@@ -8,3 +10,38 @@ class APIClientInit(unittest.TestCase):
         client = APIClient("username", "password", "app_key")
         assert str(client) == "APIClient"
         assert repr(client) == "<APIClient [username]>"
+
+
+class AsyncAPIClientInit(unittest.TestCase):
+    def test_init(self):
+        async_session = mock.Mock()
+        client = AsyncAPIClient(
+            "username", "password", "app_key", async_session=async_session
+        )
+        assert client.async_session == async_session
+        assert str(client) == "AsyncAPIClient"
+        assert repr(client) == "<AsyncAPIClient [username]>"
+
+    @mock.patch("betfairlightweight.apiclient.httpx", None)
+    def test_init_no_httpx(self):
+        with self.assertRaises(ImportError):
+            AsyncAPIClient("username", "password", "app_key")
+
+    @mock.patch("betfairlightweight.apiclient.httpx")
+    def test_init_async_session(self, mock_httpx):
+        client = AsyncAPIClient("username", "password", "app_key", max_connections=5)
+        mock_httpx.Limits.assert_called_with(
+            max_connections=5, max_keepalive_connections=5
+        )
+        mock_httpx.AsyncClient.assert_called_with(limits=mock_httpx.Limits())
+        assert client.async_session == mock_httpx.AsyncClient()
+
+
+class AsyncAPIClientTest(unittest.IsolatedAsyncioTestCase):
+    async def test_context_manager(self):
+        async_session = mock.Mock(aclose=mock.AsyncMock())
+        async with AsyncAPIClient(
+            "username", "password", "app_key", async_session=async_session
+        ) as client:
+            assert isinstance(client, AsyncAPIClient)
+        async_session.aclose.assert_awaited_once_with()
@@ -0,0 +1,296 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+from betfairlightweight import AsyncAPIClient, resources
+from betfairlightweight.endpoints import (
+    AsyncBetting,
+    AsyncAccount,
+    AsyncInPlayService,
+    AsyncRaceCard,
+    AsyncHistoric,
+)
+from betfairlightweight.exceptions import (
+    APIError,
+    InvalidResponse,
+    RaceCardError,
+    StatusCodeError,
+)
+from betfairlightweight.responsecache import ResponseCache
+from tests.tools import create_mock_json
+
+TIMEOUT = (3.05, 16, 16, 3.05)
+
+
+class AsyncEndpointTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.async_session = mock.Mock(request=mock.AsyncMock())
+        self.client = AsyncAPIClient(
+            "username", "password", "app_key", async_session=self.async_session
+        )
+        self.client.set_session_token("sessionToken")
+
+    def test_init(self):
+        assert isinstance(self.client.betting, AsyncBetting)
+        assert isinstance(self.client.account, AsyncAccount)
+        assert isinstance(self.client.in_play_service, AsyncInPlayService)
+        assert isinstance(self.client.race_card, AsyncRaceCard)
+        assert isinstance(self.client.historic, AsyncHistoric)
+        assert asyncio.iscoroutinefunction(self.client.betting.list_market_book)
+        assert self.client.betting.list_market_book.__name__ == "list_market_book"
+
+    async def test_list_market_book(self):
+        self.async_session.request.return_value = create_mock_json(
+            "tests/resources/list_market_book.json"
+        )
+        response = await self.client.betting.list_market_book(["1.123"])
+
+        self.async_session.request.assert_called_with(
+            "POST",
+            self.client.betting.url,
+            timeout=TIMEOUT,
+            content=self.client.betting.create_req(
+                "SportsAPING/v1.0/listMarketBook", {"marketIds": ["1.123"]}
+            ),
+            headers=self.client.request_headers,
+        )
+        assert isinstance(response[0], resources.MarketBook)
+        assert response[0].elapsed_time >= 0
+
+    async def test_list_market_book_chunked(self):
+        self.async_session.request.side_effect = lambda *args, **kwargs: mock.Mock(
+            status_code=200,
+            content=json.dumps(
+                {
+                    "jsonrpc": "2.0",
+                    "result": [
+                        {"marketId": market_id}
+                        for market_id in reversed(
+                            json.loads(kwargs["content"])["params"]["marketIds"]
+                        )
+                    ],
+                    "id": 1,
+                }
+            ).encode(),
+        )
+        market_ids = [str(i) for i in range(25)]
+        response = await self.client.betting.list_market_book_chunked(
+            market_ids,
+            price_projection={"priceData": ["EX_ALL_OFFERS", "EX_TRADED"]},
+            lightweight=True,
+            max_workers=2,
+        )
+        assert [r["marketId"] for r in response] == market_ids
+        assert self.async_session.request.call_count == 5  # 6 per request
+
+    async def test_list_market_catalogue_chunked(self):
+        self.async_session.request.return_value = mock.Mock(
+            status_code=200,
+            content=b'{"jsonrpc": "2.0", "result": [{"marketId": "1.1"}], "id": 1}',
+        )
+        response = await self.client.betting.list_market_catalogue_chunked(
+            ["1.1"], lightweight=True
+        )
+        assert response == [{"marketId": "1.1"}]
+        params = json.loads(self.async_session.request.call_args[1]["content"])[
+            "params"
+        ]
+        assert params == {"filter": {"marketIds": ["1.1"]}, "maxResults": 1}
+
+    async def test_place_orders_batched(self):
+        self.async_session.request.return_value = create_mock_json(
+            "tests/resources/place_orders.json"
+        )
+        response = await self.client.betting.place_orders_batched(
+            {"1.125897784": [{"selectionId": 1}] * 201}
+        )
+        assert self.async_session.request.call_count == 2
+        assert len(response) == 1
+        assert isinstance(response[0], resources.PlaceOrders)
+        assert len(response[0].place_instruction_reports) == 2
+        assert response[0].place_instruction_reports[0].elapsed_time >= 0
+
+    async def test_place_orders_batched_error(self):
+        self.async_session.request.side_effect = [
+            create_mock_json("tests/resources/place_orders.json"),
+            ConnectionError(),
+        ]
+        with self.assertLogs("betfairlightweight.endpoints.betting", "ERROR"):
+            response = await self.client.betting.place_orders_batched(
+                {"1.125897784": [{"selectionId": 1}] * 201},
+                max_workers=1,
+                lightweight=True,
+            )
+        assert len(response) == 1
+        assert response[0]["status"] == "TIMEOUT"
+        reports = response[0]["instructionReports"]
+        assert len(reports) == 2
+        assert reports[-1]["status"] == "TIMEOUT"
+        assert "errorCode" not in reports[-1]
+
+    async def test_governor(self):
+        self.client.governor = mock.Mock(acquire_async=mock.AsyncMock())
+        self.async_session.request.return_value = create_mock_json(
+            "tests/resources/list_market_book.json"
+        )
+        await self.client.betting.list_market_book(["1.123"])
+        self.client.governor.acquire_async.assert_awaited_once_with(
+            "SportsAPING/v1.0/listMarketBook", {"marketIds": ["1.123"]}
+        )
+        self.async_session.request.return_value = mock.Mock(
+            status_code=200, content=b"{}"
+        )
+        await self.client.in_play_service.get_scores([1], lightweight=True)
+        assert self.client.governor.acquire_async.await_count == 1
+
+    async def test_iter_cleared_orders(self):
+        pages = iter(
+            [
+                b'{"result": {"clearedOrders": [{"betId": "1"}], "moreAvailable": true}}',
+                b'{"result": {"clearedOrders": [{"betId": "2"}], "moreAvailable": false}}',
+            ]
+        )
+        self.async_session.request.side_effect = lambda *args, **kwargs: mock.Mock(
+            status_code=200, content=next(pages)
+        )
+        orders = [
+            order
+            async for order in self.client.betting.iter_cleared_orders(
+                page_size=1, prefetch=True, lightweight=True
+            )
+        ]
+        assert orders == [{"betId": "1"}, {"betId": "2"}]
+        params = json.loads(self.async_session.request.call_args[1]["content"])[
+            "params"
+        ]
+        assert params["fromRecord"] == 1
+        assert params["recordCount"] == 1
+
+    async def test_iter_account_statement_break(self):
+        self.async_session.request.return_value = mock.Mock(
+            status_code=200,
+            content=b'{"result": {"accountStatement": [{"refId": "1"}], "moreAvailable": true}}',
+        )
+        async for item in self.client.account.iter_account_statement(
+            prefetch=True, lightweight=True
+        ):
+            assert item == {"refId": "1"}
+            break
+        assert self.async_session.request.call_count <= 2
+
+    async def test_response_cache(self):
+        self.client.response_cache = ResponseCache()
+        self.async_session.request.return_value = create_mock_json(
+            "tests/resources/list_event_types.json"
+        )
+        for _ in range(2):
+            response = await self.client.betting.list_event_types()
+            assert isinstance(response[0], resources.EventTypeResult)
+        assert self.async_session.request.call_count == 1
+        assert response[0].elapsed_time == 0  # cached
+
+    async def test_lightweight(self):
+        self.async_session.request.return_value = create_mock_json(
+            "tests/resources/list_current_orders.json"
+        )
+        response = await self.client.betting.list_current_orders(lightweight=True)
+        assert isinstance(response, dict)
+
+    async def test_session(self):
+        session = mock.Mock(request=mock.AsyncMock())
+        session.request.return_value = create_mock_json(
+            "tests/resources/list_event_types.json"
+        )
+        await self.client.betting.list_event_types(session=session)
+        assert session.request.call_count == 1
+        assert self.async_session.request.call_count == 0
+
+    async def test_concurrent(self):
+        self.async_session.request.return_value = create_mock_json(
+            "tests/resources/list_market_book.json"
+        )
+        responses = await asyncio.gather(
+            *[self.client.betting.list_market_book([str(i)]) for i in range(5)]
+        )
+        assert len(responses) == 5
+        assert self.async_session.request.call_count == 5
+
+    async def test_error(self):
+        self.async_session.request.return_value = create_mock_json(
+            "tests/resources/base_endpoint_fail.json"
+        )
+        with self.assertRaises(APIError):
+            await self.client.account.get_account_funds()
+
+    async def test_connection_error(self):
+        self.async_session.request.side_effect = ConnectionError()
+        with self.assertRaises(APIError):
+            await self.client.betting.list_market_book(["1.123"])
+
+    async def test_status_code_error(self):
+        self.async_session.request.return_value = create_mock_json(
+            "tests/resources/list_market_book.json", status_code=500
+        )
+        with self.assertRaises(StatusCodeError):
+            await self.client.betting.list_market_book(["1.123"])
+
+    async def test_invalid_response(self):
+        self.async_session.request.return_value = mock.Mock(
+            status_code=200, content=b"<html>", text="<html>"
+        )
+        with self.assertRaises(InvalidResponse):
+            await self.client.betting.list_market_book(["1.123"])
+
+    async def test_in_play_service(self):
+        self.async_session.request.return_value = create_mock_json(
+            "tests/resources/eventtimeline.json"
+        )
+        response = await self.client.in_play_service.get_event_timeline(123)
+
+        self.async_session.request.assert_called_with(
+            "GET",
+            "%s%s" % (self.client.in_play_service.url, "eventTimeline"),
+            timeout=TIMEOUT,
+            params={
+                "eventId": 123,
+                "alt": "json",
+                "regionCode": "UK",
+                "locale": "en_GB",
+            },
+            headers=self.client.in_play_service.headers,
+        )
+        assert isinstance(response, resources.EventTimeline)
+
+    async def test_race_card(self):
+        with self.assertRaises(RaceCardError):
+            await self.client.race_card.get_race_card(["1.123"])
+        self.client.race_card.app_key = "1234"
+        self.async_session.request.return_value = mock.Mock(
+            status_code=200, content=b"[]"
+        )
+        response = await self.client.race_card.get_race_card(["1.123"])
+
+        self.async_session.request.assert_called_with(
+            "GET",
+            "%s%s" % (self.client.race_card.url, "raceCard"),
+            timeout=TIMEOUT,
+            params=self.client.race_card.create_race_card_req(["1.123"], None),
+            headers=self.client.race_card.headers,
+        )
+        assert response == []
+
+    async def test_historic(self):
+        self.async_session.request.return_value = mock.Mock(
+            status_code=200, content=b'[{"plan": "Basic Plan"}]'
+        )
+        response = await self.client.historic.get_my_data()
+
+        self.async_session.request.assert_called_with(
+            "POST",
+            "%s%s" % (self.client.historic.url, "GetMyData"),
+            timeout=TIMEOUT,
+            content=mock.ANY,
+            headers=self.client.historic.headers,
+        )
+        assert response == [{"plan": "Basic Plan"}]
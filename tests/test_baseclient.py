@@ -2,9 +2,12 @@ import os
 import unittest
 from unittest import mock
 
+import requests
+
 from betfairlightweight.baseclient import IDENTITY, IDENTITY_CERT, API, NAVIGATION
 from betfairlightweight import APIClient
 from betfairlightweight.exceptions import PasswordError, AppKeyError, CertsError
+from betfairlightweight.pooledsession import PooledSession
 
 
 class BaseClientInit(unittest.TestCase):
@@ -14,11 +17,27 @@ class BaseClientInit(unittest.TestCase):
         assert client.password == "password"
         assert client.app_key == "app_key"
         assert client.lightweight is True
+        assert client.lazy is False
+        assert client.governor is None
+        assert client.response_cache is None
         assert client.certs == "/certs"
         assert client.locale is None
         assert client._login_time is None
         assert client.session_token is None
 
+    def test_base_client_init_pooled(self):
+        client = APIClient("bf_username", "password", "app_key", pooled=True)
+        self.assertIsInstance(client.session, PooledSession)
+        self.assertEqual(client.session.pool_maxsize, 10)
+        self.assertEqual(client.session.urls, client.pool_urls)
+        session = mock.Mock()
+        client = APIClient(
+            "bf_username", "password", "app_key", session=session, pooled=True
+        )
+        self.assertEqual(client.session, session)
+        client = APIClient("bf_username", "password", "app_key")
+        self.assertEqual(client.session, requests)
+
     def test_vars(self):
         assert IDENTITY == "https://identitysso.betfair{tld}/api/"
         assert IDENTITY_CERT == "https://identitysso-cert.betfair{tld}/api/"
@@ -176,6 +195,22 @@ class BaseClientTest(unittest.TestCase):
         self.client._login_time = 959814000
         assert self.client.session_expired is True
 
+    def test_warm_session(self):
+        self.client.warm_session()  # requests module
+        self.client.session = mock.Mock(spec=PooledSession)
+        self.client.warm_session()
+        self.client.session.warm.assert_called_with(["betting", "account"])
+
+    def test_pool_urls(self):
+        self.assertEqual(
+            self.client.pool_urls["betting"],
+            "https://api.betfair.com/exchange/betting/",
+        )
+        self.assertEqual(
+            self.client.pool_urls["identity_cert"],
+            "https://identitysso-cert.betfair.com/api/",
+        )
+
     def test_client_logout(self):
         self.client.client_logout()
         assert self.client._login_time is None
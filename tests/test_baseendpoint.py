@@ -5,6 +5,7 @@ from requests.exceptions import ConnectionError
 from betfairlightweight.compat import json
 from betfairlightweight import APIClient
 from betfairlightweight.endpoints.baseendpoint import BaseEndpoint
+from betfairlightweight.responsecache import ResponseCache
 from betfairlightweight.exceptions import APIError, InvalidResponse
 from tests.tools import create_mock_json
 
@@ -52,6 +53,32 @@ class BaseEndPointTest(unittest.TestCase):
         assert response[1] == mock_response.json()
         assert isinstance(response[2], float)
 
+    @mock.patch("betfairlightweight.baseclient.BaseClient.request_headers")
+    @mock.patch("betfairlightweight.baseclient.requests.post")
+    def test_request_governor(self, mock_post, mock_request_headers):
+        mock_post.return_value = create_mock_json("tests/resources/login_success.json")
+        self.base_endpoint.client.governor = mock.Mock()
+        self.base_endpoint.request("SportsAPING/v1.0/placeOrders", {"a": 1}, None)
+        self.base_endpoint.client.governor.acquire.assert_called_once_with(
+            "SportsAPING/v1.0/placeOrders", {"a": 1}
+        )
+
+    @mock.patch("betfairlightweight.endpoints.baseendpoint.BaseEndpoint._request")
+    def test_request_response_cache(self, mock__request):
+        mock__request.return_value = (mock.Mock(), {"result": [1]}, 1.2)
+        self.base_endpoint.client.response_cache = ResponseCache()
+        for elapsed_time in (1.2, 0):
+            response = self.base_endpoint.request(
+                "SportsAPING/v1.0/listEventTypes", {"filter": {}}, None
+            )
+            assert response == (None, {"result": [1]}, elapsed_time)
+        mock__request.assert_called_once_with(
+            "SportsAPING/v1.0/listEventTypes", {"filter": {}}, None
+        )
+        # not cached
+        self.base_endpoint.request("SportsAPING/v1.0/listMarketBook", {}, None)
+        assert mock__request.call_count == 2
+
     @mock.patch("betfairlightweight.endpoints.baseendpoint.BaseEndpoint.create_req")
     @mock.patch("betfairlightweight.baseclient.BaseClient.cert")
     @mock.patch("betfairlightweight.baseclient.BaseClient.request_headers")
@@ -136,6 +163,29 @@ class BaseEndPointTest(unittest.TestCase):
         assert type(response) == list
         assert response[0] == mock_resource()
 
+    def test_base_endpoint_process_response_lazy(self):
+        mock_resource = mock.Mock()
+        client = APIClient("username", "password", "app_key", lazy=True)
+        base_endpoint = BaseEndpoint(client)
+        response = base_endpoint.process_response(
+            {"result": [{"hello": 1}, {}]}, mock_resource, 1.2, None
+        )
+        assert len(response) == 2
+        mock_resource.assert_not_called()
+        assert response[0] == mock_resource.create_lazy.return_value
+        mock_resource.create_lazy.assert_called_with({}, elapsed_time=1.2)
+
+        response = base_endpoint.process_response(
+            {"result": {"hello": 1}}, mock_resource, 1.2, None
+        )
+        assert response == mock_resource.create_lazy.return_value
+        mock_resource.create_lazy.assert_called_with({"hello": 1}, elapsed_time=1.2)
+        # lightweight takes precedence
+        response = base_endpoint.process_response(
+            {"result": {"hello": 1}}, mock_resource, 1.2, True
+        )
+        assert response == {"hello": 1}
+
     def test_base_endpoint_process_response_no_error(self):
         class MockResource:
             def __init__(self, elapsed_time, hello, **kwargs):
@@ -1,8 +1,17 @@
 import datetime
+import pickle
 import unittest
 
 from betfairlightweight.compat import json
+from betfairlightweight.exceptions import InvalidResponse
 from betfairlightweight.resources.baseresource import BaseResource
+from betfairlightweight.resources.bettingresources import (
+    ClearedOrders,
+    CurrentOrder,
+    CurrentOrders,
+    MarketCatalogue,
+    RunnerCatalogue,
+)
 from tests.tools import create_mock_json
 
 
@@ -59,3 +68,75 @@ class BaseResourceInit(unittest.TestCase):
         base_resource = BaseResource()
         assert str(base_resource) == "BaseResource"
         assert repr(base_resource) == "<BaseResource>"
+
+
+class BaseResourceLazyTest(unittest.TestCase):
+    def setUp(self):
+        self.data = create_mock_json("tests/resources/list_market_catalogue.json")
+        self.data = self.data.json()["result"][0]
+        self.lazy_resource = MarketCatalogue.create_lazy(self.data, elapsed_time=1.2)
+
+    def test_create_lazy(self):
+        expected = MarketCatalogue(elapsed_time=1.2, **self.data)
+        self.assertIs(type(self.lazy_resource), MarketCatalogue)
+        self.assertEqual(self.lazy_resource.market_id, expected.market_id)
+        self.assertEqual(self.lazy_resource.elapsed_time, 1.2)
+        self.assertEqual(
+            self.lazy_resource.market_start_time, expected.market_start_time
+        )
+        self.assertEqual(self.lazy_resource["marketId"], expected.market_id)
+        self.assertEqual(self.lazy_resource._data, self.data)
+        self.assertEqual(self.lazy_resource.json(), json.dumps(self.data))
+        self.assertEqual(
+            self.lazy_resource._lazy_pending, {"runners": ("runners", RunnerCatalogue)}
+        )
+        self.assertNotIn("runners", vars(self.lazy_resource))
+
+    def test_lazy_children(self):
+        runners = self.lazy_resource.runners
+        self.assertEqual(len(runners), len(self.data["runners"]))
+        self.assertIsInstance(runners[0], RunnerCatalogue)
+        self.assertEqual(
+            runners[0].selection_id, self.data["runners"][0]["selectionId"]
+        )
+        self.assertIs(self.lazy_resource.runners, runners)
+        self.assertEqual(self.lazy_resource._lazy_pending, {})
+        self.assertIs(self.lazy_resource["runners"], runners)
+
+        current_orders = CurrentOrders.create_lazy(
+            create_mock_json("tests/resources/list_current_orders.json").json()[
+                "result"
+            ],
+        )
+        self.assertIsInstance(current_orders.orders[0], CurrentOrder)
+        self.assertIsNotNone(current_orders.orders[0].bet_id)
+        cleared_orders = ClearedOrders.create_lazy(
+            create_mock_json("tests/resources/list_cleared_orders.json").json()[
+                "result"
+            ],
+        )
+        self.assertIsNotNone(cleared_orders.orders[0].bet_id)
+
+    def test_missing_attribute(self):
+        with self.assertRaises(AttributeError):
+            self.lazy_resource.hello
+        self.assertIsNone(self.lazy_resource.get("hello"))
+
+    def test_pickle(self):
+        resource = pickle.loads(pickle.dumps(self.lazy_resource))
+        self.assertIs(type(resource), MarketCatalogue)
+        self.assertEqual(resource.market_id, self.data["marketId"])
+        self.assertEqual(
+            resource.runners[0].selection_id, self.data["runners"][0]["selectionId"]
+        )
+
+    def test_invalid_response(self):
+        with self.assertRaises(InvalidResponse):
+            CurrentOrders.create_lazy({})
+
+    def test_invalid_response_children(self):
+        current_orders = CurrentOrders.create_lazy(
+            {"currentOrders": [{}], "moreAvailable": False}
+        )
+        with self.assertRaises(InvalidResponse):
+            current_orders.orders
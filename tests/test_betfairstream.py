@@ -1,15 +1,27 @@
+import io
+import os
+import bz2
+import gzip
+import lzma
+import shutil
+import tempfile
 import unittest
+import asyncio
 import socket
 import time
+import json
 import ssl
 import threading
 from unittest import mock
 
 from betfairlightweight.streaming.betfairstream import (
+    BaseBetfairStream,
     BetfairStream,
+    AsyncBetfairStream,
     HistoricalStream,
     HistoricalGeneratorStream,
 )
+from betfairlightweight.compat import zstandard
 from betfairlightweight.exceptions import SocketError, ListenerError
 
 
@@ -32,6 +44,10 @@ class BetfairStreamTest(unittest.TestCase):
             None,
         )
 
+    def test_base_abstract(self):
+        with self.assertRaises(TypeError):
+            BaseBetfairStream(1, self.mock_listener, "app_key", "token", 6, None)
+
     def test_init(self):
         assert self.betfair_stream._unique_id == self.unique_id
         assert self.betfair_stream.listener == self.mock_listener
@@ -39,12 +55,16 @@ class BetfairStreamTest(unittest.TestCase):
         assert self.betfair_stream.session_token == self.session_token
         assert self.betfair_stream.timeout == self.timeout
         assert self.betfair_stream.buffer_size == self.buffer_size
+        assert self.betfair_stream.max_buffer_size == 2**20
+        assert self.betfair_stream.batch is False
         assert self.betfair_stream.host == "stream-api.betfair.com"
         assert self.betfair_stream.receive_count == 0
         assert self.betfair_stream.datetime_last_received is None
 
         assert self.betfair_stream._socket is None
         assert self.betfair_stream._running is False
+        assert self.betfair_stream._buffer == bytearray()
+        assert len(self.betfair_stream._chunk) == self.buffer_size
 
     def test_host_init(self):
         betfair_stream = BetfairStream(
@@ -277,7 +297,7 @@ class BetfairStreamTest(unittest.TestCase):
     )
     @mock.patch(
         "betfairlightweight.streaming.betfairstream.BetfairStream._receive_all",
-        return_value="{}\r\n",
+        return_value=b"{}\r\n",
     )
     def test_read_loop(self, mock_receive_all, mock_data):
         mock_socket = mock.Mock()
@@ -291,7 +311,7 @@ class BetfairStreamTest(unittest.TestCase):
         self.betfair_stream._running = False
         time.sleep(0.1)
 
-        mock_data.assert_called_with("{}")
+        mock_data.assert_called_with(b"{}")
         mock_receive_all.assert_called_with()
         assert self.betfair_stream.datetime_last_received is not None
         assert self.betfair_stream.receive_count > 0
@@ -299,22 +319,117 @@ class BetfairStreamTest(unittest.TestCase):
     def test_receive_all(self):
         mock_socket = mock.Mock()
         data_return_value = b'{"op":"status"}\r\n'
-        mock_socket.recv.return_value = data_return_value
+        mock_socket.recv_into.side_effect = self._recv_into(data_return_value)
         self.betfair_stream._socket = mock_socket
 
         data = self.betfair_stream._receive_all()
-        assert data == ""
+        assert data == b""
 
         self.betfair_stream._running = True
         data = self.betfair_stream._receive_all()
-        mock_socket.recv.assert_called_with(self.buffer_size)
-        assert data == data_return_value.decode("utf-8")
+        mock_socket.recv_into.assert_called_with(self.betfair_stream._chunk)
+        assert data == data_return_value
+        assert self.betfair_stream._buffer == bytearray()
+
+    def test_receive_all_partial(self):
+        mock_socket = mock.Mock()
+        mock_socket.recv_into.side_effect = self._recv_into(
+            b'{"op":"mcm"}\r\n{"op":', b'"status"}\r', b"\n"
+        )
+        self.betfair_stream._socket = mock_socket
+        self.betfair_stream._running = True
+
+        assert self.betfair_stream._receive_all() == b'{"op":"mcm"}\r\n'
+        assert self.betfair_stream._buffer == bytearray(b'{"op":')
+        assert self.betfair_stream._receive_all() == b'{"op":"status"}\r\n'
+        assert self.betfair_stream._buffer == bytearray()
+        assert mock_socket.recv_into.call_count == 3
+
+    def test_receive_all_large(self):
+        line = b'{"op":"mcm","mc":[%s]}\r\n' % (b",".join([b"1"] * 5000))
+        parts = [
+            line[i : i + self.buffer_size]
+            for i in range(0, len(line), self.buffer_size)
+        ]
+        mock_socket = mock.Mock()
+        mock_socket.recv_into.side_effect = self._recv_into(*parts)
+        self.betfair_stream._socket = mock_socket
+        self.betfair_stream._running = True
+
+        assert self.betfair_stream._receive_all() == line
+        assert mock_socket.recv_into.call_count == len(parts)
+        # buffer grown to fit the frame
+        assert self.betfair_stream.buffer_size == 16384
+        assert len(self.betfair_stream._chunk) == 16384
+
+    def test_grow_buffer(self):
+        self.betfair_stream.max_buffer_size = 4096
+        self.betfair_stream._grow_buffer(2000)
+        assert self.betfair_stream.buffer_size == 2048
+        assert len(self.betfair_stream._chunk) == 2048
+        self.betfair_stream._grow_buffer(10000)
+        assert self.betfair_stream.buffer_size == 4096
+        assert len(self.betfair_stream._chunk) == 4096
+
+    @mock.patch(
+        "betfairlightweight.streaming.betfairstream.BetfairStream._data_batch",
+    )
+    @mock.patch(
+        "betfairlightweight.streaming.betfairstream.BetfairStream._receive_all",
+    )
+    def test_read_loop_batch(self, mock_receive_all, mock_data_batch):
+        def receive_all():
+            self.betfair_stream._running = False
+            return b"{}\r\n[]\r\n"
+
+        mock_receive_all.side_effect = receive_all
+        self.betfair_stream.batch = True
+        self.betfair_stream._running = True
+        self.betfair_stream._read_loop()
+        mock_data_batch.assert_not_called()
+
+        mock_receive_all.side_effect = None
+        mock_receive_all.return_value = b"{}\r\n[]\r\n"
+        mock_data_batch.side_effect = lambda _: setattr(
+            self.betfair_stream, "_running", False
+        )
+        self.betfair_stream._running = True
+        self.betfair_stream._read_loop()
+        mock_data_batch.assert_called_once_with([b"{}", b"[]"])
+
+        # empty lines filtered
+        mock_data_batch.reset_mock()
+        mock_receive_all.return_value = b"{}\r\n\r\n[]\r\n"
+        self.betfair_stream._running = True
+        self.betfair_stream._read_loop()
+        mock_data_batch.assert_called_once_with([b"{}", b"[]"])
+
+    @mock.patch("betfairlightweight.streaming.betfairstream.BetfairStream.stop")
+    def test_data_batch(self, mock_stop):
+        self.mock_listener.on_data_batch.return_value = False
+        with self.assertRaises(ListenerError):
+            self.betfair_stream._data_batch([b"{}"])
+        self.mock_listener.on_data_batch.assert_called_with([b"{}"])
+        mock_stop.assert_called_with()
+
+        self.mock_listener.on_data_batch.return_value = None
+        self.betfair_stream._data_batch([b"{}"])
+
+    @staticmethod
+    def _recv_into(*parts):
+        parts = iter(parts)
+
+        def recv_into(buffer):
+            part = next(parts)
+            buffer[: len(part)] = part
+            return len(part)
+
+        return recv_into
 
     @mock.patch("betfairlightweight.streaming.betfairstream.BetfairStream.stop")
     def test_receive_all_closed(self, mock_stop):
         mock_socket = mock.Mock()
-        data_return_value = b""
-        mock_socket.recv.return_value = data_return_value
+        mock_socket.recv_into.return_value = 0
         self.betfair_stream._socket = mock_socket
         self.betfair_stream._running = True
 
@@ -328,7 +443,7 @@ class BetfairStreamTest(unittest.TestCase):
         self.betfair_stream._socket = mock_socket
 
         self.betfair_stream._running = True
-        mock_socket.recv.side_effect = socket.error()
+        mock_socket.recv_into.side_effect = socket.error()
         with self.assertRaises(SocketError):
             self.betfair_stream._receive_all()
         mock_stop.assert_called_with()
@@ -339,7 +454,7 @@ class BetfairStreamTest(unittest.TestCase):
         self.betfair_stream._socket = mock_socket
 
         self.betfair_stream._running = True
-        mock_socket.recv.side_effect = socket.timeout()
+        mock_socket.recv_into.side_effect = socket.timeout()
         with self.assertRaises(SocketError):
             self.betfair_stream._receive_all()
         mock_stop.assert_called_with()
@@ -419,6 +534,226 @@ class BetfairStreamTest(unittest.TestCase):
         assert str(self.betfair_stream) == "<BetfairStream [running]>"
 
 
+class AsyncBetfairStreamTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.mock_listener = mock.Mock()
+        self.mock_listener.on_data.return_value = False
+        self.betfair_stream = AsyncBetfairStream(
+            1, self.mock_listener, "app_key", "session_token", 6, 1024, None
+        )
+        self.mock_reader = mock.Mock(readuntil=mock.AsyncMock())
+        self.mock_writer = mock.Mock(
+            drain=mock.AsyncMock(), wait_closed=mock.AsyncMock()
+        )
+
+    def test_init(self):
+        assert self.betfair_stream._unique_id == 1
+        assert self.betfair_stream.listener == self.mock_listener
+        assert self.betfair_stream.app_key == "app_key"
+        assert self.betfair_stream.session_token == "session_token"
+        assert self.betfair_stream.timeout == 6
+        assert self.betfair_stream.limit == 1024
+        assert self.betfair_stream.host == "stream-api.betfair.com"
+        assert self.betfair_stream.receive_count == 0
+        assert self.betfair_stream.datetime_last_received is None
+        assert self.betfair_stream._reader is None
+        assert self.betfair_stream._writer is None
+        assert self.betfair_stream._running is False
+
+    @mock.patch(
+        "betfairlightweight.streaming.betfairstream.AsyncBetfairStream._read_loop"
+    )
+    @mock.patch(
+        "betfairlightweight.streaming.betfairstream.AsyncBetfairStream.authenticate"
+    )
+    @mock.patch(
+        "betfairlightweight.streaming.betfairstream.AsyncBetfairStream._connect"
+    )
+    async def test_start(self, mock_connect, mock_authenticate, mock_read_loop):
+        await self.betfair_stream.start()
+        mock_connect.assert_awaited_with()
+        mock_authenticate.assert_awaited_with()
+        mock_read_loop.assert_awaited_with()
+
+        self.betfair_stream._running = True
+        mock_connect.reset_mock()
+        await self.betfair_stream.start()
+        mock_connect.assert_not_awaited()
+
+    async def test_stop(self):
+        self.betfair_stream._running = True
+        self.betfair_stream._writer = self.mock_writer
+        await self.betfair_stream.stop()
+        assert self.betfair_stream._running is False
+        assert self.betfair_stream._writer is None
+        self.mock_writer.close.assert_called_with()
+        self.mock_writer.wait_closed.assert_awaited_with()
+
+        # already stopped
+        await self.betfair_stream.stop()
+        assert self.mock_writer.close.call_count == 1
+
+    @mock.patch("betfairlightweight.streaming.betfairstream.AsyncBetfairStream._data")
+    @mock.patch(
+        "betfairlightweight.streaming.betfairstream.AsyncBetfairStream._receive"
+    )
+    @mock.patch("betfairlightweight.streaming.betfairstream.AsyncBetfairStream._send")
+    async def test_authenticate(self, mock_send, mock_receive, mock_data):
+        unique_id = await self.betfair_stream.authenticate()
+        assert unique_id == 2
+        mock_send.assert_awaited_with(
+            {
+                "id": 2,
+                "appKey": "app_key",
+                "session": "session_token",
+                "op": "authentication",
+            }
+        )
+        mock_data.assert_called_with(mock_receive.return_value)
+
+    @mock.patch("betfairlightweight.streaming.betfairstream.AsyncBetfairStream._send")
+    async def test_subscribe_to_markets(self, mock_send):
+        market_filter = {"test": 123}
+        market_data_filter = {"another_test": 123}
+        await self.betfair_stream.subscribe_to_markets(
+            market_filter, market_data_filter, conflate_ms=123
+        )
+        mock_send.assert_awaited_with(
+            {
+                "op": "marketSubscription",
+                "id": 2,
+                "marketFilter": market_filter,
+                "marketDataFilter": market_data_filter,
+                "initialClk": None,
+                "clk": None,
+                "conflateMs": 123,
+                "heartbeatMs": None,
+                "segmentationEnabled": True,
+            }
+        )
+        self.mock_listener.register_stream.assert_called_with(2, "marketSubscription")
+        assert self.mock_listener.conflate_ms == 123
+
+    @mock.patch("betfairlightweight.streaming.betfairstream.AsyncBetfairStream._send")
+    async def test_subscribe_to_orders(self, mock_send):
+        await self.betfair_stream.subscribe_to_orders(initial_clk="a", clk="b")
+        self.mock_listener.update_unique_id.assert_called_with(2)
+        assert mock_send.await_count == 1
+
+    @mock.patch("betfairlightweight.streaming.betfairstream.AsyncBetfairStream._data")
+    @mock.patch(
+        "betfairlightweight.streaming.betfairstream.AsyncBetfairStream._open_connection"
+    )
+    async def test_connect(self, mock_open_connection, mock_data):
+        mock_open_connection.return_value = (self.mock_reader, self.mock_writer)
+        self.mock_reader.readuntil.return_value = b'{"op": "connection"}\r\n'
+        await self.betfair_stream._connect()
+        assert self.betfair_stream._running is True
+        mock_data.assert_called_with(b'{"op": "connection"}\r\n')
+
+    @mock.patch("betfairlightweight.streaming.betfairstream.asyncio.open_connection")
+    async def test_open_connection(self, mock_open_connection):
+        mock_open_connection.return_value = (self.mock_reader, self.mock_writer)
+        response = await self.betfair_stream._open_connection()
+        assert response == (self.mock_reader, self.mock_writer)
+        args, kwargs = mock_open_connection.call_args
+        assert args == ("stream-api.betfair.com", 443)
+        assert kwargs["ssl"].verify_mode == ssl.CERT_REQUIRED
+        assert kwargs["limit"] == 1024
+
+    @mock.patch("betfairlightweight.streaming.betfairstream.asyncio.open_connection")
+    async def test_open_connection_error(self, mock_open_connection):
+        mock_open_connection.side_effect = OSError()
+        with self.assertRaises(SocketError):
+            await self.betfair_stream._open_connection()
+
+    async def test_receive(self):
+        self.betfair_stream._running = True
+        self.betfair_stream._reader = self.mock_reader
+        self.mock_reader.readuntil.return_value = b'{"op": "mcm"}\r\n'
+        assert await self.betfair_stream._receive() == b'{"op": "mcm"}\r\n'
+        self.mock_reader.readuntil.assert_awaited_with(b"\r\n")
+
+    async def test_receive_closed(self):
+        self.betfair_stream._running = True
+        self.betfair_stream._reader = self.mock_reader
+        self.betfair_stream._writer = self.mock_writer
+        self.mock_reader.readuntil.side_effect = asyncio.IncompleteReadError(b"", 2)
+        with self.assertRaises(SocketError):
+            await self.betfair_stream._receive()
+        assert self.betfair_stream._running is False
+
+    async def test_receive_timeout(self):
+        self.betfair_stream._running = True
+        self.betfair_stream._reader = self.mock_reader
+        self.mock_reader.readuntil.side_effect = asyncio.TimeoutError()
+        with self.assertRaises(SocketError):
+            await self.betfair_stream._receive()
+
+        self.betfair_stream._running = False
+        assert await self.betfair_stream._receive() is None
+
+    async def test_receive_stopped(self):
+        self.betfair_stream._reader = None  # stop called
+        assert await self.betfair_stream._receive() is None
+
+    @mock.patch("betfairlightweight.streaming.betfairstream.AsyncBetfairStream._data")
+    @mock.patch(
+        "betfairlightweight.streaming.betfairstream.AsyncBetfairStream._receive"
+    )
+    async def test_read_loop(self, mock_receive, mock_data):
+        def receive():
+            if mock_receive.await_count == 2:
+                self.betfair_stream._running = False
+            return "data"
+
+        mock_receive.side_effect = receive
+        self.betfair_stream._running = True
+        await self.betfair_stream._read_loop()
+        mock_data.assert_called_once_with("data")
+        assert self.betfair_stream.receive_count == 1
+        assert self.betfair_stream.datetime_last_received is not None
+
+    async def test_data(self):
+        self.betfair_stream._running = True
+        self.betfair_stream._writer = self.mock_writer
+        with self.assertRaises(ListenerError):
+            await self.betfair_stream._data(b'{"op": "mcm"}')
+        self.mock_listener.on_data.assert_called_with(b'{"op": "mcm"}')
+        assert self.betfair_stream._running is False
+        self.mock_writer.wait_closed.assert_awaited_with()
+
+        self.mock_listener.on_data.return_value = None
+        await self.betfair_stream._data(b'{"op": "mcm"}')
+
+    async def test_send(self):
+        self.betfair_stream._running = True
+        self.betfair_stream._writer = self.mock_writer
+        message = {"op": "heartbeat", "id": 2}
+        await self.betfair_stream._send(message)
+        self.mock_writer.write.assert_called_with(self.betfair_stream._encode(message))
+        data = self.mock_writer.write.call_args[0][0]
+        assert data.endswith(b"\r\n")
+        assert json.loads(data) == message
+        self.mock_writer.drain.assert_awaited_with()
+
+    async def test_send_error(self):
+        self.betfair_stream._running = True
+        self.betfair_stream._writer = self.mock_writer
+        self.mock_writer.drain.side_effect = OSError()
+        with self.assertRaises(SocketError):
+            await self.betfair_stream._send({})
+        assert self.betfair_stream._running is False
+
+    def test_repr(self):
+        assert repr(self.betfair_stream) == "<AsyncBetfairStream>"
+
+    def test_str(self):
+        assert str(self.betfair_stream) == "<AsyncBetfairStream [not running]>"
+        self.betfair_stream._running = True
+        assert str(self.betfair_stream) == "<AsyncBetfairStream [running]>"
+
+
 class HistoricalStreamTest(unittest.TestCase):
     def setUp(self):
         self.file_path = "tests/resources/historicaldata/BASIC-1.132153978"
@@ -431,6 +766,14 @@ class HistoricalStreamTest(unittest.TestCase):
         assert self.stream.listener == self.listener
         assert self.stream._running is False
         assert self.stream.operation == self.operation
+        assert self.stream.threaded is False
+        assert self.stream.buffer_size == 2**20
+        assert self.stream.market_ids is None
+        assert self.stream.start_publish_time is None
+        assert self.stream.end_publish_time is None
+        assert self.stream.index is None
+        assert self.stream.filtered is False
+        assert self.stream._warming_up is False
 
     @mock.patch("betfairlightweight.endpoints.streaming.HistoricalStream._read_loop")
     def test_start(self, mock_read_loop):
@@ -453,6 +796,72 @@ class HistoricalStreamTest(unittest.TestCase):
         self.assertTrue(self.stream._running)
         self.listener.register_stream.assert_called_with(0, self.operation)
 
+    @mock.patch("betfairlightweight.streaming.betfairstream.HistoricalStream.stop")
+    def test__read_loop_threaded(self, mock_stop):
+        self.stream.threaded = True
+        self.stream._running = True
+        self.stream._read_loop()
+        self.assertEqual(self.listener.on_data.call_count, 480)
+        self.listener.on_data.assert_called_with(mock.ANY)
+        self.assertIsInstance(self.listener.on_data.call_args[0][0], bytes)
+        mock_stop.assert_called_with()
+
+    def test__read_loop_threaded_stop(self):
+        self.stream.threaded = True
+        self.stream.buffer_size = 2
+        self.listener.on_data.side_effect = lambda _: self.stream.stop()
+        self.stream.start()
+        self.assertEqual(self.listener.on_data.call_count, 1)
+
+    def test__read_loop_listener_error(self):
+        self.listener.on_data.return_value = False
+        with self.assertRaises(ListenerError):
+            self.stream.start()
+        self.assertFalse(self.stream._running)
+
+    def test_open(self):
+        with open(self.file_path, "rb") as f:
+            data = f.read()
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        for ext, compress in (
+            ("", lambda d: d),
+            (".bz2", bz2.compress),
+            (".gz", gzip.compress),
+            (".xz", lzma.compress),
+        ):
+            file_path = os.path.join(directory, "1.132153978" + ext)
+            with open(file_path, "wb") as f:
+                f.write(compress(data))
+            self.stream.file_path = file_path
+            with self.stream._open() as f:
+                self.assertEqual(f.read(), data)
+
+    @unittest.skipIf(zstandard is None, "zstandard not installed")
+    def test_open_zst(self):
+        with open(self.file_path, "rb") as f:
+            data = f.read()
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.stream.file_path = os.path.join(directory, "1.132153978.zst")
+        with open(self.stream.file_path, "wb") as f:
+            f.write(zstandard.ZstdCompressor().compress(data))
+        with self.stream._open() as f:
+            self.assertEqual(f.read(), data)
+
+    @mock.patch("betfairlightweight.streaming.betfairstream.zstandard", None)
+    def test_open_zst_missing(self):
+        self.stream.file_path = "1.132153978.zst"
+        with self.assertRaises(ImportError):
+            self.stream._open()
+
+    def test_open_file_like(self):
+        f = io.BytesIO(b"{}\n")
+        self.stream.file_path = f
+        with self.stream._open() as opened:
+            self.assertEqual(opened, f)
+        self.assertFalse(f.closed)
+
 
 class HistoricalGeneratorStreamTest(unittest.TestCase):
     def setUp(self):
@@ -469,11 +878,19 @@ class HistoricalGeneratorStreamTest(unittest.TestCase):
         assert self.stream._running is False
         assert self.stream.operation == self.operation
 
+    @mock.patch(
+        "betfairlightweight.streaming.betfairstream.HistoricalGeneratorStream._read_loop_conflated"
+    )
     @mock.patch(
         "betfairlightweight.streaming.betfairstream.HistoricalGeneratorStream._read_loop"
     )
-    def test_get_generator(self, mock_read_loop):
+    def test_get_generator(self, mock_read_loop, mock_read_loop_conflated):
         self.assertEqual(self.stream.get_generator(), mock_read_loop)
+        self.stream.conflate_ms = 0
+        self.assertEqual(self.stream.get_generator(), mock_read_loop_conflated)
+        self.stream.conflate_ms = None
+        self.stream.changed_only = True
+        self.assertEqual(self.stream.get_generator(), mock_read_loop_conflated)
 
     @mock.patch(
         "betfairlightweight.streaming.betfairstream.HistoricalGeneratorStream.stop"
@@ -4,7 +4,7 @@ from unittest import mock
 from betfairlightweight import APIClient
 from betfairlightweight import resources
 from betfairlightweight.endpoints.betting import Betting
-from betfairlightweight.exceptions import APIError
+from betfairlightweight.exceptions import APIError, RateLimitError
 from tests.tools import create_mock_json
 
 
@@ -254,3 +254,264 @@ class BettingTest(unittest.TestCase):
             None,
         )
         assert isinstance(response, resources.ReplaceOrders)
+
+    @mock.patch("betfairlightweight.endpoints.betting.Betting.list_market_book")
+    def test_list_market_book_chunked(self, mock_list_market_book):
+        market_ids = [str(i) for i in range(25)]
+        mock_list_market_book.side_effect = lambda chunk, **kwargs: [
+            {"marketId": market_id} for market_id in reversed(chunk)
+        ]
+        price_projection = {"priceData": ["EX_BEST_OFFERS", "EX_TRADED"]}
+
+        response = self.betting.list_market_book_chunked(
+            market_ids, price_projection=price_projection, order_projection="ALL"
+        )
+        assert [r["marketId"] for r in response] == market_ids
+        assert mock_list_market_book.call_count == 3
+        mock_list_market_book.assert_any_call(
+            market_ids[:10],
+            price_projection=price_projection,
+            session=None,
+            lightweight=None,
+            order_projection="ALL",
+        )
+        mock_list_market_book.assert_any_call(
+            market_ids[20:],
+            price_projection=price_projection,
+            session=None,
+            lightweight=None,
+            order_projection="ALL",
+        )
+
+    @mock.patch("betfairlightweight.endpoints.betting.Betting.list_market_book")
+    def test_list_market_book_chunked_single(self, mock_list_market_book):
+        mock_list_market_book.return_value = [mock.Mock(market_id="1.2")]
+
+        response = self.betting.list_market_book_chunked(["1.2"])
+        assert response == mock_list_market_book.return_value
+        mock_list_market_book.assert_called_once_with(
+            ["1.2"], price_projection=None, session=None, lightweight=None
+        )
+
+    @mock.patch("betfairlightweight.endpoints.betting.Betting.list_market_catalogue")
+    def test_list_market_catalogue_chunked(self, mock_list_market_catalogue):
+        market_ids = [str(i) for i in range(150)]
+        mock_list_market_catalogue.side_effect = lambda **kwargs: [
+            mock.Mock(market_id=market_id)
+            for market_id in kwargs["filter"]["marketIds"]
+        ]
+
+        response = self.betting.list_market_catalogue_chunked(
+            market_ids, market_projection=["MARKET_DESCRIPTION", "RUNNER_METADATA"]
+        )
+        assert [r.market_id for r in response] == market_ids
+        assert mock_list_market_catalogue.call_count == 2
+        mock_list_market_catalogue.assert_any_call(
+            filter={"marketIds": market_ids[100:]},
+            market_projection=["MARKET_DESCRIPTION", "RUNNER_METADATA"],
+            max_results=50,
+            locale=None,
+            session=None,
+            lightweight=None,
+        )
+
+    def test_merge_chunks(self):
+        results = [
+            [{"marketId": "1.3"}, {"marketId": "1.1"}],
+            [mock.Mock(market_id="1.4"), mock.Mock(market_id="1.2")],
+        ]
+        response = self.betting._merge_chunks(["1.1", "1.2", "1.3", "1.4"], results)
+        assert response[0] == {"marketId": "1.1"}
+        assert response[1].market_id == "1.2"
+        assert response[2] == {"marketId": "1.3"}
+        assert response[3].market_id == "1.4"
+
+    @mock.patch("betfairlightweight.endpoints.betting.Betting.request")
+    def test_place_orders_batched(self, mock_request):
+        def request(method, params, session):
+            reports = [
+                {"status": "SUCCESS", "instruction": i} for i in params["instructions"]
+            ]
+            status = "FAILURE" if len(reports) < 200 else "SUCCESS"
+            result = {
+                "status": status,
+                "marketId": params["marketId"],
+                "instructionReports": reports,
+            }
+            return mock.Mock(), {"result": result}, len(reports) / 1000
+
+        mock_request.side_effect = request
+        instructions = [{"selectionId": i} for i in range(250)]
+
+        response = self.betting.place_orders_batched(
+            {"1.1": instructions, "1.2": instructions[:2]},
+            customer_strategy_ref="test",
+            lightweight=True,
+        )
+        assert mock_request.call_count == 3
+        mock_request.assert_any_call(
+            "SportsAPING/v1.0/placeOrders",
+            {
+                "marketId": "1.1",
+                "instructions": instructions[200:],
+                "customerStrategyRef": "test",
+            },
+            None,
+        )
+        assert [r["marketId"] for r in response] == ["1.1", "1.2"]
+        reports = response[0]["instructionReports"]
+        assert [r["instruction"] for r in reports] == instructions
+        assert reports[0]["elapsedTime"] == 0.2
+        assert reports[-1]["elapsedTime"] == 0.05
+        assert response[0]["status"] == "PROCESSED_WITH_ERRORS"
+        assert response[1]["status"] == "FAILURE"
+
+    @mock.patch("betfairlightweight.endpoints.betting.Betting.request")
+    def test_place_orders_batched_error(self, mock_request):
+        def request(method, params, session):
+            if params["instructions"][0]["selectionId"] == 200:
+                raise APIError(None, method, params, ConnectionError())
+            elif params["marketId"] == "1.2":
+                raise APIError({"error": {}}, method, params)
+            reports = [
+                {"status": "SUCCESS", "instruction": i} for i in params["instructions"]
+            ]
+            result = {
+                "status": "SUCCESS",
+                "marketId": params["marketId"],
+                "instructionReports": reports,
+            }
+            return mock.Mock(), {"result": result}, 0.1
+
+        mock_request.side_effect = request
+        instructions = [{"selectionId": i} for i in range(250)]
+
+        with self.assertLogs("betfairlightweight.endpoints.betting", "ERROR"):
+            response = self.betting.place_orders_batched(
+                {"1.1": instructions, "1.2": instructions[:2]}, lightweight=True
+            )
+        assert mock_request.call_count == 3
+        reports = response[0]["instructionReports"]
+        assert [r["instruction"] for r in reports] == instructions
+        assert {r["status"] for r in reports[:200]} == {"SUCCESS"}
+        assert reports[200] == {
+            "status": "TIMEOUT",
+            "instruction": {"selectionId": 200},
+            "elapsedTime": 0,
+        }
+        assert response[0]["status"] == "TIMEOUT"
+        assert response[0]["errorCode"] == "SERVICE_UNAVAILABLE"
+        assert response[1]["status"] == "FAILURE"
+        assert response[1]["instructionReports"][0]["status"] == "FAILURE"
+        assert response[1]["instructionReports"][0]["errorCode"] == "ERROR_IN_ORDER"
+
+    @mock.patch("betfairlightweight.endpoints.betting.Betting.request")
+    def test_replace_orders_batched_error(self, mock_request):
+        mock_request.side_effect = RateLimitError("limit")
+        with self.assertLogs("betfairlightweight.endpoints.betting", "ERROR"):
+            response = self.betting.replace_orders_batched(
+                {"1.1": [{"betId": "123", "newPrice": 2}]}
+            )
+        assert isinstance(response[0], resources.ReplaceOrders)
+        assert response[0].status == "FAILURE"
+        report = response[0].replace_instruction_reports[0]
+        assert report.error_code == "ERROR_IN_ORDER"
+        assert report.cancel_instruction_reports.instruction.bet_id == "123"
+        assert report.place_instruction_reports.status == "FAILURE"
+
+    @mock.patch("betfairlightweight.endpoints.betting.Betting.request")
+    def test_cancel_orders_batched(self, mock_request):
+        mock = create_mock_json("tests/resources/cancel_orders.json")
+        mock_request.return_value = (mock.Mock(), mock.json(), 1.3)
+
+        response = self.betting.cancel_orders_batched(
+            {"1.125897784": [{"betId": "71965147269"}]}
+        )
+        mock_request.assert_called_once_with(
+            "SportsAPING/v1.0/cancelOrders",
+            {"marketId": "1.125897784", "instructions": [{"betId": "71965147269"}]},
+            None,
+        )
+        assert isinstance(response[0], resources.CancelOrders)
+        assert response[0].elapsed_time == 1.3
+        assert response[0].cancel_instruction_reports[0].elapsed_time == 1.3
+
+    @mock.patch("betfairlightweight.endpoints.betting.Betting._batch_orders")
+    def test_update_replace_orders_batched(self, mock_batch_orders):
+        orders = {"1.1": []}
+        self.betting.update_orders_batched(orders)
+        mock_batch_orders.assert_called_with(
+            "updateOrders", resources.UpdateOrders, orders, 10, None, None
+        )
+        self.betting.replace_orders_batched(orders, async_=True)
+        mock_batch_orders.assert_called_with(
+            "replaceOrders",
+            resources.ReplaceOrders,
+            orders,
+            10,
+            None,
+            None,
+            **{"async": True},
+        )
+
+    def test_order_chunks(self):
+        chunks = self.betting._order_chunks(
+            "cancelOrders", {"1.1": list(range(130)), "1.2": [1]}, {"async": None}
+        )
+        assert [(c["marketId"], len(c["instructions"])) for c in chunks] == [
+            ("1.1", 60),
+            ("1.1", 60),
+            ("1.1", 10),
+            ("1.2", 1),
+        ]
+        assert "async" not in chunks[0]
+
+    @mock.patch("betfairlightweight.endpoints.betting.Betting.list_cleared_orders")
+    def test_iter_cleared_orders(self, mock_list_cleared_orders):
+        mock_list_cleared_orders.side_effect = [
+            mock.Mock(orders=[1, 2], more_available=True),
+            mock.Mock(orders=[3, 4], more_available=True),
+            mock.Mock(orders=[], more_available=True),
+        ]
+        orders = list(
+            self.betting.iter_cleared_orders(page_size=2, bet_status="LAPSED")
+        )
+
+        assert orders == [1, 2, 3, 4]
+        assert mock_list_cleared_orders.call_args_list == [
+            mock.call(from_record=0, record_count=2, bet_status="LAPSED"),
+            mock.call(from_record=2, record_count=2, bet_status="LAPSED"),
+            mock.call(from_record=4, record_count=2, bet_status="LAPSED"),
+        ]
+
+    @mock.patch("betfairlightweight.endpoints.betting.Betting.list_cleared_orders")
+    def test_iter_cleared_orders_prefetch(self, mock_list_cleared_orders):
+        mock_list_cleared_orders.side_effect = [
+            {"clearedOrders": [1, 2], "moreAvailable": True},
+            {"clearedOrders": [3], "moreAvailable": False},
+        ]
+        orders = self.betting.iter_cleared_orders(page_size=2, prefetch=True)
+
+        assert next(orders) == 1
+        assert list(orders) == [2, 3]
+        assert mock_list_cleared_orders.call_count == 2
+        mock_list_cleared_orders.assert_called_with(from_record=2, record_count=2)
+
+    @mock.patch("betfairlightweight.endpoints.betting.Betting.list_current_orders")
+    def test_iter_current_orders(self, mock_list_current_orders):
+        mock_list_current_orders.side_effect = lambda **kwargs: {
+            "currentOrders": [len(kwargs["market_ids"])],
+            "moreAvailable": False,
+        }
+        market_ids = [str(i) for i in range(300)]
+        orders = list(
+            self.betting.iter_current_orders(market_ids=market_ids, from_record=5)
+        )
+
+        assert orders == [250, 50]
+        mock_list_current_orders.assert_any_call(
+            from_record=5, record_count=1000, market_ids=market_ids[:250]
+        )
+        mock_list_current_orders.assert_called_with(
+            from_record=5, record_count=1000, market_ids=market_ids[250:]
+        )
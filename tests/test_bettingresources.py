@@ -400,6 +400,8 @@ class BettingResourcesTest(unittest.TestCase):
             assert resource.version == market_book["version"]
 
             assert len(resource.runners) == len(market_book["runners"])
+            for runner in resource.runners:
+                assert runner.selection_id == vars(runner)["selection_id"]
 
             assert resource.market_id == resource["marketId"]
             assert resource.bet_delay == resource["betDelay"]
@@ -2,6 +2,12 @@ import unittest
 from unittest import mock
 
 from betfairlightweight.resources.baseresource import BaseResource
+from betfairlightweight.resources.bettingresources import (
+    MarketBook,
+    RunnerBook,
+    RunnerBookEX,
+    RunnerBookSP,
+)
 from betfairlightweight.streaming.cache import (
     OrderBookCache,
     OrderBookRunner,
@@ -9,9 +15,12 @@ from betfairlightweight.streaming.cache import (
     MarketBookCache,
     RunnerBookCache,
     Available,
+    CompactAvailable,
+    TickAvailable,
     RaceCache,
     CricketMatchCache,
 )
+from betfairlightweight.streaming.snapshot import MarketBookSnapshot
 from tests.tools import create_mock_json
 
 
@@ -62,6 +71,13 @@ class TestAvailable(unittest.TestCase):
             ],
         )
 
+    def test_get_size(self):
+        self.assertEqual(self.available.get_size(1), 34.45)
+        self.assertEqual(self.available.get_size(2), 0)
+
+    def test_total_size(self):
+        self.assertEqual(self.available.total_size, 46.45)
+
     @mock.patch("betfairlightweight.streaming.cache.Available.serialise")
     def test_clear(self, mock_serialise):
         self.available.clear()
@@ -104,6 +120,9 @@ class TestAvailable(unittest.TestCase):
         self.assertEqual(self.available.order_book, expected)
         mock_serialise.assert_not_called()
         mock__sort_order_book.assert_not_called()
+        self.assertTrue(self.available.stale)
+        self.available.refresh()
+        self.assertFalse(self.available.stale)
 
     @mock.patch("betfairlightweight.streaming.cache.Available._sort_order_book")
     @mock.patch("betfairlightweight.streaming.cache.Available.serialise")
@@ -241,6 +260,142 @@ class TestAvailable(unittest.TestCase):
         mock__sort_order_book.assert_called()
 
 
+class TestCompactAvailable(unittest.TestCase):
+    def setUp(self):
+        self.prices = [[1, 1.02, 34.45], [0, 1.01, 12]]
+        self.available = CompactAvailable(self.prices, 2)
+
+    def test_init(self):
+        self.assertEqual(
+            self.available.order_book,
+            {0: {"price": 1.01, "size": 12}, 1: {"price": 1.02, "size": 34.45}},
+        )
+        self.assertEqual(
+            self.available.serialised,
+            [{"price": 1.01, "size": 12}, {"price": 1.02, "size": 34.45}],
+        )
+        # streaming update untouched
+        self.assertEqual(self.prices, [[1, 1.02, 34.45], [0, 1.01, 12]])
+
+    def test_update(self):
+        self.available.update([[1, 1.03, 2], [0, 1.01, 0], [5, 1.1, 0]], True)
+        self.assertEqual(self.available.order_book, {1: {"price": 1.03, "size": 2}})
+        self.assertEqual(self.available.serialised, [{"price": 1.03, "size": 2}])
+
+    @mock.patch("betfairlightweight.streaming.cache.CompactAvailable.serialise")
+    def test_update_false(self, mock_serialise):
+        self.available.update([[2, 1.03, 2]], False)
+        mock_serialise.assert_not_called()
+        self.assertTrue(self.available.stale)
+
+    def test_get_size(self):
+        self.assertEqual(self.available.get_size(1), 34.45)
+        self.assertEqual(self.available.get_size(2), 0)
+
+    def test_total_size(self):
+        self.assertEqual(self.available.total_size, 46.45)
+
+    def test_matches_available(self):
+        updates = [
+            [[4.1, 2], [1.5, 3.2], [990, 2]],
+            [[4.1, 0], [21, 5], [1.5, 1.1]],
+            [[3.05, 12], [1.5, 0], [5, 0]],
+        ]
+        for reverse in (False, True):
+            available = Available([], 1, reverse)
+            compact_available = CompactAvailable([], 1, reverse)
+            for update in updates:
+                available.update(update, True)
+                compact_available.update(update, True)
+                self.assertEqual(available.serialised, compact_available.serialised)
+
+
+class TestTickAvailable(unittest.TestCase):
+    def setUp(self):
+        self.prices = [[1.02, 34.45], [1.01, 12]]
+        self.available = TickAvailable(self.prices)
+
+    def test_init(self):
+        self.assertEqual(self.available.order_book, [0, 1])
+        self.assertEqual(self.available.sizes[0], 12)
+        self.assertEqual(self.available.sizes[1], 34.45)
+        self.assertEqual(len(self.available.sizes), 350)
+        self.assertFalse(self.available.reverse)
+        self.assertEqual(
+            self.available.serialised,
+            [{"price": 1.01, "size": 12}, {"price": 1.02, "size": 34.45}],
+        )
+
+    def test_serialise_reverse(self):
+        current = [[27, 0.95], [13, 28.01], [1.02, 1157.21]]
+        available = TickAvailable(current, True)
+        self.assertEqual(
+            available.serialised,
+            [
+                {"price": 27, "size": 0.95},
+                {"price": 13, "size": 28.01},
+                {"price": 1.02, "size": 1157.21},
+            ],
+        )
+
+    def test_update(self):
+        self.available.update([[1.01, 2], [2.02, 6.9]], True)
+        self.assertEqual(self.available.order_book, [0, 1, 100])
+        self.assertEqual(
+            self.available.serialised,
+            [
+                {"price": 1.01, "size": 2},
+                {"price": 1.02, "size": 34.45},
+                {"price": 2.02, "size": 6.9},
+            ],
+        )
+
+    @mock.patch("betfairlightweight.streaming.cache.TickAvailable.serialise")
+    def test_update_false(self, mock_serialise):
+        self.available.update([[1.01, 2]], False)
+        mock_serialise.assert_not_called()
+        self.assertEqual(self.available.sizes[0], 2)
+
+    def test_update_del(self):
+        self.available.update([[1.02, 0], [1000, 0]], True)
+        self.assertEqual(self.available.order_book, [0])
+        self.assertEqual(self.available.sizes[1], 0)
+        self.assertIsNone(self.available.levels[1])
+        self.assertEqual(self.available.serialised, [{"price": 1.01, "size": 12}])
+
+    def test_get_size(self):
+        self.assertEqual(self.available.get_size(1.02), 34.45)
+        self.assertEqual(self.available.get_size(1.03), 0)
+        self.assertEqual(self.available.get_size(1.015), 0)
+
+    def test_total_size(self):
+        self.assertEqual(self.available.total_size, 46.45)
+
+    def test_update_invalid_price(self):
+        with self.assertRaises(ValueError):
+            self.available.update([[1.015, 2]], True)
+
+    def test_clear(self):
+        self.available.clear()
+        self.assertEqual(self.available.order_book, [])
+        self.assertEqual(self.available.sizes[0], 0)
+        self.assertEqual(self.available.serialised, [])
+
+    def test_matches_available(self):
+        updates = [
+            [[4.1, 2], [1.5, 3.2], [990, 2]],
+            [[4.1, 0], [21, 5], [1.5, 1.1]],
+            [[3.05, 12], [1.5, 0], [5, 0]],
+        ]
+        for reverse in (False, True):
+            available = Available([], 1, reverse)
+            tick_available = TickAvailable([], reverse)
+            for update in updates:
+                available.update(update, True)
+                tick_available.update(update, True)
+                self.assertEqual(available.serialised, tick_available.serialised)
+
+
 class TestMarketBookCache(unittest.TestCase):
     def setUp(self):
         self.market_book_cache = MarketBookCache("1.2345", 12345, True, False, False)
@@ -271,6 +426,9 @@ class TestMarketBookCache(unittest.TestCase):
         self.assertEqual(self.market_book_cache.runners, [])
         self.assertEqual(self.market_book_cache.runner_dict, {})
         self.assertEqual(self.market_book_cache._number_of_runners, 0)
+        self.assertIsNone(self.market_book_cache.market_data_fields)
+        self.assertEqual(self.market_book_cache._ignored_keys, frozenset())
+        self.assertFalse(self.market_book_cache.immutable)
 
     @mock.patch("betfairlightweight.streaming.cache.MarketBookCache.strip_datetime")
     def test_update_cache_md(self, mock_strip_datetime):
@@ -325,6 +483,89 @@ class TestMarketBookCache(unittest.TestCase):
     #
     #         assert self.market_book_cache.total_matched == book.get('tv')
 
+    def test_update_cache_lazy_serialise(self):
+        updates = [
+            {
+                "rc": [
+                    {"id": 1, "atb": [[1.5, 2]], "trd": [[1.5, 10]], "tv": 10},
+                    {"id": 2, "atl": [[3.1, 5.5]]},
+                ]
+            },
+            {"rc": [{"id": 1, "atb": [[1.6, 3]], "trd": [[1.4, 2.5]]}]},
+            {"rc": [{"id": 2, "atl": [[3.1, 0], [3.2, 1]], "trd": [[3.1, 4]]}]},
+            {"rc": [{"id": 1, "trd": []}]},
+        ]
+        for calculate_market_tv, cumulative_runner_tv in ((True, True), (False, False)):
+            market_book_cache = MarketBookCache(
+                "1.2345", 12345, True, calculate_market_tv, cumulative_runner_tv
+            )
+            lazy_market_book_cache = MarketBookCache(
+                "1.2345",
+                12345,
+                True,
+                calculate_market_tv,
+                cumulative_runner_tv,
+                lazy_serialise=True,
+            )
+            for update in updates:
+                market_book_cache.update_cache(update, 123, True)
+                lazy_market_book_cache.update_cache(update, 123, True)
+                self.assertTrue(lazy_market_book_cache._stale_runners)
+                self.assertEqual(
+                    market_book_cache.create_resource(1),
+                    lazy_market_book_cache.create_resource(1),
+                )
+                self.assertFalse(lazy_market_book_cache._stale_runners)
+
+    def test_update_cache_market_data_fields(self):
+        market_book_cache = MarketBookCache(
+            "1.2345",
+            12345,
+            True,
+            False,
+            False,
+            market_data_fields=["EX_BEST_OFFERS", "EX_LTP"],
+        )
+        self.assertEqual(
+            market_book_cache._ignored_keys,
+            {"bdatb", "bdatl", "atb", "atl", "trd", "tv", "spb", "spl", "spn", "spf"},
+        )
+        market_change = {
+            "tv": 20,
+            "rc": [
+                {
+                    "id": 1,
+                    "batb": [[0, 1.5, 2]],
+                    "atb": [[1.5, 2]],
+                    "trd": [[1.5, 10]],
+                    "tv": 10,
+                    "ltp": 1.5,
+                    "spn": 1.4,
+                }
+            ],
+        }
+        for _ in range(2):  # new then existing runner
+            market_book_cache.update_cache(market_change, 123, True)
+            runner = market_book_cache.runners[0]
+            self.assertEqual(runner.last_price_traded, 1.5)
+            self.assertEqual(
+                runner.serialised["ex"]["availableToBack"], [{"price": 1.5, "size": 2}]
+            )
+            self.assertEqual(runner.available_to_back.order_book, {})
+            self.assertEqual(runner.traded.order_book, {})
+            self.assertEqual(runner.total_matched, 0)
+            self.assertIsNone(runner.starting_price_near)
+            self.assertEqual(market_book_cache.total_matched, 0)
+        # update not modified
+        self.assertEqual(market_book_cache.streaming_update, market_change)
+        self.assertEqual(len(market_change["rc"][0]), 7)
+
+    def test_market_data_fields_error(self):
+        with self.assertRaises(ValueError):
+            MarketBookCache(
+                "1.2345", 12345, True, False, False, market_data_fields=["X"]
+            )
+
     def test_refresh_cache(self):
         mock_runner = mock.Mock()
         self.market_book_cache.runners = [mock_runner]
@@ -360,7 +601,7 @@ class TestMarketBookCache(unittest.TestCase):
         # not lightweight
         self.market_book_cache.lightweight = False
         market_book = self.market_book_cache.create_resource(1234, snap=True)
-        assert market_book == mock_market_book()
+        assert market_book == mock_market_book.create()
 
     @mock.patch(
         "betfairlightweight.streaming.cache.MarketBookCache.serialise",
@@ -376,13 +617,150 @@ class TestMarketBookCache(unittest.TestCase):
             "streaming_snap": True,
         }
 
-    @mock.patch("betfairlightweight.streaming.cache.MarketBook")
-    def test_create_resource_resource(self, mock_market_book):
-        self.market_book_cache.lightweight = False
+    def test_create_resource_immutable(self):
+        market_book_cache = MarketBookCache(
+            "1.2345", 12345, False, False, False, immutable=True
+        )
+        market_book_cache.update_cache(
+            {
+                "rc": [
+                    {"id": 1, "atb": [[1.5, 2]], "trd": [[1.5, 10]], "ltp": 1.5},
+                    {"id": 2, "atb": [[3.0, 5]]},
+                ]
+            },
+            123,
+            True,
+        )
+        snapshot = market_book_cache.create_resource(1234, snap=True)
+        self.assertIsInstance(snapshot, MarketBookSnapshot)
+        self.assertEqual(snapshot.market_id, "1.2345")
+        self.assertEqual(snapshot.publish_time, 123)
+        self.assertEqual(snapshot.streaming_unique_id, 1234)
+        self.assertTrue(snapshot.streaming_snap)
+        runner_one, runner_two = snapshot.runners
+        self.assertEqual(runner_one.selection_id, 1)
+        self.assertEqual(runner_one.last_price_traded, 1.5)
+        self.assertEqual(runner_one.ex.available_to_back, ((1.5, 2),))
+        self.assertEqual(runner_one.ex.traded_volume[0].size, 10)
+        self.assertEqual(runner_one.sp.back_stake_taken, ())
+        with self.assertRaises(AttributeError):
+            runner_one.last_price_traded = 2
+        with self.assertRaises(TypeError):
+            snapshot.market_definition["status"] = "OPEN"
+        # nested values frozen
+        self.assertIsInstance(snapshot.streaming_update["rc"], tuple)
+        with self.assertRaises(TypeError):
+            snapshot.streaming_update["rc"][0]["ltp"] = 2
+
+        # only runner one updated
+        market_book_cache.update_cache(
+            {"rc": [{"id": 1, "atl": [[1.6, 3]]}]}, 124, True
+        )
+        new_snapshot = market_book_cache.create_resource(1234)
+        self.assertEqual(new_snapshot.publish_time, 124)
+        self.assertIs(new_snapshot.runners[1], runner_two)
+        self.assertIsNot(new_snapshot.runners[0], runner_one)
+        self.assertEqual(new_snapshot.runners[0].ex.available_to_lay, ((1.6, 3),))
+        # unchanged ladders are shared
+        self.assertIs(
+            new_snapshot.runners[0].ex.available_to_back,
+            runner_one.ex.available_to_back,
+        )
+        self.assertEqual(runner_one.ex.available_to_lay, ())
+        self.assertIs(
+            market_book_cache.create_resource(1234).runners[0], new_snapshot.runners[0]
+        )
+
+    def test_create_resource_immutable_definition(self):
+        market_book_cache = MarketBookCache(
+            "1.2345", 12345, True, False, False, immutable=True
+        )
+        market_definition = {
+            "status": "OPEN",
+            "priceLadderDefinition": {"type": "CLASSIC"},
+            "runners": [{"id": 1, "hc": 0, "status": "ACTIVE", "sortPriority": 1}],
+        }
+        market_book_cache.update_cache(
+            {"marketDefinition": market_definition}, 123, True
+        )
+        snapshot = market_book_cache.create_resource(1234)
+        self.assertEqual(snapshot.market_definition["status"], "OPEN")
+        self.assertEqual(snapshot.price_ladder_definition, {"type": "CLASSIC"})
+        self.assertIsNone(snapshot.key_line_description)
+        self.assertIsInstance(snapshot.market_definition["runners"], tuple)
+        with self.assertRaises(TypeError):
+            snapshot.market_definition["runners"][0]["status"] = "REMOVED"
+        with self.assertRaises(TypeError):
+            snapshot.price_ladder_definition["type"] = "FINEST"
+        # reused until the definition is updated
+        market_book_cache.update_cache({"tv": 1}, 124, True)
+        self.assertIs(
+            market_book_cache.create_resource(1234).market_definition,
+            snapshot.market_definition,
+        )
+        market_book_cache.update_cache(
+            {"marketDefinition": dict(market_definition, status="SUSPENDED")},
+            125,
+            True,
+        )
         self.assertEqual(
-            self.market_book_cache.create_resource(1, False), mock_market_book()
+            market_book_cache.create_resource(1234).market_definition["status"],
+            "SUSPENDED",
         )
-        # todo
+
+    def test_create_resource_resource(self):
+        market_book_cache = MarketBookCache("1.2345", 12345, False, False, False)
+        market_change = create_mock_json("tests/resources/streaming_mcm_UPDATE_md.json")
+        for book in market_change.json().get("mc"):
+            market_book_cache.update_cache(book, 1497351220318, True)
+        market_book_cache.update_cache(
+            {"rc": [{"id": 3, "atb": [[1.5, 2]], "trd": [[1.5, 10]], "ltp": 1.5}]},
+            1497351220319,
+            True,
+        )
+        market_book = market_book_cache.create_resource(1, True)
+        # direct constructors match the kwargs constructors
+        data = market_book_cache.serialise
+        expected = MarketBook(market_definition=None, **data)
+        self.assertEqual(market_book.streaming_update, data.pop("streaming_update"))
+        self.assertEqual(market_book._data, data)
+        self.assertEqual(market_book.streaming_unique_id, 1)
+        self.assertTrue(market_book.streaming_snap)
+        self.assertEqual(
+            market_book.market_definition,
+            market_book_cache._market_definition_resource,
+        )
+        for attr in (
+            "market_id",
+            "bet_delay",
+            "status",
+            "inplay",
+            "number_of_runners",
+            "number_of_active_runners",
+            "total_matched",
+            "version",
+            "publish_time",
+            "publish_time_epoch",
+            "last_match_time",
+        ):
+            self.assertEqual(getattr(market_book, attr), getattr(expected, attr))
+        self.assertEqual(len(market_book.runners), len(expected.runners))
+        for runner, expected_runner in zip(market_book.runners, expected.runners):
+            self.assertEqual(runner.selection_id, expected_runner.selection_id)
+            self.assertEqual(runner.status, expected_runner.status)
+            self.assertEqual(runner.removal_date, expected_runner.removal_date)
+            self.assertEqual(
+                runner.last_price_traded, expected_runner.last_price_traded
+            )
+            self.assertEqual(runner.sp.actual_sp, expected_runner.sp.actual_sp)
+            self.assertEqual(
+                [(p.price, p.size) for p in runner.ex.available_to_back],
+                [(p.price, p.size) for p in expected_runner.ex.available_to_back],
+            )
+            self.assertEqual(
+                [(p.price, p.size) for p in runner.ex.traded_volume],
+                [(p.price, p.size) for p in expected_runner.ex.traded_volume],
+            )
 
     @mock.patch("betfairlightweight.streaming.cache.MarketDefinition")
     @mock.patch("betfairlightweight.streaming.cache.MarketBookCache._add_new_runner")
@@ -452,7 +830,12 @@ class TestMarketBookCache(unittest.TestCase):
         self.assertEqual(self.market_book_cache.runner_dict, {})
         self.market_book_cache._add_new_runner(id=1, hc=2, definition={1: 2})
         mock_runner_book_cache.assert_called_with(
-            lightweight=True, id=1, hc=2, definition={1: 2}
+            lightweight=True,
+            tick_ladder=False,
+            zero_copy=False,
+            id=1,
+            hc=2,
+            definition={1: 2},
         )
         self.assertEqual(
             self.market_book_cache.runner_dict,
@@ -466,6 +849,47 @@ class TestMarketBookCache(unittest.TestCase):
         self.assertEqual(self.market_book_cache.runners, [mock_runner_book_cache()])
         self.assertEqual(self.market_book_cache._number_of_runners, 1)
 
+    def test__use_tick_ladder(self):
+        self.assertFalse(self.market_book_cache._use_tick_ladder)
+        self.market_book_cache.tick_ladder = True
+        self.assertTrue(self.market_book_cache._use_tick_ladder)
+        self.market_book_cache._definition_price_ladder_definition = {"type": "CLASSIC"}
+        self.assertTrue(self.market_book_cache._use_tick_ladder)
+        self.market_book_cache._definition_price_ladder_definition = {
+            "type": "LINE_RANGE"
+        }
+        self.assertFalse(self.market_book_cache._use_tick_ladder)
+
+    def test_update_cache_off_tick_ladder(self):
+        # definition missing so CLASSIC is assumed
+        self.market_book_cache.tick_ladder = True
+        self.market_book_cache.calculate_market_tv = True
+        market_change = {"rc": [{"id": 1, "atb": [[1.5, 2]], "trd": [[1.5, 3]]}]}
+        self.market_book_cache.update_cache(market_change, 123, True)
+        runner = self.market_book_cache.runners[0]
+        self.assertIsInstance(runner.available_to_back, TickAvailable)
+
+        market_change = {"rc": [{"id": 1, "atb": [[1.505, 4]], "trd": [[1.505, 1]]}]}
+        with self.assertLogs("betfairlightweight.streaming.cache", "WARNING"):
+            self.market_book_cache.update_cache(market_change, 123, True)
+        self.assertIsInstance(runner.available_to_back, Available)
+        self.assertIsInstance(runner.traded, Available)
+        self.assertEqual(
+            runner.available_to_back.serialised,
+            [{"price": 1.505, "size": 4}, {"price": 1.5, "size": 2}],
+        )
+        self.assertEqual(runner.traded_volume, 4)
+        self.assertEqual(self.market_book_cache.total_matched, 4)
+
+    def test_add_new_runner_off_tick_ladder(self):
+        self.market_book_cache.tick_ladder = True
+        market_change = {"rc": [{"id": 1, "atl": [[1.505, 4]]}]}
+        with self.assertLogs("betfairlightweight.streaming.cache", "WARNING"):
+            self.market_book_cache.update_cache(market_change, 123, True)
+        runner = self.market_book_cache.runners[0]
+        self.assertIsInstance(runner.available_to_lay, Available)
+        self.assertEqual(runner.available_to_lay.get_size(1.505), 4)
+
     def test_closed(self):
         self.assertFalse(self.market_book_cache.closed)
         self.market_book_cache._definition_status = "CLOSED"
@@ -500,6 +924,41 @@ class TestMarketBookCacheCalculate(unittest.TestCase):
         self.market_book_cache.update_cache(market_change, 123, True)
         self.assertEqual(self.market_book_cache.total_matched, 2)
 
+    def test_update_cache_market_tv_incremental(self):
+        self.market_book_cache.update_cache({"rc": [{"id": 1}, {"id": 2}]}, 123, True)
+        updates = [
+            {"rc": [{"id": 1, "trd": [[1.5, 10.01], [1.6, 2]]}]},
+            {"rc": [{"id": 1, "trd": [[1.5, 12.02]]}, {"id": 2, "trd": [[3, 1]]}]},
+            {"rc": [{"id": 2, "trd": [[3, 4.5], [3.05, 0.25]]}]},
+            {"rc": [{"id": 1, "trd": []}]},
+        ]
+        for update in updates:
+            self.market_book_cache.update_cache(update, 123, True)
+            self.assertEqual(
+                self.market_book_cache.total_matched,
+                round(
+                    sum(
+                        vol["size"]
+                        for runner in self.market_book_cache.runners
+                        for vol in runner.traded.serialised
+                    ),
+                    2,
+                ),
+            )
+        self.assertEqual(self.market_book_cache.total_matched, 4.75)
+
+    def test_update_cache_verify_tv(self):
+        self.market_book_cache.verify_tv = True
+        market_change = {"rc": [{"id": 1, "trd": [[12, 2]]}]}
+        self.market_book_cache.update_cache(market_change, 123, True)
+        self.market_book_cache.runners[0].traded_volume = 100
+        self.market_book_cache._traded_volume = 100
+        market_change = {"rc": [{"id": 1, "trd": [[12, 3]]}]}
+        with self.assertLogs("betfairlightweight.streaming.cache", "WARNING"):
+            self.market_book_cache.update_cache(market_change, 123, True)
+        self.assertEqual(self.market_book_cache.runners[0].traded_volume, 3)
+        self.assertEqual(self.market_book_cache.total_matched, 3)
+
 
 class TestRunnerBookCache(unittest.TestCase):
     def setUp(self):
@@ -511,6 +970,49 @@ class TestRunnerBookCache(unittest.TestCase):
         self.assertEqual(self.runner_book.serialised, {})
         self.assertIsNone(self.runner_book.resource)
 
+    def test_init_tick_ladder(self):
+        runner_book = RunnerBookCache(lightweight=True, tick_ladder=True, id=123)
+        self.assertIsInstance(runner_book.traded, TickAvailable)
+        self.assertIsInstance(runner_book.available_to_back, TickAvailable)
+        self.assertTrue(runner_book.available_to_back.reverse)
+        self.assertIsInstance(runner_book.available_to_lay, TickAvailable)
+        self.assertIsInstance(runner_book.starting_price_back, TickAvailable)
+        self.assertTrue(runner_book.starting_price_back.reverse)
+        self.assertIsInstance(runner_book.starting_price_lay, TickAvailable)
+        self.assertIsInstance(runner_book.best_available_to_back, Available)
+
+    def test_remove_tick_ladder(self):
+        runner_book = RunnerBookCache(
+            lightweight=True, tick_ladder=True, id=123, trd=[[1.5, 2], [2, 3]]
+        )
+        runner_book.available_to_back.update([[1.5, 2], [1.6, 3]], True)
+        runner_book.remove_tick_ladder()
+        self.assertIsInstance(runner_book.traded, Available)
+        self.assertIsInstance(runner_book.available_to_back, Available)
+        self.assertTrue(runner_book.available_to_back.reverse)
+        self.assertIsInstance(runner_book.starting_price_lay, Available)
+        self.assertEqual(
+            runner_book.available_to_back.serialised,
+            [{"price": 1.6, "size": 3}, {"price": 1.5, "size": 2}],
+        )
+        self.assertEqual(runner_book.traded_volume, 5)
+
+    def test_refresh(self):
+        self.runner_book.available_to_back.update([[1.01, 2], [1.02, 3]], False)
+        self.assertTrue(self.runner_book.available_to_back.stale)
+        self.runner_book.refresh()
+        self.assertFalse(self.runner_book.available_to_back.stale)
+        self.assertEqual(
+            self.runner_book.available_to_back.serialised,
+            [{"price": 1.02, "size": 3}, {"price": 1.01, "size": 2}],
+        )
+
+    def test_init_zero_copy(self):
+        runner_book = RunnerBookCache(lightweight=True, zero_copy=True, id=123)
+        self.assertIsInstance(runner_book.traded, CompactAvailable)
+        self.assertIsInstance(runner_book.available_to_back, CompactAvailable)
+        self.assertIsInstance(runner_book.best_available_to_back, CompactAvailable)
+
     def test_update_definition(self):
         definition = {
             "status": "ACTIVE",
@@ -528,14 +1030,36 @@ class TestRunnerBookCache(unittest.TestCase):
         self.mock_traded = mock.Mock()
         self.runner_book.traded = self.mock_traded
 
+        self.mock_traded.get_size.return_value = 0.5
+
         self.runner_book.update_traded([], True)
         self.mock_traded.clear.assert_called_with()
+        self.assertEqual(self.runner_book.traded_volume, 0)
 
-        self.runner_book.update_traded([1, 2], True)
-        self.mock_traded.update.assert_called_with([1, 2], True)
+        self.runner_book.update_traded([[1, 2]], True)
+        self.mock_traded.get_size.assert_called_with(1)
+        self.mock_traded.update.assert_called_with([[1, 2]], True)
+        self.assertEqual(self.runner_book.traded_volume, 1.5)
 
-        self.runner_book.update_traded([1, 2], False)
-        self.mock_traded.update.assert_called_with([1, 2], False)
+        self.runner_book.update_traded([[1, 2]], False)
+        self.mock_traded.update.assert_called_with([[1, 2]], False)
+        self.assertEqual(self.runner_book.traded_volume, 3)
+
+        # repeated price counted once, against the previous size in the update
+        self.runner_book.update_traded([[1, 2], [1, 4]], True)
+        self.assertEqual(self.runner_book.traded_volume, 6.5)
+
+    def test_update_traded_duplicate_price(self):
+        self.runner_book.update_traded([[1.5, 2], [1.5, 5], [2, 1]], True)
+        self.assertEqual(self.runner_book.traded_volume, 6)
+        self.assertEqual(
+            self.runner_book.traded_volume, self.runner_book.traded.total_size
+        )
+
+    def test_update_traded_float_drift(self):
+        for i in range(1, 1001):
+            self.runner_book.update_traded([[1.5, i * 0.1]], True)
+        self.assertEqual(self.runner_book.traded_volume, 100)
 
     def test_serialise_back(self):
         mock_available_to_back = mock.Mock()
@@ -634,12 +1158,34 @@ class TestRunnerBookCache(unittest.TestCase):
         # all 'None' or empty lists
         assert all(not sp[a] for a in sp.keys())
 
-    @mock.patch("betfairlightweight.streaming.cache.RunnerBook")
-    def test_serialise_resource(self, mock_runner_book):
+    @mock.patch("betfairlightweight.streaming.cache.RunnerBookCache._create_resource")
+    def test_serialise_resource(self, mock__create_resource):
         self.runner_book.lightweight = False
         self.runner_book.serialise()
-        mock_runner_book.assert_called_with(**self.runner_book.serialised)
-        self.assertEqual(self.runner_book.resource, mock_runner_book())
+        mock__create_resource.assert_called_with()
+        self.assertEqual(self.runner_book.resource, mock__create_resource())
+
+    def test__create_resource(self):
+        runner_book = RunnerBookCache(
+            id=123, lightweight=False, ltp=1.5, tv=10, atb=[[1.5, 2]], spl=[[1.4, 5]]
+        )
+        runner_book.serialise()
+        resource = runner_book.resource
+        self.assertIsInstance(resource, RunnerBook)
+        self.assertIsInstance(resource.ex, RunnerBookEX)
+        self.assertIsInstance(resource.sp, RunnerBookSP)
+        # attributes held in slots
+        self.assertEqual(vars(resource), {})
+        self.assertEqual(vars(resource.ex), {})
+        self.assertEqual(resource.selection_id, 123)
+        self.assertEqual(resource.last_price_traded, 1.5)
+        self.assertEqual(resource.total_matched, 10)
+        self.assertEqual(resource.orders, [])
+        self.assertEqual(resource.ex.available_to_back[0].price, 1.5)
+        self.assertEqual(resource.ex.available_to_back[0].size, 2)
+        self.assertEqual(resource.ex.available_to_lay, [])
+        self.assertEqual(resource.sp.back_stake_taken[0].size, 5)
+        self.assertEqual(resource["lastPriceTraded"], 1.5)
 
 
 class TestOrderBookCache(unittest.TestCase):
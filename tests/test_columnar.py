@@ -0,0 +1,126 @@
+import os
+import shutil
+import tempfile
+import json
+import unittest
+from json import load
+
+from betfairlightweight.resources import MarketBook
+from betfairlightweight.streaming.columnar import (
+    HEADER,
+    ColumnarReader,
+    ColumnarWriter,
+)
+
+FILE_PATH = "tests/resources/historicaldata/BASIC-1.132153978"
+
+
+class ColumnarTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.output_path = os.path.join(directory, "1.132153978.bflw")
+        self.writer = ColumnarWriter({"max_latency": None})
+
+    def test_writer_init(self):
+        self.assertEqual(
+            self.writer.listener_kwargs, {"max_latency": None, "lightweight": True}
+        )
+        self.assertEqual(self.writer.market_ids, [])
+        self.assertEqual(len(self.writer), 0)
+
+    def test_add_file(self):
+        self.assertEqual(self.writer.add_file(FILE_PATH), 480)
+        self.assertEqual(self.writer.market_ids, ["1.132153978"])
+        self.assertEqual(len(self.writer), 480)
+        # definitions de-duplicated
+        self.assertLess(len(self.writer.market_metas), 480)
+
+    def test_add_market_book_duplicate(self):
+        market_book = {
+            "marketId": "1.123",
+            "publishTime": 123,
+            "totalMatched": None,
+            "runners": [],
+        }
+        self.assertTrue(self.writer.add_market_book(market_book))
+        self.assertFalse(self.writer.add_market_book(market_book))
+        self.assertEqual(len(self.writer), 1)
+
+    def test_add_market_book_same_publish_time(self):
+        for total_matched in (1.0, 2.0):
+            self.writer.add_market_book(
+                {
+                    "marketId": "1.123",
+                    "publishTime": 123,
+                    "totalMatched": total_matched,
+                    "runners": [],
+                    "streaming_update": {"id": "1.123", "tv": total_matched},
+                }
+            )
+        self.assertEqual(len(self.writer), 2)
+        self.writer.write(self.output_path)
+        with ColumnarReader(self.output_path) as reader:
+            self.assertEqual(reader.get(1)["publishTime"], 123)
+            self.assertEqual(reader.get(1)["totalMatched"], 2.0)
+
+    def test_read(self):
+        # regression, output matches the generator (less streaming_update)
+        self.writer.add_file(FILE_PATH)
+        self.writer.write(self.output_path)
+        with open(FILE_PATH + "-processed.json", "r") as f:
+            expected_data = load(f)
+        for market_book in expected_data:
+            market_book["streaming_update"] = None
+
+        with ColumnarReader(self.output_path) as reader:
+            self.assertEqual(len(reader), 480)
+            self.assertEqual(reader.market_ids, ["1.132153978"])
+            self.assertEqual(list(reader), expected_data)
+            self.assertEqual(list(reader.iter_market("1.132153978")), expected_data)
+            self.assertEqual(list(reader.iter_market("1.1")), [])
+            self.assertEqual(str(reader), "<ColumnarReader [480 frames 1 markets]>")
+            self.assertEqual(repr(reader), "<ColumnarReader>")
+
+    def test_write_aligned(self):
+        market_book = {
+            "marketId": "1.123",
+            "publishTime": 123,
+            "totalMatched": None,
+            "runners": [],
+        }
+        self.writer.add_market_book(market_book)  # single frame, 4 byte columns
+        self.writer.write(self.output_path)
+        with open(self.output_path, "rb") as f:
+            data = f.read()
+        magic, metadata_length = HEADER.unpack_from(data)
+        start = HEADER.size + metadata_length
+        columns = json.loads(data[HEADER.size : start])["columns"]
+        self.assertEqual(start % 8, 0)
+        for offset, length in columns.values():
+            self.assertEqual(offset % 8, 0)
+        with ColumnarReader(self.output_path) as reader:
+            self.assertEqual(reader.get(0)["marketId"], "1.123")
+            self.assertEqual(reader.get(0)["publishTime"], 123)
+
+    def test_read_resource(self):
+        self.writer.add_file(FILE_PATH)
+        self.writer.write(self.output_path)
+        with ColumnarReader(self.output_path, lightweight=False) as reader:
+            market_book = reader.get(479)
+            self.assertIsInstance(market_book, MarketBook)
+            self.assertEqual(market_book.market_id, "1.132153978")
+            self.assertEqual(market_book.status, "CLOSED")
+            self.assertEqual(len(market_book.runners), 14)
+            self.assertEqual(market_book.market_definition.venue, "Hamilton")
+            # market definition resource shared between frames with the same meta
+            self.assertEqual(reader.frames["meta"][1], reader.frames["meta"][2])
+            self.assertIs(
+                reader.get(1).market_definition, reader.get(2).market_definition
+            )
+
+    def test_read_invalid(self):
+        with open(self.output_path, "wb") as f:
+            f.write(b"\x00" * 64)
+        with self.assertRaises(ValueError):
+            ColumnarReader(self.output_path)
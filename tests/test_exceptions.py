@@ -157,3 +157,14 @@ class ExceptionsTest(unittest.TestCase):
             str(pickle.loads(pickle.dumps(error))),
             str(error),
         )
+
+    def test_rate_limit_error(self):
+        # raise
+        with self.assertRaises(exceptions.BetfairError):
+            raise exceptions.RateLimitError("test")
+        # pickle
+        error = exceptions.RateLimitError("test")
+        self.assertEqual(
+            str(pickle.loads(pickle.dumps(error))),
+            str(error),
+        )
@@ -0,0 +1,166 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from betfairlightweight.governor import RateGovernor, TokenBucket
+from betfairlightweight.exceptions import RateLimitError
+
+
+class TokenBucketTest(unittest.TestCase):
+    @mock.patch("betfairlightweight.governor.time.monotonic", return_value=0)
+    def setUp(self, mock_monotonic):
+        self.bucket = TokenBucket(10, 2)
+
+    def test_init(self):
+        self.assertEqual(self.bucket.capacity, 10)
+        self.assertEqual(self.bucket.rate, 2)
+        self.assertEqual(self.bucket.tokens, 10)
+        self.assertEqual(self.bucket.utilisation, 0)
+
+    def test_consume_refill(self):
+        self.bucket.consume(8)
+        self.assertEqual(self.bucket.consumed, 8)
+        self.assertEqual(self.bucket.utilisation, 0.8)
+        self.assertEqual(self.bucket.wait_time(2), 0)
+        self.assertEqual(self.bucket.wait_time(4), 1)
+        self.assertEqual(self.bucket.wait_time(11), float("inf"))
+        self.bucket.refill(1)
+        self.assertEqual(self.bucket.tokens, 4)
+        self.bucket.refill(100)
+        self.assertEqual(self.bucket.tokens, 10)
+
+
+class RateGovernorTest(unittest.TestCase):
+    def setUp(self):
+        self.governor = RateGovernor(transaction_limit=10, block=False)
+
+    def test_init(self):
+        self.assertEqual(self.governor.transactions.capacity, 10)
+        self.assertEqual(self.governor.transactions.rate, 10 / 3600)
+        self.assertIsNone(self.governor.requests)
+        self.assertFalse(self.governor.block)
+        self.assertIsNone(self.governor.timeout)
+
+    def test_classify(self):
+        instructions = {"instructions": [1, 2, 3]}
+        self.assertEqual(
+            RateGovernor.classify("SportsAPING/v1.0/placeOrders", instructions),
+            (3, True),
+        )
+        self.assertEqual(
+            RateGovernor.classify("SportsAPING/v1.0/replaceOrders", instructions),
+            (3, True),
+        )
+        self.assertEqual(
+            RateGovernor.classify("SportsAPING/v1.0/cancelOrders", instructions),
+            (0, True),
+        )
+        self.assertEqual(
+            RateGovernor.classify("SportsAPING/v1.0/listMarketBook", {}), (0, False)
+        )
+        self.assertEqual(RateGovernor.classify(None, None), (0, False))
+
+    def test_acquire_transactions(self):
+        params = {"instructions": [1] * 6}
+        self.governor.acquire("SportsAPING/v1.0/placeOrders", params)
+        self.assertEqual(self.governor.transactions.consumed, 6)
+        with self.assertRaises(RateLimitError):
+            self.governor.acquire("SportsAPING/v1.0/placeOrders", params)
+        # data / cancels not limited
+        self.governor.acquire("SportsAPING/v1.0/listMarketBook", {})
+        self.governor.acquire("SportsAPING/v1.0/cancelOrders", params)
+        utilisation = self.governor.utilisation()
+        self.assertAlmostEqual(utilisation["transactions"], 0.6, places=3)
+        self.assertEqual(utilisation["transactions_consumed"], 6)
+        self.assertEqual(utilisation["orders_waiting"], 0)
+
+    def test_acquire_exceeds_limit(self):
+        with self.assertRaises(RateLimitError):
+            self.governor.acquire(
+                "SportsAPING/v1.0/placeOrders", {"instructions": [1] * 11}, block=True
+            )
+
+    def test_acquire_requests(self):
+        governor = RateGovernor(requests_per_second=50, burst=2, timeout=1)
+        start = time.monotonic()
+        for _ in range(4):
+            governor.acquire("SportsAPING/v1.0/listMarketBook", {})
+        self.assertGreaterEqual(time.monotonic() - start, 0.035)
+        self.assertEqual(governor.requests.consumed, 4)
+        self.assertIn("requests", governor.utilisation())
+
+    def test_acquire_timeout(self):
+        governor = RateGovernor(requests_per_second=1, timeout=0.1)
+        governor.acquire("SportsAPING/v1.0/listMarketBook", {})
+        with self.assertRaises(RateLimitError):
+            governor.acquire("SportsAPING/v1.0/listMarketBook", {})
+
+    def test_order_priority(self):
+        governor = RateGovernor(requests_per_second=5, burst=1)
+        governor.acquire("SportsAPING/v1.0/listMarketBook", {})  # empty bucket
+        calls = []
+
+        def request(method):
+            governor.acquire(method, {})
+            calls.append(method)
+
+        data = threading.Thread(
+            target=request, args=("SportsAPING/v1.0/listMarketBook",)
+        )
+        order = threading.Thread(
+            target=request, args=("SportsAPING/v1.0/cancelOrders",)
+        )
+        data.start()
+        time.sleep(0.05)  # data queued first
+        order.start()
+        data.join(2)
+        order.join(2)
+        self.assertEqual(
+            calls, ["SportsAPING/v1.0/cancelOrders", "SportsAPING/v1.0/listMarketBook"]
+        )
+
+    def test_order_waiting_transactions(self):
+        governor = RateGovernor(transaction_limit=1, requests_per_second=100)
+        params = {"instructions": [1]}
+        governor.acquire("SportsAPING/v1.0/placeOrders", params)
+        order = threading.Thread(
+            target=governor.acquire,
+            args=("SportsAPING/v1.0/placeOrders", params),
+            daemon=True,
+        )
+        order.start()
+        time.sleep(0.05)  # order queued on transactions
+        self.assertTrue(order.is_alive())
+        self.assertEqual(governor.utilisation()["orders_waiting"], 0)
+        # data requests not blocked by the queued order
+        governor.acquire("SportsAPING/v1.0/listMarketBook", {}, timeout=0.5)
+        with governor._condition:
+            governor.transactions.tokens = 1
+            governor._condition.notify_all()
+        order.join(2)
+        self.assertFalse(order.is_alive())
+        self.assertEqual(governor.transactions.consumed, 2)
+
+    def test_str(self):
+        self.assertEqual(str(self.governor), "<RateGovernor [10 transactions]>")
+        self.assertEqual(repr(self.governor), "<RateGovernor>")
+
+
+class RateGovernorAsyncTest(unittest.IsolatedAsyncioTestCase):
+    async def test_acquire_async(self):
+        governor = RateGovernor(requests_per_second=50, burst=1)
+        start = time.monotonic()
+        for _ in range(3):
+            await governor.acquire_async("SportsAPING/v1.0/listMarketBook", {})
+        self.assertGreaterEqual(time.monotonic() - start, 0.035)
+
+    async def test_acquire_async_reject(self):
+        governor = RateGovernor(transaction_limit=1, block=False)
+        await governor.acquire_async(
+            "SportsAPING/v1.0/placeOrders", {"instructions": [1]}
+        )
+        with self.assertRaises(RateLimitError):
+            await governor.acquire_async(
+                "SportsAPING/v1.0/placeOrders", {"instructions": [1]}
+            )
@@ -0,0 +1,186 @@
+import io
+import bz2
+import unittest
+from unittest import mock
+from json import load
+
+import betfairlightweight
+from betfairlightweight import StreamListener
+from betfairlightweight.streaming.historicalindex import HistoricalIndex
+
+FILE_PATH = "tests/resources/historicaldata/BASIC-1.132153978"
+
+
+def create_multi_market_file() -> io.BytesIO:
+    # interleave a copy of the market under a different id
+    data = b""
+    with open(FILE_PATH, "rb") as f:
+        for line in f:
+            data += line + line.replace(b"1.132153978", b"1.999")
+    return io.BytesIO(data)
+
+
+class NonSeekableBytesIO(io.BytesIO):
+    def seekable(self) -> bool:
+        return False
+
+
+class HistoricalIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = HistoricalIndex.build(create_multi_market_file())
+
+    def test_build(self):
+        self.assertEqual(len(self.index), 960)
+        self.assertEqual(list(self.index.markets), ["1.132153978", "1.999"])
+        self.assertEqual(self.index.markets["1.132153978"], 0)
+        self.assertEqual(self.index.markets["1.999"], self.index.offsets[1])
+        self.assertEqual(self.index.publish_times[0], 1497351220318)
+        self.assertEqual(self.index.publish_times[0], self.index.publish_times[1])
+        self.assertEqual(self.index.images, {})
+        self.assertEqual(self.index.size, len(create_multi_market_file().getvalue()))
+
+    def test_build_images(self):
+        index = HistoricalIndex.build(
+            io.BytesIO(
+                b'{"op":"mcm","pt":1,"mc":[{"id":"1.1","img":true},{"id":"1.2"}]}\n'
+                b'{"op":"mcm","pt":2,"mc":[{"id":"1.2","img":true}]}\n'
+                b'{"op":"ocm","pt":3,"oc":[{"id":"1.3","fullImage":true}]}\n'
+                b'{"op":"ccm","pt":4,"ct":"SUB_IMAGE","cc":[{"marketId":"1.4"}]}\n'
+            )
+        )
+        offsets = index.offsets
+        self.assertEqual(
+            index.markets, {"1.1": 0, "1.2": 0, "1.3": offsets[2], "1.4": offsets[3]}
+        )
+        self.assertEqual(
+            index.images,
+            {"1.1": [0], "1.2": [offsets[1]], "1.3": [offsets[2]], "1.4": [offsets[3]]},
+        )
+        # seek to the latest image of 1.2 before start
+        self.assertEqual(index.seek(["1.2"], 2), (offsets[1], offsets[1], index.size))
+        self.assertEqual(index.seek(["1.2"], 1), (0, 0, index.size))
+        self.assertEqual(
+            index.seek(["1.3", "1.4"], None, 3), (offsets[2], offsets[2], offsets[3])
+        )
+
+    def test_seek(self):
+        self.assertEqual(self.index.seek(), (0, 0, self.index.size))
+        self.assertEqual(
+            self.index.seek(["1.999"]),
+            (self.index.offsets[1], self.index.offsets[1], self.index.size),
+        )
+        self.assertEqual(self.index.seek(["1.123"]), (self.index.size,) * 3)
+        start = self.index.publish_times[200]
+        self.assertEqual(
+            self.index.seek(["1.999"], start, start),
+            (self.index.offsets[1], self.index.offsets[200], self.index.offsets[202]),
+        )
+        self.assertEqual(
+            self.index.seek(None, 1e15), (0, self.index.size, self.index.size)
+        )
+
+    def test_str(self):
+        self.assertEqual(str(self.index), "<HistoricalIndex [960 lines 2 markets]>")
+        self.assertEqual(repr(self.index), "<HistoricalIndex>")
+
+
+class HistoricalIndexStreamTest(unittest.TestCase):
+    def setUp(self):
+        self.trading = betfairlightweight.APIClient(
+            "username", "password", app_key="appKey"
+        )
+        with open(FILE_PATH + "-processed.json", "r") as f:
+            self.expected_data = load(f)
+        for market_book in self.expected_data:
+            market_book["streaming_update"] = None
+
+    def _process(self, file_path=None, **kwargs) -> list:
+        self.stream = stream = (
+            self.trading.streaming.create_historical_generator_stream(
+                file_path=file_path or create_multi_market_file(),
+                listener=StreamListener(lightweight=True),
+                **kwargs,
+            )
+        )
+        data = []
+        for market_books in stream.get_generator()():
+            for market_book in market_books:
+                market_book["streaming_update"] = None
+                data.append(market_book)
+        return data
+
+    def test_market_ids(self):
+        data = self._process(market_ids=["1.132153978"])
+        self.assertEqual(data, self.expected_data)
+
+    def test_publish_times(self):
+        start = self.expected_data[100]["publishTime"]
+        end = self.expected_data[199]["publishTime"]
+        data = self._process(
+            market_ids=["1.132153978"], start_publish_time=start, end_publish_time=end
+        )
+        self.assertEqual(data, self.expected_data[100:200])
+
+    def test_publish_times_compressed(self):
+        # single forward pass, no index built
+        start = self.expected_data[100]["publishTime"]
+        end = self.expected_data[199]["publishTime"]
+        compressed = io.BytesIO(bz2.compress(create_multi_market_file().read()))
+        data = self._process(
+            file_path=io.BufferedReader(bz2.BZ2File(compressed)),
+            market_ids=["1.132153978"],
+            start_publish_time=start,
+            end_publish_time=end,
+        )
+        self.assertEqual(data, self.expected_data[100:200])
+        self.assertIsNone(self.stream.index)
+
+    def test_publish_times_non_seekable(self):
+        start = self.expected_data[100]["publishTime"]
+        data = self._process(
+            file_path=NonSeekableBytesIO(create_multi_market_file().read()),
+            start_publish_time=start,
+            threaded=True,
+        )
+        self.assertEqual(len(data), 1520)
+        self.assertIsNone(self.stream.index)
+
+    def test_market_ids_non_seekable(self):
+        data = self._process(
+            file_path=NonSeekableBytesIO(create_multi_market_file().read()),
+            market_ids=["1.132153978"],
+        )
+        self.assertEqual(data, self.expected_data)
+
+    def test_publish_times_all_markets(self):
+        start = self.expected_data[100]["publishTime"]
+        data = self._process(start_publish_time=start, threaded=True)
+        self.assertEqual(len(data), 1520)  # both markets snapped per line
+        self.assertEqual(
+            [d for d in data if d["marketId"] == "1.132153978"][::2],
+            self.expected_data[100:],
+        )
+
+    def test_historical_stream_output(self):
+        output_queue = mock.Mock()
+        start = self.expected_data[470]["publishTime"]
+        stream = self.trading.streaming.create_historical_stream(
+            file_path=create_multi_market_file(),
+            listener=StreamListener(output_queue=output_queue),
+            market_ids=["1.999"],
+            start_publish_time=start,
+        )
+        stream.start()
+        self.assertEqual(output_queue.put.call_count, 10)
+        self.assertEqual(stream.listener.stream.output_queue, output_queue)
+        self.assertEqual(stream.listener.stream._updates_processed, 480)
+
+    def test_changed_only(self):
+        data = self._process(changed_only=True, conflate_ms=0)
+        # both markets updated per publish time
+        self.assertEqual(len(data), 960)
+        self.assertEqual(data[::2], self.expected_data)
+
+        data = self._process(changed_only=True, market_ids=["1.999"])
+        self.assertEqual(len(data), 480)
+        self.assertEqual({d["marketId"] for d in data}, {"1.999"})
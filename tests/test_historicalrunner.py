@@ -0,0 +1,137 @@
+import sys
+import unittest
+from concurrent.futures import Future
+from unittest import mock
+
+from betfairlightweight.streaming.historicalrunner import (
+    HistoricalRunner,
+    process_files,
+)
+
+FILE_PATH = "tests/resources/historicaldata/BASIC-1.132153978"
+
+
+def count_updates(file_path, gen):
+    return sum(1 for _ in gen)
+
+
+def market_ids(file_path, gen):
+    for market_books in gen:
+        yield market_books[0].market_id
+
+
+def error(file_path, gen):
+    raise ValueError(file_path)
+
+
+class ProcessFilesTest(unittest.TestCase):
+    def test_process_files(self):
+        results = process_files(
+            [FILE_PATH], count_updates, {"max_latency": None}, "marketSubscription"
+        )
+        self.assertEqual(len(results), 1)
+        file_path, result, updates, elapsed = results[0]
+        self.assertEqual(file_path, FILE_PATH)
+        self.assertGreater(result, 0)
+        self.assertGreater(updates, 0)
+        self.assertGreater(elapsed, 0)
+
+    def test_process_files_generator(self):
+        results = process_files([FILE_PATH], market_ids, None, "marketSubscription")
+        self.assertIsInstance(results[0][1], list)
+        self.assertEqual(results[0][1][0], "1.132153978")
+
+
+class HistoricalRunnerTest(unittest.TestCase):
+    def setUp(self):
+        self.progress = mock.Mock()
+        self.runner = HistoricalRunner(
+            [FILE_PATH, FILE_PATH, FILE_PATH],
+            count_updates,
+            listener_kwargs={"max_latency": None},
+            max_workers=2,
+            chunksize=2,
+            progress=self.progress,
+        )
+
+    def test_init(self):
+        self.assertEqual(self.runner.file_paths, [FILE_PATH] * 3)
+        self.assertEqual(self.runner.process, count_updates)
+        self.assertEqual(self.runner.listener_kwargs, {"max_latency": None})
+        self.assertEqual(self.runner.operation, "marketSubscription")
+        self.assertEqual(self.runner.max_workers, 2)
+        self.assertTrue(self.runner.ordered)
+        self.assertEqual(self.runner.chunksize, 2)
+        self.assertIsNone(self.runner.max_tasks_per_child)
+        self.assertEqual(self.runner.progress, self.progress)
+        self.assertEqual(self.runner.files_processed, 0)
+        self.assertEqual(self.runner.elapsed_time, 0)
+        self.assertEqual(len(self.runner), 3)
+
+    def test_init_glob(self):
+        runner = HistoricalRunner(
+            "tests/resources/historicaldata/BASIC-*[0-9]", count_updates
+        )
+        self.assertEqual(runner.file_paths, [FILE_PATH])
+
+    def test_init_chunksize_error(self):
+        with self.assertRaises(ValueError):
+            HistoricalRunner([FILE_PATH], count_updates, chunksize=0)
+
+    @mock.patch("betfairlightweight.streaming.historicalrunner.sys")
+    def test_init_max_tasks_per_child_error(self, mock_sys):
+        mock_sys.version_info = (3, 10)
+        with self.assertRaises(ValueError):
+            HistoricalRunner([FILE_PATH], count_updates, max_tasks_per_child=1)
+
+    def test_chunks(self):
+        self.assertEqual(self.runner.chunks, [[FILE_PATH] * 2, [FILE_PATH]])
+
+    def test_run(self):
+        results = list(self.runner.run())
+        self.assertEqual(len(results), 3)
+        self.assertEqual({r[0] for r in results}, {FILE_PATH})
+        self.assertEqual(len({r[1] for r in results}), 1)
+        self.assertEqual(self.runner.files_processed, 3)
+        self.assertGreater(self.runner.updates_processed, 0)
+        self.assertGreater(self.runner.files_per_second, 0)
+        self.assertEqual(self.progress.call_count, 3)
+        self.progress.assert_called_with(self.runner)
+
+    @unittest.skipIf(
+        sys.version_info < (3, 11), "max_tasks_per_child requires python 3.11+"
+    )
+    def test_run_unordered(self):
+        self.runner.ordered = False
+        self.runner.max_tasks_per_child = 1
+        self.assertEqual(len(list(self.runner.run())), 3)
+
+    @mock.patch("betfairlightweight.streaming.historicalrunner.ProcessPoolExecutor")
+    def test_run_bounded(self, mock_executor_cls):
+        def submit(fn, *args):
+            future = Future()
+            future.set_result([(FILE_PATH, 1, 1, 0.1)])
+            return future
+
+        mock_executor = mock_executor_cls.return_value.__enter__.return_value
+        mock_executor.submit.side_effect = submit
+        runner = HistoricalRunner([FILE_PATH] * 5, count_updates, max_workers=1)
+        gen = runner.run()
+        next(gen)
+        self.assertEqual(mock_executor.submit.call_count, 3)
+        self.assertEqual(len(list(gen)), 4)
+        self.assertEqual(mock_executor.submit.call_count, 5)
+
+    def test_run_error(self):
+        self.runner.process = error
+        with self.assertRaises(ValueError):
+            list(self.runner.run())
+
+    def test_str(self):
+        self.assertEqual(
+            str(self.runner),
+            "<HistoricalRunner [0/3 files 0.0 files/s 0 updates/s]>",
+        )
+
+    def test_repr(self):
+        self.assertEqual(repr(self.runner), "<HistoricalRunner>")
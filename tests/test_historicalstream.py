@@ -1,3 +1,5 @@
+import io
+import bz2
 import unittest
 from json import load  # orjson does not provide load
 
@@ -42,6 +44,74 @@ class HistoricalStreamTest(unittest.TestCase):
 
         assert expected_data == data
 
+    def test_historical_generator_stream_tick_ladder(self):
+        trading = betfairlightweight.APIClient("username", "password", app_key="appKey")
+        stream = trading.streaming.create_historical_generator_stream(
+            file_path="tests/resources/historicaldata/BASIC-1.132153978",
+            listener=StreamListener(lightweight=True, tick_ladder=True),
+        )
+        gen = stream.get_generator()
+        data = [i[0] for i in gen()]
+
+        with open(
+            "tests/resources/historicaldata/BASIC-1.132153978-processed.json", "r"
+        ) as f:
+            expected_data = load(f)
+
+        assert expected_data == data
+
+    def test_historical_generator_stream_compressed_threaded(self):
+        with open("tests/resources/historicaldata/BASIC-1.132153978", "rb") as f:
+            compressed = io.BytesIO(bz2.compress(f.read()))
+
+        trading = betfairlightweight.APIClient("username", "password", app_key="appKey")
+        stream = trading.streaming.create_historical_generator_stream(
+            file_path=bz2.BZ2File(compressed),
+            listener=StreamListener(lightweight=True),
+            threaded=True,
+            buffer_size=4096,
+        )
+        gen = stream.get_generator()
+        data = [i[0] for i in gen()]
+
+        with open(
+            "tests/resources/historicaldata/BASIC-1.132153978-processed.json", "r"
+        ) as f:
+            expected_data = load(f)
+
+        assert expected_data == data
+
+    def test_historical_generator_stream_conflate(self):
+        trading = betfairlightweight.APIClient("username", "password", app_key="appKey")
+        with open(
+            "tests/resources/historicaldata/BASIC-1.132153978-processed.json", "r"
+        ) as f:
+            expected_data = load(f)
+
+        # publish times are unique so a 0ms window yields every update
+        stream = trading.streaming.create_historical_generator_stream(
+            file_path="tests/resources/historicaldata/BASIC-1.132153978",
+            listener=StreamListener(lightweight=True),
+            conflate_ms=0,
+            changed_only=True,
+        )
+        data = [i[0] for i in stream.get_generator()()]
+        assert expected_data == data
+
+        stream = trading.streaming.create_historical_generator_stream(
+            file_path="tests/resources/historicaldata/BASIC-1.132153978",
+            listener=StreamListener(lightweight=True),
+            conflate_ms=60000,
+        )
+        data = [i[0] for i in stream.get_generator()()]
+        assert 1 < len(data) < 480
+        assert data[-1] == expected_data[-1]
+        publish_times = [i["publishTime"] for i in data]
+        assert publish_times == sorted(set(publish_times))
+        # each snap is the last update before the next 60s window
+        for market_book in data:
+            assert market_book in expected_data
+
 
 class HistoricalRaceStreamTest(unittest.TestCase):
     def test_historical_stream(self):
@@ -68,6 +68,15 @@ class BaseListenerTest(unittest.TestCase):
     def test_on_data(self):
         self.base_listener.on_data("{}")
 
+    @mock.patch(
+        "betfairlightweight.streaming.listener.BaseListener.on_data",
+        side_effect=[None, False, None],
+    )
+    def test_on_data_batch(self, mock_on_data):
+        self.assertFalse(self.base_listener.on_data_batch(["1", "2", "3"]))
+        mock_on_data.assert_has_calls([mock.call("1"), mock.call("2")])
+        self.assertEqual(mock_on_data.call_count, 2)
+
     @mock.patch("betfairlightweight.streaming.listener.CricketStream", return_value=321)
     @mock.patch("betfairlightweight.streaming.listener.RaceStream", return_value=789)
     @mock.patch("betfairlightweight.streaming.listener.OrderStream", return_value=456)
@@ -102,7 +111,10 @@ class BaseListenerTest(unittest.TestCase):
         assert self.base_listener.snap() == []
 
         self.base_listener.stream_type = "test"
-        assert self.base_listener.snap() == mock_stream.snap(None)
+        assert self.base_listener.snap() == mock_stream.snap()
+        mock_stream.snap.assert_any_call(None, changed_only=False)
+        self.base_listener.snap(["1.1"], changed_only=True)
+        mock_stream.snap.assert_called_with(["1.1"], changed_only=True)
 
     def test_props(self):
         assert self.base_listener.initial_clk is None
@@ -142,6 +154,12 @@ class StreamListenerTest(unittest.TestCase):
         self.assertFalse(self.stream_listener.calculate_market_tv)
         self.assertFalse(self.stream_listener.cumulative_runner_tv)
         self.assertFalse(self.stream_listener.order_updates_only)
+        self.assertFalse(self.stream_listener.tick_ladder)
+        self.assertFalse(self.stream_listener.lazy_serialise)
+        self.assertFalse(self.stream_listener.verify_tv)
+        self.assertFalse(self.stream_listener.zero_copy)
+        self.assertIsNone(self.stream_listener.market_data_fields)
+        self.assertFalse(self.stream_listener.immutable)
 
     @mock.patch("betfairlightweight.streaming.listener.StreamListener._on_connection")
     @mock.patch("betfairlightweight.streaming.listener.StreamListener._on_status")
@@ -206,6 +224,12 @@ class StreamListenerTest(unittest.TestCase):
             mock_response.json(), mock_response.json().get("id")
         )
 
+        mock_response = create_mock_json("tests/resources/streaming_mcm_update.json")
+        self.stream_listener.on_data(mock_response.text.encode("utf-8"))
+        mock_on_change_message.assert_called_with(
+            mock_response.json(), mock_response.json().get("id")
+        )
+
         on_data = self.stream_listener.on_data("some content")
         assert on_data is None
 
@@ -213,6 +237,36 @@ class StreamListenerTest(unittest.TestCase):
         on_data = self.stream_listener.on_data(mock_response.text)
         assert on_data is False
 
+    def test_on_data_batch(self):
+        self.stream_listener.stream = mock.Mock(_batch=None)
+
+        def on_data(raw_data):
+            self.stream_listener.stream._batch.append(raw_data)
+
+        with mock.patch.object(self.stream_listener, "on_data", side_effect=on_data):
+            self.assertIsNone(self.stream_listener.on_data_batch(["1", "2"]))
+        self.output_queue.put.assert_called_once_with(["1", "2"])
+        self.assertIsNone(self.stream_listener.stream._batch)
+
+    def test_on_data_batch_no_output(self):
+        self.stream_listener.stream = mock.Mock(_batch=None)
+        with mock.patch.object(
+            self.stream_listener, "on_data", return_value=False
+        ) as mock_on_data:
+            self.assertFalse(self.stream_listener.on_data_batch(["1", "2"]))
+        mock_on_data.assert_called_once_with("1")
+        self.output_queue.put.assert_not_called()
+        self.assertIsNone(self.stream_listener.stream._batch)
+
+    @mock.patch(
+        "betfairlightweight.streaming.listener.BaseListener.on_data_batch",
+    )
+    def test_on_data_batch_no_stream(self, mock_on_data_batch):
+        self.assertEqual(
+            self.stream_listener.on_data_batch(["1"]), mock_on_data_batch.return_value
+        )
+        mock_on_data_batch.assert_called_with(["1"])
+
     @mock.patch(
         "betfairlightweight.streaming.listener.StreamListener._error_handler",
         return_value=True,
@@ -33,6 +33,13 @@ class MetadataTest(unittest.TestCase):
             "EX_TRADED": 17,
         }
 
+        assert metadata.list_market_book_combined == {
+            ("EX_BEST_OFFERS", "EX_TRADED"): 20,
+            ("EX_ALL_OFFERS", "EX_TRADED"): 32,
+        }
+        assert metadata.data_weight_limit == 200
+        assert metadata.list_market_catalogue_max_results == 1000
+
         assert metadata.list_market_profit_and_loss == {"": 4}
 
     def test_currency_parameters(self):
@@ -5,6 +5,7 @@ from requests.exceptions import ConnectionError
 from betfairlightweight import APIClient
 from betfairlightweight.endpoints.navigation import Navigation
 from betfairlightweight.exceptions import APIError, InvalidResponse
+from betfairlightweight.responsecache import ResponseCache
 from tests.tools import create_mock_json
 
 
@@ -29,6 +30,14 @@ class NavigationTest(unittest.TestCase):
         response = self.navigation.list_navigation()
         assert response == mock_response()
 
+    @mock.patch("betfairlightweight.endpoints.navigation.Navigation.request")
+    def test_list_navigation_response_cache(self, mock_response):
+        mock_response.return_value = {"children": []}
+        self.navigation.client.response_cache = ResponseCache()
+        assert self.navigation.list_navigation() == {"children": []}
+        assert self.navigation.list_navigation() == {"children": []}
+        mock_response.assert_called_once_with(session=None)
+
     @mock.patch("betfairlightweight.baseclient.BaseClient.cert")
     @mock.patch("betfairlightweight.baseclient.BaseClient.request_headers")
     @mock.patch("betfairlightweight.baseclient.requests.get")
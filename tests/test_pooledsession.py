@@ -0,0 +1,94 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest import mock
+
+import requests
+
+from betfairlightweight.pooledsession import PooledSession
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def do_HEAD(self):
+        self.send_response(405)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class PooledSessionTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = HTTPServer(("127.0.0.1", 0), Handler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.url = "http://127.0.0.1:%s/" % cls.server.server_port
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.session = PooledSession(
+            {"betting": self.url + "betting/", "account": self.url + "account/"},
+            pool_maxsize=4,
+        )
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_init(self):
+        self.assertEqual(self.session.pool_maxsize, 4)
+        self.assertEqual(list(self.session.adapters_by_name), ["betting", "account"])
+        self.assertIs(
+            self.session.get_adapter(self.url + "betting/json-rpc/v1"),
+            self.session.adapters_by_name["betting"],
+        )
+        self.assertIs(
+            self.session.get_adapter(self.url + "account/json-rpc/v1"),
+            self.session.adapters_by_name["account"],
+        )
+        self.assertEqual(self.session.adapters_by_name["betting"]._pool_maxsize, 4)
+
+    def test_stats(self):
+        self.assertEqual(
+            self.session.stats(),
+            {
+                "betting": {"requests": 0, "connections": 0, "idle": 0},
+                "account": {"requests": 0, "connections": 0, "idle": 0},
+            },
+        )
+        for _ in range(3):
+            self.session.get(self.url + "betting/json-rpc/v1", timeout=5)
+        stats = self.session.stats()
+        # connection reused
+        self.assertEqual(stats["betting"], {"requests": 3, "connections": 1, "idle": 1})
+        self.assertEqual(stats["account"]["requests"], 0)
+
+    def test_warm(self):
+        self.session.warm(["account"])
+        stats = self.session.stats()
+        self.assertEqual(stats["account"], {"requests": 1, "connections": 1, "idle": 1})
+        self.assertEqual(stats["betting"]["connections"], 0)
+
+    @mock.patch("betfairlightweight.pooledsession.PooledSession.head")
+    def test_warm_error(self, mock_head):
+        mock_head.side_effect = requests.ConnectionError()
+        self.session.warm()
+        self.assertEqual(mock_head.call_count, 2)
+        mock_head.assert_called_with(self.url + "account/", timeout=3.05)
+
+    def test_str(self):
+        self.assertEqual(str(self.session), "<PooledSession [2 pools 4 maxsize]>")
+        self.assertEqual(repr(self.session), "<PooledSession>")
@@ -0,0 +1,146 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from betfairlightweight.responsecache import DEFAULT_TTLS, ResponseCache
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = ResponseCache(maxsize=2, stale_while_revalidate=10)
+
+    def test_init(self):
+        self.assertEqual(self.cache.ttls, DEFAULT_TTLS)
+        self.assertIsNot(self.cache.ttls, DEFAULT_TTLS)
+        self.assertEqual(self.cache.maxsize, 2)
+        self.assertEqual(self.cache.stale_while_revalidate, 10)
+        self.assertIsNone(self.cache.path)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_ttl(self):
+        self.assertEqual(self.cache.ttl("SportsAPING/v1.0/listEventTypes"), 3600)
+        self.assertEqual(self.cache.ttl("SportsAPING/v1.0/listMarketCatalogue"), 60)
+        self.assertEqual(self.cache.ttl("navigation"), 300)
+        self.assertIsNone(self.cache.ttl("SportsAPING/v1.0/listMarketBook"))
+        self.assertIsNone(self.cache.ttl(None))
+
+    def test_key(self):
+        self.assertEqual(
+            ResponseCache.key("listEventTypes", {"filter": {}}),
+            ResponseCache.key("listEventTypes", {"filter": {}}),
+        )
+        self.assertNotEqual(
+            ResponseCache.key("listEventTypes", {"filter": {}}),
+            ResponseCache.key("listEventTypes", {"filter": {"eventIds": [1]}}),
+        )
+        self.assertIsInstance(ResponseCache.key("listEventTypes", None), str)
+        # key order ignored
+        self.assertEqual(
+            ResponseCache.key("listEventTypes", {"filter": {}, "locale": "en"}),
+            ResponseCache.key("listEventTypes", {"locale": "en", "filter": {}}),
+        )
+
+    @mock.patch("betfairlightweight.responsecache.time.time")
+    def test_get_set(self, mock_time):
+        mock_time.return_value = 100
+        self.cache.set("a", {"result": [1]}, 60)
+        self.assertEqual(self.cache.get("a"), ({"result": [1]}, False))
+        # parsed response stored and shared
+        self.assertIs(self.cache.get("a")[0], self.cache.get("a")[0])
+        mock_time.return_value = 165
+        self.assertEqual(self.cache.get("a"), ({"result": [1]}, True))
+        mock_time.return_value = 171
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(len(self.cache), 0)
+        self.assertIsNone(self.cache.get("b"))
+
+    def test_lru(self):
+        self.cache.set("a", 1, 60)
+        self.cache.set("b", 2, 60)
+        self.cache.get("a")
+        self.cache.set("c", 3, 60)
+        self.assertEqual(list(self.cache._entries), ["a", "c"])
+
+    def test_fetch(self):
+        func = mock.Mock(return_value={"result": []})
+        method = "SportsAPING/v1.0/listEventTypes"
+        self.assertEqual(self.cache.fetch(method, {}, func), {"result": []})
+        self.assertEqual(self.cache.fetch(method, {}, func), {"result": []})
+        func.assert_called_once_with()
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+        self.cache.fetch(method, {"filter": {}}, func)
+        self.assertEqual(func.call_count, 2)
+
+    @mock.patch("betfairlightweight.responsecache.time.time")
+    def test_fetch_stale(self, mock_time):
+        mock_time.return_value = 100
+        method = "SportsAPING/v1.0/listMarketCatalogue"
+        self.cache.fetch(method, {}, lambda: 1)
+        mock_time.return_value = 165
+        refreshed = threading.Event()
+
+        def refresh():
+            refreshed.set()
+            return 2
+
+        self.assertEqual(self.cache.fetch(method, {}, refresh), 1)  # stale
+        self.assertTrue(refreshed.wait(1))
+        for _ in range(100):
+            if not self.cache._refreshing:
+                break
+            refreshed.wait(0.01)
+        self.assertEqual(self.cache.fetch(method, {}, refresh), 2)
+
+    @mock.patch("betfairlightweight.responsecache.time.time")
+    def test_fetch_stale_error(self, mock_time):
+        mock_time.return_value = 100
+        method = "SportsAPING/v1.0/listMarketCatalogue"
+        key = self.cache.key(method, {})
+        self.cache.set(key, 1, 60)
+        mock_time.return_value = 165
+        self.cache._refresh(key, 60, mock.Mock(side_effect=ValueError()))
+        self.assertEqual(self.cache.get(key), (1, True))
+        self.assertEqual(self.cache._refreshing, set())
+
+    def test_clear(self):
+        self.cache.set("a", 1, 60)
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.json")
+            cache = ResponseCache(path=path)
+            cache.set("a", {"result": [1]}, 60)
+            cache.set("b", 2, -3600)  # expired
+            cache.save()
+            self.assertFalse(os.path.exists(path + ".tmp"))
+
+            cache = ResponseCache(path=path)
+            self.assertEqual(len(cache), 1)
+            self.assertEqual(cache.get("a"), ({"result": [1]}, False))
+
+    def test_str(self):
+        self.assertEqual(str(self.cache), "<ResponseCache [0 entries 0 hits 0 misses]>")
+        self.assertEqual(repr(self.cache), "<ResponseCache>")
+
+
+class ResponseCacheAsyncTest(unittest.IsolatedAsyncioTestCase):
+    @mock.patch("betfairlightweight.responsecache.time.time")
+    async def test_fetch_async(self, mock_time):
+        mock_time.return_value = 100
+        cache = ResponseCache()
+        method = "SportsAPING/v1.0/listMarketCatalogue"
+        func = mock.AsyncMock(side_effect=[1, 2])
+        self.assertEqual(await cache.fetch_async(method, {}, func), 1)
+        self.assertEqual(await cache.fetch_async(method, {}, func), 1)
+        mock_time.return_value = 165
+        self.assertEqual(await cache.fetch_async(method, {}, func), 1)  # stale
+        for _ in range(5):
+            await asyncio.sleep(0)
+        self.assertEqual(func.await_count, 2)
+        self.assertEqual(await cache.fetch_async(method, {}, func), 2)
@@ -0,0 +1,109 @@
+import unittest
+from unittest import mock
+
+from betfairlightweight.exceptions import SocketError
+from betfairlightweight.streaming.betfairstream import BetfairStream
+from betfairlightweight.streaming.shardedstream import ShardedStream
+
+
+class ShardedStreamTest(unittest.TestCase):
+    def setUp(self):
+        self.streams = [mock.Mock(), mock.Mock(), mock.Mock()]
+        self.sharded_stream = ShardedStream(self.streams)
+
+    def test_init(self):
+        self.assertEqual(self.sharded_stream.streams, self.streams)
+        self.assertEqual(self.sharded_stream.market_filters, [None, None, None])
+        self.assertFalse(self.sharded_stream.running)
+        self.assertEqual(len(self.sharded_stream), 3)
+        # unique id counter shared
+        for stream in self.streams:
+            self.assertIs(stream._unique_ids, self.streams[0]._unique_ids)
+
+    def test_unique_ids(self):
+        streams = [
+            BetfairStream(10, mock.Mock(), "app_key", "token", 6, 1024, None)
+            for _ in range(3)
+        ]
+        ShardedStream(streams)
+        unique_ids = [stream.new_unique_id() for stream in streams * 2]
+        self.assertEqual(unique_ids, list(range(11, 17)))
+
+    def test_subscribe_to_markets(self):
+        market_filter = {"marketIds": ["1.1", "1.2", "1.3", "1.4"], "bspMarket": True}
+        unique_ids = self.sharded_stream.subscribe_to_markets(market_filter, {})
+
+        self.assertEqual(
+            unique_ids,
+            [stream.subscribe_to_markets.return_value for stream in self.streams],
+        )
+        self.streams[0].subscribe_to_markets.assert_called_with(
+            market_filter={"marketIds": ["1.1", "1.4"], "bspMarket": True},
+            market_data_filter={},
+            conflate_ms=None,
+            heartbeat_ms=None,
+            segmentation_enabled=True,
+        )
+        self.assertEqual(
+            self.sharded_stream.market_filters,
+            [
+                {"marketIds": ["1.1", "1.4"], "bspMarket": True},
+                {"marketIds": ["1.2"], "bspMarket": True},
+                {"marketIds": ["1.3"], "bspMarket": True},
+            ],
+        )
+
+    def test_subscribe_to_markets_fewer_markets(self):
+        unique_ids = self.sharded_stream.subscribe_to_markets(
+            {"marketIds": ["1.1"]}, {}
+        )
+        self.assertEqual(len(unique_ids), 1)
+        self.streams[1].subscribe_to_markets.assert_not_called()
+        self.assertEqual(
+            self.sharded_stream.market_filters, [{"marketIds": ["1.1"]}, None, None]
+        )
+
+    def test_subscribe_to_markets_error(self):
+        with self.assertRaises(ValueError):
+            self.sharded_stream.subscribe_to_markets({"eventTypeIds": ["7"]}, {})
+
+    def test_start(self):
+        self.sharded_stream.subscribe_to_markets({"marketIds": ["1.1", "1.2"]}, {})
+        self.sharded_stream.start()
+        self.streams[0].start.assert_called_with()
+        self.streams[1].start.assert_called_with()
+        self.streams[2].start.assert_not_called()
+        for stream in self.streams:
+            stream.stop.assert_called_with()
+        self.assertFalse(self.sharded_stream.running)
+
+    def test_start_error(self):
+        self.streams[1].start.side_effect = SocketError("closed")
+        self.sharded_stream.subscribe_to_markets({"marketIds": ["1.1", "1.2"]}, {})
+        with self.assertRaises(SocketError):
+            self.sharded_stream.start()
+        for stream in self.streams:
+            stream.stop.assert_called_with()
+
+    def test_stop(self):
+        self.sharded_stream.stop()
+        for stream in self.streams:
+            stream.stop.assert_called_with()
+
+    def test_snap(self):
+        for i, stream in enumerate(self.streams):
+            stream.listener.snap.return_value = [i]
+        self.assertEqual(self.sharded_stream.snap(["1.1"]), [0, 1, 2])
+        self.streams[0].listener.snap.assert_called_with(["1.1"], changed_only=False)
+
+    def test_listeners(self):
+        self.assertEqual(
+            self.sharded_stream.listeners,
+            [stream.listener for stream in self.streams],
+        )
+
+    def test_str(self):
+        assert str(self.sharded_stream) == "<ShardedStream [3 shards not running]>"
+
+    def test_repr(self):
+        assert repr(self.sharded_stream) == "<ShardedStream>"
@@ -34,10 +34,20 @@ class BaseStreamTest(unittest.TestCase):
         self.assertEqual(
             self.stream._order_updates_only, self.listener.order_updates_only
         )
+        self.assertEqual(self.stream._tick_ladder, self.listener.tick_ladder)
+        self.assertEqual(self.stream._lazy_serialise, self.listener.lazy_serialise)
+        self.assertEqual(self.stream._verify_tv, self.listener.verify_tv)
+        self.assertEqual(self.stream._zero_copy, self.listener.zero_copy)
+        self.assertEqual(
+            self.stream._market_data_fields, self.listener.market_data_fields
+        )
         self.assertIsNone(self.stream._initial_clk)
         self.assertIsNone(self.stream._clk)
         self.assertEqual(self.stream._caches, {})
         self.assertEqual(self.stream._updates_processed, 0)
+        self.assertIsNone(self.stream._batch)
+        self.assertEqual(self.stream._changed, set())
+        self.assertEqual(self.stream._immutable, self.listener.immutable)
         self.assertIsNotNone(self.stream.time_created)
         self.assertIsNotNone(self.stream.time_updated)
         self.assertEqual(self.stream._lookup, "mc")
@@ -154,9 +164,11 @@ class BaseStreamTest(unittest.TestCase):
 
     def test_clear_cache(self):
         self.stream._caches = {1: "abc"}
+        self.stream._changed = {1}
         self.stream.clear_cache()
 
         assert self.stream._caches == {}
+        assert self.stream._changed == set()
 
     def test_clear_stale_cache(self):
         market_a = mock.Mock(market_id="1.23", publish_time=123, closed=False)
@@ -165,8 +177,10 @@ class BaseStreamTest(unittest.TestCase):
             "1.23": market_a,
             "4.56": market_b,
         }
+        self.stream._changed = {"1.23", "4.56"}
         self.stream.clear_stale_cache(123456789)
         self.assertEqual(self.stream._caches, {"1.23": market_a})
+        self.assertEqual(self.stream._changed, {"1.23"})
 
     def test_snap(self):
         market_books = self.stream.snap()
@@ -192,6 +206,24 @@ class BaseStreamTest(unittest.TestCase):
         market_books = self.stream.snap(["1.1"])
         assert market_books == []
 
+    def test_snap_changed_only(self):
+        mock_cache_one = mock.Mock(market_id="1.1")
+        mock_cache_two = mock.Mock(market_id="1.2")
+        self.stream._caches = {"1.1": mock_cache_one, "1.2": mock_cache_two}
+        self.assertEqual(self.stream.snap(changed_only=True), [])
+
+        self.stream.on_process([mock_cache_one, mock_cache_two])
+        self.assertEqual(
+            self.stream.snap(["1.1"], changed_only=True),
+            [mock_cache_one.create_resource()],
+        )
+        self.assertEqual(self.stream._changed, {"1.2"})
+        self.assertEqual(
+            self.stream.snap(changed_only=True), [mock_cache_two.create_resource()]
+        )
+        self.assertEqual(self.stream._changed, set())
+        self.assertEqual(self.stream.snap(changed_only=True), [])
+
     def test_snap_dict_size_err(self):
         mock_cache = mock.Mock()
         mock_cache.market_id = "1.1"
@@ -217,6 +249,16 @@ class BaseStreamTest(unittest.TestCase):
         self.stream.output_queue.put.assert_called_with(
             [mock_cache_one.create_resource(), mock_cache_two.create_resource()]
         )
+        self.assertEqual(
+            self.stream._changed, {mock_cache_one.market_id, mock_cache_two.market_id}
+        )
+
+    def test_on_process_batch(self):
+        mock_cache = mock.Mock()
+        self.stream._batch = [1]
+        self.stream.on_process([mock_cache])
+        self.stream.output_queue.put.assert_not_called()
+        self.assertEqual(self.stream._batch, [1, mock_cache.create_resource()])
 
     def test_update_clk(self):
         self.stream._update_clk({"initialClk": 1234})
@@ -27,15 +27,85 @@ class StreamingTest(unittest.TestCase):
             timeout=6,
             buffer_size=1024,
             host=None,
+            max_buffer_size=2**20,
+            batch=False,
         )
         assert response == mock_betfair_stream()
 
+    @mock.patch("betfairlightweight.endpoints.streaming.AsyncBetfairStream")
+    def test_create_async_stream(self, mock_async_stream):
+        mock_listener = mock.Mock()
+        response = self.streaming.create_async_stream(1, mock_listener, 6, 1024)
+
+        mock_async_stream.assert_called_with(
+            1,
+            mock_listener,
+            app_key=self.streaming.client.app_key,
+            session_token=self.streaming.client.session_token,
+            timeout=6,
+            limit=1024,
+            host=None,
+        )
+        assert response == mock_async_stream()
+
+    @mock.patch("betfairlightweight.endpoints.streaming.ShardedStream")
+    @mock.patch("betfairlightweight.endpoints.streaming.StreamListener")
+    @mock.patch("betfairlightweight.endpoints.streaming.BetfairStream")
+    def test_create_sharded_stream(
+        self, mock_betfair_stream, mock_stream_listener, mock_sharded_stream
+    ):
+        output_queue = mock.Mock()
+        response = self.streaming.create_sharded_stream(
+            3, output_queue, 10, listener_kwargs={"lightweight": True}
+        )
+
+        assert mock_betfair_stream.call_count == 3
+        mock_stream_listener.assert_called_with(
+            output_queue=output_queue, lightweight=True
+        )
+        mock_betfair_stream.assert_called_with(
+            10,
+            mock_stream_listener(),
+            app_key=self.streaming.client.app_key,
+            session_token=self.streaming.client.session_token,
+            timeout=64,
+            buffer_size=1024,
+            host=None,
+            max_buffer_size=2**20,
+            batch=False,
+        )
+        mock_sharded_stream.assert_called_with([mock_betfair_stream()] * 3)
+        assert response == mock_sharded_stream()
+
+        self.streaming.create_sharded_stream(2, max_buffer_size=2**22, batch=True)
+        mock_betfair_stream.assert_called_with(
+            0,
+            mock_stream_listener(),
+            app_key=self.streaming.client.app_key,
+            session_token=self.streaming.client.session_token,
+            timeout=64,
+            buffer_size=1024,
+            host=None,
+            max_buffer_size=2**22,
+            batch=True,
+        )
+
     @mock.patch("betfairlightweight.endpoints.streaming.HistoricalStream")
     def test_create_historical_stream(self, mock_stream):
         file_path = "test"
         listener = mock.Mock()
         self.streaming.create_historical_stream(file_path=file_path, listener=listener)
-        mock_stream.assert_called_with(file_path, listener, "marketSubscription", 0)
+        mock_stream.assert_called_with(
+            file_path,
+            listener,
+            "marketSubscription",
+            0,
+            threaded=False,
+            buffer_size=2**20,
+            market_ids=None,
+            start_publish_time=None,
+            end_publish_time=None,
+        )
 
     @mock.patch("betfairlightweight.endpoints.streaming.HistoricalGeneratorStream")
     def test_create_historical_generator_stream(self, mock_stream):
@@ -44,4 +114,16 @@ class StreamingTest(unittest.TestCase):
         self.streaming.create_historical_generator_stream(
             file_path=file_path, listener=listener
         )
-        mock_stream.assert_called_with(file_path, listener, "marketSubscription", 0)
+        mock_stream.assert_called_with(
+            file_path,
+            listener,
+            "marketSubscription",
+            0,
+            threaded=False,
+            buffer_size=2**20,
+            market_ids=None,
+            start_publish_time=None,
+            end_publish_time=None,
+            conflate_ms=None,
+            changed_only=False,
+        )
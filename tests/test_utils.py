@@ -18,6 +18,80 @@ class UtilsTest(unittest.TestCase):
         with self.assertRaises(StatusCodeError):
             utils.check_status_code(resp)
 
+    def test_calculate_market_book_weight(self):
+        assert utils.calculate_market_book_weight() == 2
+        assert utils.calculate_market_book_weight({"priceData": []}) == 2
+        assert (
+            utils.calculate_market_book_weight({"priceData": ["EX_BEST_OFFERS"]}) == 5
+        )
+        assert (
+            utils.calculate_market_book_weight(
+                {"priceData": ["EX_BEST_OFFERS", "EX_TRADED", "SP_AVAILABLE"]}
+            )
+            == 23
+        )
+        assert (
+            utils.calculate_market_book_weight(
+                {"priceData": ["EX_ALL_OFFERS", "EX_TRADED"]}
+            )
+            == 32
+        )
+        assert (
+            utils.calculate_market_book_weight(
+                {
+                    "priceData": ["EX_BEST_OFFERS", "EX_TRADED"],
+                    "exBestOffersOverrides": {"bestPricesDepth": 6},
+                }
+            )
+            == 25
+        )
+        # depth only scales the best offers weight
+        assert (
+            utils.calculate_market_book_weight(
+                {
+                    "priceData": ["EX_BEST_OFFERS"],
+                    "exBestOffersOverrides": {"bestPricesDepth": 6},
+                }
+            )
+            == 10
+        )
+        assert (
+            utils.calculate_market_book_weight(
+                {
+                    "priceData": ["EX_TRADED", "SP_AVAILABLE"],
+                    "exBestOffersOverrides": {"bestPricesDepth": 6},
+                }
+            )
+            == 20
+        )
+
+    def test_calculate_market_catalogue_weight(self):
+        assert utils.calculate_market_catalogue_weight() == 0
+        assert (
+            utils.calculate_market_catalogue_weight(
+                ["MARKET_DESCRIPTION", "RUNNER_METADATA", "EVENT"]
+            )
+            == 2
+        )
+
+    def test_chunk_market_ids(self):
+        market_ids = [str(i) for i in range(25)]
+        assert utils.chunk_market_ids(market_ids, 20) == [
+            market_ids[:10],
+            market_ids[10:20],
+            market_ids[20:],
+        ]
+        assert utils.chunk_market_ids(market_ids, 32) == [
+            market_ids[i : i + 6] for i in range(0, 25, 6)
+        ]
+        assert utils.chunk_market_ids(market_ids, 0) == [market_ids]
+        assert utils.chunk_market_ids(market_ids, 0, max_size=20) == [
+            market_ids[:20],
+            market_ids[20:],
+        ]
+        assert utils.chunk_market_ids(market_ids[:2], 500) == [["0"], ["1"]]
+        assert utils.chunk_market_ids([], 5) == []
+
     def test_clean_locals(self, params=None, filter=123):
         params = utils.clean_locals(locals())
         assert params == {"filter": 123}